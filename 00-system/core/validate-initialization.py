@@ -7,14 +7,25 @@ Nexus-v3 operation. Run this before using the system to catch issues early.
 
 Usage:
     python 00-system/core/validate-initialization.py
+    python 00-system/core/validate-initialization.py --no-cache   # Re-run every check
+    python 00-system/core/validate-initialization.py --watch      # Re-validate on changes
+
+Checks run concurrently. Each check's result is cached in
+00-system/core/.validation-cache.json, keyed by the mtimes of the files it
+reads; a check whose files are unchanged is served from the cache.
 
 Returns:
     0 if all critical checks pass
     1 if any critical checks fail
 """
 
+import io
+import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Use ASCII-safe symbols for Windows compatibility
@@ -22,20 +33,51 @@ CHECK = "[OK]"
 CROSS = "[X]"
 WARN = "[!]"
 
+CACHE_FILE = "00-system/core/.validation-cache.json"
+CACHE_VERSION = 1
+
+CORE_FILES = [
+    "CLAUDE.md",
+    "00-system/core/orchestrator.md",
+    "00-system/core/nexus-loader.py",
+    "00-system/system-map.md"
+]
+
+REQUIRED_FOLDERS = [
+    "00-system",
+    "00-system/core",
+    "00-system/skills",
+    "01-memory",
+    "02-projects",
+    "03-skills",
+    "04-workspace"
+]
+
+MEMORY_FILES = [
+    "01-memory/memory-map.md",
+    "01-memory/goals.md",
+    "02-projects/project-map.md",
+    "04-workspace/workspace-map.md"
+]
+
+LOADER_SCRIPT = "00-system/core/nexus-loader.py"
+CLAUDE_MD = "CLAUDE.md"
+
+SYSTEM_SKILLS = [
+    "00-system/skills/create-project",
+    "00-system/skills/create-skill",
+    "00-system/skills/close-session",
+    "00-system/skills/validate-system",
+    "00-system/skills/add-integration"
+]
+
 
 def check_core_files():
     """Verify core system files exist."""
     print("Checking: Core Files")
 
-    required_files = [
-        "CLAUDE.md",
-        "00-system/core/orchestrator.md",
-        "00-system/core/nexus-loader.py",
-        "00-system/system-map.md"
-    ]
-
     missing = []
-    for file_path in required_files:
+    for file_path in CORE_FILES:
         if not os.path.exists(file_path):
             missing.append(file_path)
         else:
@@ -55,18 +97,8 @@ def check_folder_structure():
     """Verify required folders exist."""
     print("\nChecking: Folder Structure")
 
-    required_folders = [
-        "00-system",
-        "00-system/core",
-        "00-system/skills",
-        "01-memory",
-        "02-projects",
-        "03-skills",
-        "04-workspace"
-    ]
-
     missing = []
-    for folder in required_folders:
+    for folder in REQUIRED_FOLDERS:
         if not os.path.isdir(folder):
             missing.append(folder)
         else:
@@ -86,17 +118,10 @@ def check_memory_files():
     """Verify memory system files (non-critical for templates)."""
     print("\nChecking: Memory Files")
 
-    memory_files = [
-        "01-memory/memory-map.md",
-        "01-memory/goals.md",
-        "02-projects/project-map.md",
-        "04-workspace/workspace-map.md"
-    ]
-
     missing = []
     present = []
 
-    for file_path in memory_files:
+    for file_path in MEMORY_FILES:
         if not os.path.exists(file_path):
             missing.append(file_path)
         else:
@@ -121,7 +146,7 @@ def check_loader_script():
     """Verify nexus-loader.py is valid Python."""
     print("\nChecking: Loader Script")
 
-    loader = "00-system/core/nexus-loader.py"
+    loader = LOADER_SCRIPT
 
     if not os.path.exists(loader):
         print(f"[X] Loader script missing: {loader}")
@@ -151,7 +176,7 @@ def check_path_references():
     """Verify CLAUDE.md references correct paths."""
     print("\nChecking: Path References")
 
-    claude_md = "CLAUDE.md"
+    claude_md = CLAUDE_MD
 
     if not os.path.exists(claude_md):
         print(f"[X] {claude_md} not found")
@@ -198,18 +223,10 @@ def check_system_skills():
     """Verify system skills exist."""
     print("\nChecking: System Skills")
 
-    system_skills = [
-        "00-system/skills/create-project",
-        "00-system/skills/create-skill",
-        "00-system/skills/close-session",
-        "00-system/skills/validate-system",
-        "00-system/skills/add-integration"
-    ]
-
     missing = []
     present = []
 
-    for skill_path in system_skills:
+    for skill_path in SYSTEM_SKILLS:
         skill_file = os.path.join(skill_path, "SKILL.md")
         if os.path.exists(skill_file):
             present.append(skill_path)
@@ -233,48 +250,135 @@ def check_system_skills():
         return False
 
 
-def main():
-    """Run all validation checks."""
-    print("Validating Nexus-v3 Initialization...")
-    print("=" * 60)
-    print()
+# Check registry: (name, function, paths whose mtimes key the cached result)
+CHECKS = [
+    ("Core Files", check_core_files, CORE_FILES),
+    ("Folder Structure", check_folder_structure, REQUIRED_FOLDERS),
+    ("System Skills", check_system_skills,
+     SYSTEM_SKILLS + [os.path.join(p, "SKILL.md") for p in SYSTEM_SKILLS]),
+    ("Path References", check_path_references, [CLAUDE_MD]),
+    ("Loader Script", check_loader_script, [LOADER_SCRIPT]),
+    ("Memory Files", check_memory_files, MEMORY_FILES)
+]
+
+CRITICAL_CHECKS = ["Core Files", "Folder Structure", "Path References", "Loader Script"]
+
+
+class _ThreadOutput(io.TextIOBase):
+    """stdout proxy that routes each worker thread's prints into its own buffer."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self):
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._fallback).write(text)
+
+    def flush(self):
+        self._fallback.flush()
+
+
+def check_cache_key(paths):
+    """
+    Fingerprint the paths a check reads: mtime_ns per file, "dir" for
+    directories (only their existence matters), None if missing.
+    """
+    key = {"__script__": os.stat(__file__).st_mtime_ns}
+    for path in paths:
+        try:
+            key[path] = "dir" if os.path.isdir(path) else os.stat(path).st_mtime_ns
+        except OSError:
+            key[path] = None
+    return key
+
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get("checks", {}) if cache.get("version") == CACHE_VERSION else {}
+
+
+def save_cache(entries):
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"version": CACHE_VERSION, "checks": entries}, f, indent=2)
+    except OSError:
+        pass
+
+
+def run_checks(cache=None, only=None):
+    """
+    Run checks concurrently, serving unchanged ones from the cache.
+
+    Args:
+        cache: Dict of previous results by check name (None disables caching)
+        only: Optional set of check names to run; others are omitted
 
-    checks = [
-        ("Core Files", check_core_files),
-        ("Folder Structure", check_folder_structure),
-        ("System Skills", check_system_skills),
-        ("Path References", check_path_references),
-        ("Loader Script", check_loader_script),
-        ("Memory Files", check_memory_files)
-    ]
+    Returns:
+        List of dicts (name, result, output, seconds, cached, key) in CHECKS order
+    """
+    proxy = _ThreadOutput(sys.stdout)
 
-    results = []
-    critical_checks = ["Core Files", "Folder Structure", "Path References", "Loader Script"]
+    def run_one(name, check_fn, paths):
+        key = check_cache_key(paths)
+        entry = (cache or {}).get(name)
+        if entry and entry.get("key") == key:
+            return dict(entry, name=name, cached=True)
 
-    for name, check_fn in checks:
+        buffer = proxy.capture()
+        start = time.perf_counter()
         try:
-            result = check_fn()
-            results.append((name, result))
+            result = bool(check_fn())
         except Exception as e:
             print(f"\n[X] Error in {name} check: {e}")
-            results.append((name, False))
-        print()
+            result = False
+        return {
+            "name": name,
+            "result": result,
+            "output": buffer.getvalue(),
+            "seconds": time.perf_counter() - start,
+            "cached": False,
+            "key": key,
+        }
+
+    selected = [c for c in CHECKS if only is None or c[0] in only]
+    original_stdout = sys.stdout
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(selected) or 1) as executor:
+            futures = [executor.submit(run_one, *check) for check in selected]
+            results = [future.result() for future in futures]
+    finally:
+        sys.stdout = original_stdout
+
+    return results
+
 
-    # Summary
+def print_summary(results):
+    """Print the summary table; returns the process exit code."""
     print("=" * 60)
     print("VALIDATION SUMMARY")
     print("=" * 60)
 
-    passed = sum(1 for _, result in results if result)
+    passed = sum(1 for r in results if r["result"])
     total = len(results)
 
-    critical_passed = sum(1 for name, result in results if result and name in critical_checks)
-    critical_total = len(critical_checks)
+    critical_passed = sum(1 for r in results if r["result"] and r["name"] in CRITICAL_CHECKS)
+    critical_total = len(CRITICAL_CHECKS)
 
-    for name, result in results:
-        status = "[OK] PASS" if result else "[X] FAIL"
-        critical = " (CRITICAL)" if name in critical_checks else ""
-        print(f"{status:12} {name}{critical}")
+    for r in results:
+        status = "[OK] PASS" if r["result"] else "[X] FAIL"
+        critical = " (CRITICAL)" if r["name"] in CRITICAL_CHECKS else ""
+        timing = f"{r['seconds'] * 1000:.1f}ms" + (" (cached)" if r["cached"] else "")
+        print(f"{status:12} {r['name'] + critical:32} {timing}")
 
     print()
     print(f"Critical Checks: {critical_passed}/{critical_total} passed")
@@ -301,5 +405,73 @@ def main():
         return 1
 
 
+def watch(results, interval):
+    """Poll check inputs and re-run only the checks whose files changed."""
+    by_name = {r["name"]: r for r in results}
+    print(f"[WATCH] Watching for changes every {interval}s (Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(interval)
+            changed = {
+                name for name, _, paths in CHECKS
+                if check_cache_key(paths) != by_name[name]["key"]
+            }
+            if not changed:
+                continue
+
+            print()
+            print(f"[WATCH] Change detected: {', '.join(sorted(changed))}")
+            for r in run_checks(cache=None, only=changed):
+                by_name[r["name"]] = r
+                print(r["output"])
+
+            results = [by_name[name] for name, _, _ in CHECKS]
+            save_cache({r["name"]: _cache_entry(r) for r in results})
+            print_summary(results)
+    except KeyboardInterrupt:
+        print("\n[WATCH] Stopped")
+
+    return 0
+
+
+def _cache_entry(result):
+    return {k: result[k] for k in ("result", "output", "seconds", "key")}
+
+
+def main():
+    """Run all validation checks."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate Nexus-v3 initialization")
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore cached results and re-run every check')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and re-validate only what changed')
+    parser.add_argument('--interval', type=float, default=2.0,
+                        help='Polling interval in seconds for --watch (default: 2)')
+    args = parser.parse_args()
+
+    print("Validating Nexus-v3 Initialization...")
+    print("=" * 60)
+    print()
+
+    cache = None if args.no_cache else load_cache()
+    results = run_checks(cache=cache)
+
+    for r in results:
+        print(r["output"])
+
+    save_cache({r["name"]: _cache_entry(r) for r in results})
+
+    exit_code = print_summary(results)
+
+    if args.watch:
+        print()
+        return watch(results, args.interval)
+
+    return exit_code
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -6,11 +6,23 @@ Scans all mental model files and outputs metadata for AI selection.
 Each model is a separate .md file with YAML frontmatter.
 
 Usage:
-    python select_mental_models.py [--category CATEGORY] [--format FORMAT]
+    python select_mental_models.py [--category CATEGORY] [--tag TAG] [--format FORMAT]
+    python select_mental_models.py --match "problem statement" [--top N]
 
 Arguments:
     --category  Filter by category (e.g., cognitive, diagnostic, strategic)
+    --tag       Filter by tag (frontmatter 'tags', or a 'when_to_use' entry)
     --format    Output format: 'full' (default), 'brief', 'list'
+    --match     Rank models against a free-text problem statement
+    --top       Number of ranked models to return with --match (default: 5)
+    --rebuild   Ignore the cached catalog and re-parse every model file
+
+Catalog cache:
+    Parsed metadata is persisted to 00-system/mental-models/.catalog-cache.json
+    together with per-category, per-tag and keyword indexes. Each run only
+    stats the model files; files whose mtime/size changed are re-parsed, all
+    others are served from the cache. Model paths are stored relative to the
+    repo root so the cache stays valid when the checkout moves.
 
 Output:
     JSON array with metadata for each model
@@ -18,11 +30,33 @@ Output:
 
 import yaml
 import re
+import os
 import json
+import math
 import argparse
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+CATALOG_VERSION = 2
+CATALOG_FILE = ".catalog-cache.json"
+
+# Words ignored when indexing/matching free text
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'do', 'for', 'from',
+    'how', 'i', 'in', 'is', 'it', 'my', 'of', 'on', 'or', 'our', 'should', 'so',
+    'that', 'the', 'this', 'to', 'we', 'what', 'when', 'which', 'with', 'you',
+}
+
+# Relative weight of each metadata field in keyword ranking
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'tags': 2.0,
+    'when_to_use': 2.0,
+    'best_for': 1.5,
+    'description': 1.0,
+}
+
 def extract_yaml_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
     """
     Extract YAML frontmatter from markdown file.
@@ -50,6 +84,231 @@ def extract_yaml_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
     except Exception as e:
         return {'error': str(e), '_file_path': str(file_path)}
 
+def build_model_entry(metadata: Dict[str, Any], root: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Normalize raw frontmatter into the catalog entry shape.
+
+    Args:
+        metadata: Frontmatter from extract_yaml_frontmatter
+        root: If given, 'file' is stored relative to it (POSIX separators)
+    """
+    file_path = metadata.get('_file_path', '')
+    if root and file_path:
+        file_path = Path(file_path).relative_to(root).as_posix()
+
+    entry = {
+        "name": metadata.get('name', ''),
+        "slug": metadata.get('slug', ''),
+        "category": metadata.get('category', metadata.get('_category_folder', '')),
+        "description": metadata.get('description', ''),
+        "when_to_use": metadata.get('when_to_use', []) or [],
+        "best_for": metadata.get('best_for', ''),
+        "file": file_path
+    }
+    if metadata.get('tags'):
+        entry['tags'] = metadata['tags']
+    return entry
+
+
+def index_tags(model: Dict[str, Any]) -> List[str]:
+    """Lowercased tags of a model for --tag lookups ('when_to_use' if it has no 'tags')."""
+    tags = model.get('tags') or model.get('when_to_use') or []
+    if isinstance(tags, str):
+        tags = [tags]
+    return sorted({str(t).strip().lower() for t in tags if str(t).strip()})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords dropped and plural 's' trimmed."""
+    tokens = []
+    for word in re.findall(r"[a-z0-9]+", text.lower()):
+        if word in STOPWORDS or len(word) < 2:
+            continue
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, list):
+        return ' '.join(str(v) for v in value)
+    return str(value or '')
+
+
+def build_indexes(models: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Precompute category, tag and keyword views over the catalog.
+
+    Args:
+        models: Catalog entries keyed by relative file path
+
+    Returns:
+        Dict with 'by_category', 'by_tag' and 'terms' (term -> {key: weight})
+    """
+    by_category: Dict[str, List[str]] = {}
+    by_tag: Dict[str, List[str]] = {}
+    terms: Dict[str, Dict[str, float]] = {}
+
+    ordered = sorted(models.items(), key=lambda kv: (kv[1].get('category', ''), kv[1].get('name', '')))
+    for key, model in ordered:
+        by_category.setdefault(model.get('category', 'other'), []).append(key)
+        for tag in index_tags(model):
+            by_tag.setdefault(tag, []).append(key)
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(_field_text(model.get(field))):
+                postings = terms.setdefault(token, {})
+                postings[key] = postings.get(key, 0.0) + weight
+
+    return {'by_category': by_category, 'by_tag': by_tag, 'terms': terms}
+
+
+def load_catalog(
+    models_dir: Path,
+    cache_path: Path,
+    rebuild: bool = False,
+    root: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Load the model catalog, re-parsing only files whose mtime/size changed.
+
+    Args:
+        models_dir: Directory containing models/{category}/*.md
+        cache_path: Location of the persisted catalog JSON
+        rebuild: If True, ignore any existing cache
+        root: Repo root; entry 'file' paths are stored relative to it
+
+    Returns:
+        Catalog dict with 'files', 'models' and 'indexes'
+    """
+    cached: Dict[str, Any] = {}
+    if not rebuild and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text(encoding='utf-8'))
+            if cached.get('version') != CATALOG_VERSION:
+                cached = {}
+        except (OSError, ValueError):
+            cached = {}
+
+    cached_files = cached.get('files', {})
+    cached_models = cached.get('models', {})
+
+    files: Dict[str, List[int]] = {}
+    models: Dict[str, Dict[str, Any]] = {}
+    changed = False
+
+    if models_dir.exists():
+        for model_file in models_dir.glob("**/*.md"):
+            key = model_file.relative_to(models_dir).as_posix()
+            stat = model_file.stat()
+            signature = [stat.st_mtime_ns, stat.st_size]
+            files[key] = signature
+
+            if cached_files.get(key) == signature and key in cached_models:
+                models[key] = cached_models[key]
+                continue
+
+            changed = True
+            metadata = extract_yaml_frontmatter(model_file)
+            if metadata and 'error' not in metadata:
+                models[key] = build_model_entry(metadata, root)
+
+    if not changed and set(files) == set(cached_files) and 'indexes' in cached:
+        return cached
+
+    catalog = {
+        'version': CATALOG_VERSION,
+        'files': files,
+        'models': models,
+        'indexes': build_indexes(models),
+    }
+    save_catalog(catalog, cache_path)
+    return catalog
+
+
+def save_catalog(catalog: Dict[str, Any], cache_path: Path) -> None:
+    """Persist the catalog atomically; a read-only checkout just skips caching."""
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(catalog, f, ensure_ascii=False)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        pass
+
+
+def select_from_catalog(
+    catalog: Dict[str, Any],
+    category_filter: Optional[str] = None,
+    tag_filter: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Return catalog entries (sorted by category, name) using the precomputed indexes."""
+    indexes = catalog['indexes']
+    models = catalog['models']
+
+    if category_filter:
+        keys = indexes['by_category'].get(category_filter, [])
+    else:
+        keys = [key for cat_keys in indexes['by_category'].values() for key in cat_keys]
+
+    if tag_filter:
+        tagged = set(indexes['by_tag'].get(tag_filter.strip().lower(), []))
+        keys = [key for key in keys if key in tagged]
+
+    return [models[key] for key in keys]
+
+
+def match_models(
+    catalog: Dict[str, Any],
+    query: str,
+    top_n: int = 5,
+    category_filter: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Rank models against a free-text problem statement.
+
+    Scores are the sum of field-weighted term hits, scaled by inverse document
+    frequency so generic words ("decision") count less than specific ones.
+
+    Returns:
+        Top-N brief entries with a 'score' field, best first
+    """
+    models = catalog['models']
+    terms = catalog['indexes']['terms']
+    total = max(len(models), 1)
+
+    scores: Dict[str, float] = {}
+    for token in set(tokenize(query)):
+        postings = terms.get(token)
+        if not postings:
+            continue
+        idf = math.log(1 + total / len(postings))
+        for key, weight in postings.items():
+            scores[key] = scores.get(key, 0.0) + weight * idf
+
+    if category_filter:
+        allowed = set(catalog['indexes']['by_category'].get(category_filter, []))
+        scores = {key: score for key, score in scores.items() if key in allowed}
+
+    ranked = sorted(scores.items(), key=lambda kv: (-kv[1], models[kv[0]].get('name', '')))
+    return [
+        {
+            "name": models[key].get('name'),
+            "slug": models[key].get('slug'),
+            "category": models[key].get('category'),
+            "description": models[key].get('description'),
+            "score": round(score, 2),
+            "file": models[key].get('file'),
+        }
+        for key, score in ranked[:top_n]
+    ]
+
+
+def with_absolute_files(models: List[Dict[str, Any]], root: Path) -> List[Dict[str, Any]]:
+    """Copies of catalog entries with 'file' resolved against the repo root."""
+    return [dict(m, file=str(root / m['file'])) if m.get('file') else m for m in models]
+
+
 def scan_mental_models(models_dir: Path, category_filter: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Scan all mental model files recursively and extract metadata.
@@ -71,15 +330,7 @@ def scan_mental_models(models_dir: Path, category_filter: Optional[str] = None)
                 if model_category != category_filter:
                     continue
 
-            models.append({
-                "name": metadata.get('name', ''),
-                "slug": metadata.get('slug', ''),
-                "category": metadata.get('category', metadata.get('_category_folder', '')),
-                "description": metadata.get('description', ''),
-                "when_to_use": metadata.get('when_to_use', []),
-                "best_for": metadata.get('best_for', ''),
-                "file": metadata.get('_file_path', '')
-            })
+            models.append(build_model_entry(metadata))
 
     # Sort by category, then by name
     models.sort(key=lambda x: (x.get('category', ''), x.get('name', '')))
@@ -118,6 +369,13 @@ def main():
     parser.add_argument('--format', type=str, default='full',
                         choices=['full', 'brief', 'list'],
                         help='Output format')
+    parser.add_argument('--tag', type=str, help='Filter by tag')
+    parser.add_argument('--match', type=str, metavar='PROBLEM',
+                        help='Rank models against a problem statement')
+    parser.add_argument('--top', type=int, default=5,
+                        help='Number of models returned by --match (default: 5)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Ignore the cached catalog and re-parse all model files')
     args = parser.parse_args()
 
     # Auto-detect base path
@@ -128,8 +386,16 @@ def main():
     # Models directory - individual files organized by category
     models_dir = base_path / "00-system" / "mental-models" / "models"
 
-    # Scan all models
-    all_models = scan_mental_models(models_dir, args.category)
+    # Load catalog (re-parses only changed model files)
+    cache_path = base_path / "00-system" / "mental-models" / CATALOG_FILE
+    catalog = load_catalog(models_dir, cache_path, rebuild=args.rebuild, root=base_path)
+
+    if args.match:
+        ranked = match_models(catalog, args.match, args.top, args.category)
+        print(json.dumps(with_absolute_files(ranked, base_path), indent=2, ensure_ascii=False))
+        return
+
+    all_models = with_absolute_files(select_from_catalog(catalog, args.category, args.tag), base_path)
 
     # Output formatted JSON
     print(format_output(all_models, args.format))
@@ -6,7 +6,17 @@ Shared client for Beam API authentication and requests.
 Used by all Beam API scripts.
 """
 
+import contextlib
+import email.utils
+import functools
+import hashlib
+import json
 import os
+import random
+import re
+import sys
+import tempfile
+import threading
 import time
 from pathlib import Path
 
@@ -14,20 +24,233 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent.parent.parent
 ENV_FILE = PROJECT_ROOT / ".env"
-BASE_URL = "https://api.beamstudio.ai"
+DEFAULT_BASE_URL = "https://api.beamstudio.ai"
+BASE_URL = os.getenv('BEAM_API_BASE_URL') or DEFAULT_BASE_URL  # Override for the local mock API
+
+# Cross-process token cache (shared by every script run from this project)
+TOKEN_CACHE_FILE = PROJECT_ROOT / ".beam-token-cache.json"
+TOKEN_LOCK_FILE = PROJECT_ROOT / ".beam-token-cache.lock"
+TOKEN_LIFETIME = 3500        # ~58 minutes (tokens expire after 1 hour)
+TOKEN_REFRESH_MARGIN = 300   # Refresh when less than 5 minutes remain
+
+# Request middleware tuning
+REQUEST_TIMEOUT = 60
+MAX_RETRIES = 3                  # Extra attempts for idempotent requests
+RETRY_BACKOFF_BASE = 0.5         # Seconds; doubled per attempt, full jitter
+RETRY_BACKOFF_CAP = 30
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # Seconds; last bucket is +Inf
+
+_ID_SEGMENT = re.compile(r'^(?:[0-9a-fA-F-]{16,}|\d+)$')
+
+# Connection pooling and rate limiting are shared with the 03-skills Beam client
+# (03-skills/_shared/beam_http.py)
+SHARED_PARENT = PROJECT_ROOT / "03-skills"
+if str(SHARED_PARENT) not in sys.path:
+    sys.path.insert(0, str(SHARED_PARENT))
+
+from _shared.beam_http import POOL_MAXSIZE, RateLimiter, connection_stats, create_session  # noqa: E402
+from _shared.beam_lock import file_lock  # noqa: E402
+
+
+@contextlib.contextmanager
+def token_cache_lock():
+    """
+    Hold an exclusive cross-process lock on the token cache.
+
+    Serialises auth/refresh across concurrently running scripts so only one
+    of them talks to /auth while the others wait and then read its tokens.
+    """
+    with file_lock(TOKEN_LOCK_FILE):
+        yield
+
+
+def token_cache_key(api_key, workspace_id):
+    """Cache key: API key hash + workspace (the key itself is never stored)"""
+    digest = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:32]
+    return f"{digest}:{workspace_id}"
+
+
+def load_token_cache():
+    """Load all cached token entries (empty dict if missing or corrupt)"""
+    try:
+        with open(TOKEN_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_token_cache(entries):
+    """Write token entries atomically with 0600 permissions"""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=str(TOKEN_CACHE_FILE.parent), prefix=".beam-token-", suffix=".tmp"
+    )
+    try:
+        os.chmod(tmp_path, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, TOKEN_CACHE_FILE)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def endpoint_label(method, endpoint):
+    """Histogram label with ID-like path segments collapsed, e.g. 'GET /agent/{id}'"""
+    path = endpoint.split('?', 1)[0]
+    parts = ['{id}' if _ID_SEGMENT.match(part) else part for part in path.split('/')]
+    return f"{method} {'/'.join(parts)}"
+
+
+def retry_after_seconds(response):
+    """Parse a Retry-After header (delta-seconds or HTTP date); None if absent"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+def latency_middleware(client, call, send):
+    """Record per-endpoint latency for every HTTP round trip"""
+    start = time.perf_counter()
+    try:
+        return send(call)
+    finally:
+        client._record_latency(call['label'], time.perf_counter() - start)
+
+
+def auth_replay_middleware(client, call, send):
+    """On 401, re-authenticate and replay the original request once"""
+    response = send(call)
+    if response.status_code == 401:
+        response.close()
+        client._ensure_token(force_auth=True)
+        response = send(call)
+    return response
+
+
+def retry_middleware(client, call, send):
+    """Retry idempotent requests on 429/5xx and connection errors with jittered backoff"""
+    import requests
+
+    if call['method'] not in IDEMPOTENT_METHODS:
+        return send(call)
+
+    for attempt in range(client.max_retries + 1):
+        last = attempt == client.max_retries
+        try:
+            response = send(call)
+        except (requests.ConnectionError, requests.Timeout):
+            if last:
+                raise
+            delay = None
+        else:
+            if response.status_code not in RETRY_STATUSES or last:
+                return response
+            delay = retry_after_seconds(response)
+            response.close()
+
+        if delay is None:
+            delay = random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * (2 ** attempt)))
+        client.retries += 1
+        time.sleep(min(delay, RETRY_BACKOFF_CAP))
+
+
+# Outermost first: retries wrap the auth replay, which wraps each timed round trip
+DEFAULT_MIDDLEWARE = (retry_middleware, auth_replay_middleware, latency_middleware)
 
 
 class BeamClient:
     """Beam API client with automatic token management"""
 
-    def __init__(self):
+    def __init__(self, pool_maxsize=POOL_MAXSIZE, token_cache=None,
+                 middleware=DEFAULT_MIDDLEWARE, max_retries=MAX_RETRIES):
+        if token_cache is None:
+            token_cache = os.getenv('BEAM_TOKEN_CACHE', '1') != '0'
+        self.token_cache = token_cache
         self.api_key = None
         self.workspace_id = None
         self.access_token = None
         self.refresh_token = None
         self.token_expiry = 0
+        self._pool_maxsize = pool_maxsize
+        self._session = None
+        self.middleware = list(middleware)
+        self.max_retries = max_retries
+        self.retries = 0
+        self._latency = {}
+        self._latency_lock = threading.Lock()
         self._load_config()
 
+    @property
+    def session(self):
+        """Pooled keep-alive session (created on first use)"""
+        if self._session is None:
+            self._session = create_session(self._pool_maxsize)
+        return self._session
+
+    def connection_stats(self):
+        """Connection reuse counters: requests, connections_opened, connections_reused"""
+        return connection_stats(self._session, BASE_URL)
+
+    def _record_latency(self, label, seconds):
+        with self._latency_lock:
+            stats = self._latency.get(label)
+            if stats is None:
+                stats = {"count": 0, "total": 0.0, "max": 0.0,
+                         "buckets": [0] * (len(LATENCY_BUCKETS) + 1)}
+                self._latency[label] = stats
+            stats["count"] += 1
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats["buckets"][i] += 1
+                    break
+            else:
+                stats["buckets"][-1] += 1
+
+    def latency_stats(self):
+        """
+        Per-endpoint latency histograms.
+
+        Returns:
+            Dict of 'METHOD /path' -> {count, avg, max, buckets}, where buckets
+            maps each upper bound in seconds ('+Inf' for the overflow) to a count
+        """
+        labels = [str(b) for b in LATENCY_BUCKETS] + ['+Inf']
+        with self._latency_lock:
+            return {
+                label: {
+                    "count": stats["count"],
+                    "avg": stats["total"] / stats["count"],
+                    "max": stats["max"],
+                    "buckets": dict(zip(labels, stats["buckets"]))
+                }
+                for label, stats in sorted(self._latency.items())
+            }
+
+    def close(self):
+        """Close pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def _load_config(self):
         """Load configuration from .env"""
         env_vars = {}
@@ -49,9 +272,7 @@ class BeamClient:
 
     def _authenticate(self):
         """Get access token from API key"""
-        import requests
-
-        response = requests.post(
+        response = self.session.post(
             f"{BASE_URL}/auth/access-token",
             json={"apiKey": self.api_key},
             timeout=30
@@ -63,13 +284,11 @@ class BeamClient:
         tokens = response.json()
         self.access_token = tokens['idToken']
         self.refresh_token = tokens['refreshToken']
-        self.token_expiry = time.time() + 3500  # ~58 minutes
+        self.token_expiry = time.time() + TOKEN_LIFETIME
 
     def _refresh_access_token(self):
         """Refresh access token"""
-        import requests
-
-        response = requests.post(
+        response = self.session.post(
             f"{BASE_URL}/auth/refresh-token",
             json={"refreshToken": self.refresh_token},
             timeout=30
@@ -83,15 +302,61 @@ class BeamClient:
         tokens = response.json()
         self.access_token = tokens['idToken']
         self.refresh_token = tokens['refreshToken']
-        self.token_expiry = time.time() + 3500
+        self.token_expiry = time.time() + TOKEN_LIFETIME
 
-    def _ensure_token(self):
-        """Ensure we have a valid access token"""
-        if time.time() > self.token_expiry:
-            if self.refresh_token:
-                self._refresh_access_token()
-            else:
-                self._authenticate()
+    def _token_is_fresh(self, expiry):
+        return time.time() < expiry - TOKEN_REFRESH_MARGIN
+
+    def _obtain_token(self, force_auth=False):
+        """Refresh (or authenticate) and set in-memory token state"""
+        if self.refresh_token and not force_auth:
+            self._refresh_access_token()
+        else:
+            self._authenticate()
+
+    def _sync_token(self, force_auth=False):
+        """
+        Reuse, refresh or fetch tokens through the on-disk cache.
+
+        Under the cache lock: adopt a fresh entry written by another process,
+        otherwise refresh/authenticate and persist the new tokens.
+
+        Args:
+            force_auth: Ignore cached and in-memory tokens and re-authenticate
+        """
+        key = token_cache_key(self.api_key, self.workspace_id)
+        if BASE_URL != DEFAULT_BASE_URL:
+            key = f"{key}@{BASE_URL}"  # Never mix tokens from another server into the live entry
+        with token_cache_lock():
+            entries = load_token_cache()
+            entry = entries.get(key)
+            if entry and not force_auth:
+                if entry.get('idToken') != self.access_token and self._token_is_fresh(entry.get('expiry', 0)):
+                    self.access_token = entry['idToken']
+                    self.refresh_token = entry.get('refreshToken')
+                    self.token_expiry = entry['expiry']
+                    return
+                if not self.refresh_token:
+                    self.refresh_token = entry.get('refreshToken')
+
+            self._obtain_token(force_auth=force_auth)
+            entries = load_token_cache()
+            entries[key] = {
+                "idToken": self.access_token,
+                "refreshToken": self.refresh_token,
+                "expiry": self.token_expiry,
+                "updated": time.time()
+            }
+            save_token_cache(entries)
+
+    def _ensure_token(self, force_auth=False):
+        """Ensure we have a valid access token, refreshing before it expires"""
+        if not force_auth and self._token_is_fresh(self.token_expiry):
+            return
+        if self.token_cache:
+            self._sync_token(force_auth=force_auth)
+        else:
+            self._obtain_token(force_auth=force_auth)
 
     def get_headers(self):
         """Get headers for API request"""
@@ -102,44 +367,66 @@ class BeamClient:
             'Content-Type': 'application/json'
         }
 
+    def _dispatch(self, call):
+        """Innermost handler: send one HTTP request with current auth headers"""
+        headers = self.get_headers()
+        if call['headers']:
+            headers.update(call['headers'])
+        return self.session.request(
+            call['method'],
+            f"{BASE_URL}{call['endpoint']}",
+            headers=headers,
+            params=call['params'],
+            json=call['json'],
+            stream=call['stream'],
+            timeout=call['timeout'] or REQUEST_TIMEOUT
+        )
+
+    def request(self, method, endpoint, params=None, data=None, headers=None, stream=False, timeout=None):
+        """
+        Send a request through the middleware pipeline.
+
+        Args:
+            method: HTTP method
+            endpoint: API path, e.g. '/agent-tasks'
+            params: Query parameters
+            data: JSON body
+            headers: Extra headers (e.g. If-None-Match, Range), merged over the auth headers
+            stream: Leave the body unread (for large downloads)
+            timeout: Seconds, or a (connect, read) tuple (default: REQUEST_TIMEOUT)
+
+        Returns:
+            Raw requests.Response (use get/post/patch for parsed JSON)
+        """
+        method = method.upper()
+        call = {
+            "method": method,
+            "endpoint": endpoint,
+            "params": params,
+            "json": data,
+            "headers": headers,
+            "stream": stream,
+            "timeout": timeout,
+            "label": endpoint_label(method, endpoint)
+        }
+
+        handler = self._dispatch
+        for middleware in reversed(self.middleware):
+            handler = functools.partial(middleware, self, send=handler)
+
+        return handler(call)
+
     def get(self, endpoint, params=None):
         """Make GET request"""
-        import requests
-
-        url = f"{BASE_URL}{endpoint}"
-        response = requests.get(
-            url,
-            headers=self.get_headers(),
-            params=params,
-            timeout=60
-        )
-        return self._handle_response(response)
+        return self._handle_response(self.request("GET", endpoint, params=params))
 
     def post(self, endpoint, data=None):
         """Make POST request"""
-        import requests
-
-        url = f"{BASE_URL}{endpoint}"
-        response = requests.post(
-            url,
-            headers=self.get_headers(),
-            json=data,
-            timeout=60
-        )
-        return self._handle_response(response)
+        return self._handle_response(self.request("POST", endpoint, data=data))
 
     def patch(self, endpoint, data=None):
         """Make PATCH request"""
-        import requests
-
-        url = f"{BASE_URL}{endpoint}"
-        response = requests.patch(
-            url,
-            headers=self.get_headers(),
-            json=data,
-            timeout=60
-        )
-        return self._handle_response(response)
+        return self._handle_response(self.request("PATCH", endpoint, data=data))
 
     def _handle_response(self, response):
         """Handle API response"""
@@ -149,9 +436,7 @@ class BeamClient:
             except:
                 return {"status": "success"}
         elif response.status_code == 401:
-            # Token expired, retry once
-            self._authenticate()
-            raise Exception("Token expired - please retry")
+            raise Exception(f"Unauthorized after token refresh: {response.text}")
         else:
             raise Exception(f"API error: {response.status_code} - {response.text}")
 
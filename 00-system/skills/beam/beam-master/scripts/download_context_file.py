@@ -4,56 +4,334 @@ Download Context File
 
 GET /agent/{agentId}/context/file/{fileId}/download
 
+Streams to a .part file next to the destination and renames it into place
+once the size matches Content-Length. An interrupted download resumes from
+the .part file with an HTTP Range request.
+
 Usage:
     python download_context_file.py --agent-id AGENT --file-id FILE
     python download_context_file.py --agent-id AGENT --file-id FILE --output output.pdf
+    python download_context_file.py --agent-id AGENT --file-id F1 --file-id F2 --output-dir files/
+    python download_context_file.py --agent-id AGENT --all --output-dir files/ --workers 4
 """
 
+import os
+import re
 import sys
 import json
+import time
 import argparse
-from beam_client import get_client, BASE_URL
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import unquote
+from beam_client import BeamClient, POOL_MAXSIZE
+
+
+CHUNK_SIZE = 256 * 1024      # Bytes per read; a dropped connection loses at most one chunk
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 120           # Seconds without a byte before giving up (then resume)
+DOWNLOAD_WORKERS = 4         # Concurrent downloads in batch mode
+DOWNLOAD_RETRIES = 3         # Resume attempts after a dropped connection
+
+
+class IncompleteDownload(Exception):
+    """Body ended before Content-Length bytes arrived (the .part file is kept)"""
+
+
+def filename_from_headers(headers, fallback):
+    """Filename from Content-Disposition (RFC 5987 filename* first), reduced to a safe basename"""
+    disposition = headers.get('Content-Disposition', '')
+    match = re.search(r"filename\*\s*=\s*[^']*'[^']*'([^;]+)", disposition)
+    if match:
+        name = unquote(match.group(1).strip().strip('"'))
+    else:
+        match = re.search(r'filename\s*=\s*"?([^";]+)"?', disposition)
+        name = match.group(1).strip() if match else ''
+    name = os.path.basename(name.replace('\\', '/'))
+    return name if name and name not in ('.', '..') else fallback
+
+
+def parse_content_range(value):
+    """(start, total) from 'bytes start-end/total' or 'bytes */total'; None values if absent"""
+    match = re.match(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)', value or '')
+    if not match:
+        return None, None
+    start = int(match.group(1)) if match.group(1) else None
+    total = int(match.group(2)) if match.group(2) != '*' else None
+    return start, total
+
+
+class OutputPaths:
+    """
+    Final download paths claimed during one run.
+
+    Names come from the agent record or, only once a response arrives, from
+    Content-Disposition, so concurrent downloads claim their path here under
+    a lock before renaming; a name another file already holds gets a
+    ``-<file_id>`` suffix instead of silently overwriting it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._owners = {}   # lower-cased path -> file ID
+        self._paths = {}    # file ID -> claimed path
+
+    def reserve(self, path, file_id):
+        """Claim ``path`` for ``file_id`` (or a suffixed variant); stable across retries"""
+        path = Path(path)
+        with self._lock:
+            if file_id in self._paths:
+                return self._paths[file_id]
+            stem, suffix = os.path.splitext(path.name)
+            candidates = [path, path.with_name(f"{stem}-{file_id[:8]}{suffix}"),
+                          path.with_name(f"{stem}-{file_id}{suffix}")]
+            for candidate in candidates:
+                if str(candidate).lower() not in self._owners:
+                    break
+            self._owners[str(candidate).lower()] = file_id
+            self._paths[file_id] = candidate
+            return candidate
+
+
+def load_part_meta(meta_path):
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def download_file(client, agent_id, file_id, output=None, output_dir='.', resume=True,
+                  chunk_size=CHUNK_SIZE, paths=None):
+    """
+    Stream one context file to disk.
+
+    Bytes go to ``<dir>/.<file_id>.part``; ETag/Last-Modified of the first
+    response are kept in ``.<file_id>.part.json`` and sent as If-Range when
+    resuming, so a file that changed on the server is downloaded again from
+    the start. The part file is renamed to the destination only after its
+    size matches Content-Length.
+
+    Args:
+        client: BeamClient instance
+        agent_id: Agent ID
+        file_id: Context file ID
+        output: Destination path (default: name from Content-Disposition)
+        output_dir: Directory for the part file and default destination
+        resume: Continue an existing .part file with a Range request
+        chunk_size: Bytes per write
+        paths: OutputPaths shared by a batch (claims the default destination)
+
+    Returns:
+        Dict with file_id, file, size, resumed_from and seconds
+
+    Raises:
+        IncompleteDownload: the connection ended early (call again to resume)
+    """
+    started = time.perf_counter()
+    directory = Path(output).parent if output else Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    part_path = directory / f".{file_id}.part"
+    meta_path = directory / f".{file_id}.part.json"
+
+    offset = part_path.stat().st_size if resume and part_path.exists() else 0
+    meta = load_part_meta(meta_path) if offset else {}
+
+    headers = {'Accept-Encoding': 'identity'}  # Byte ranges and Content-Length must refer to the stored bytes
+    if offset:
+        headers['Range'] = f"bytes={offset}-"
+        validator = meta.get('etag') or meta.get('last_modified')
+        if validator:
+            headers['If-Range'] = validator
+    response = client.request('GET', f'/agent/{agent_id}/context/file/{file_id}/download', headers=headers,
+                              stream=True, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+
+    with response:
+        if response.status_code == 416:
+            # Nothing left to send: the part file is already complete, or stale
+            _, total = parse_content_range(response.headers.get('Content-Range'))
+            if total is None or total != offset:
+                part_path.unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                return download_file(client, agent_id, file_id, output, output_dir, resume=False,
+                                     chunk_size=chunk_size, paths=paths)
+            expected = total
+            name = meta.get('filename') or f"{file_id}.bin"
+            resumed_from = offset
+        elif response.status_code in (200, 206):
+            start, total = parse_content_range(response.headers.get('Content-Range'))
+            if response.status_code == 206 and start != offset:
+                raise Exception(f"Server resumed at byte {start}, expected {offset}")
+            if response.status_code == 200:
+                offset = 0  # Range ignored or file changed (If-Range): start over
+            length = response.headers.get('Content-Length')
+            expected = total if total is not None else (offset + int(length) if length else None)
+            name = filename_from_headers(response.headers, meta.get('filename') or f"{file_id}.bin")
+
+            if offset == 0:
+                meta = {
+                    "filename": name,
+                    "etag": response.headers.get('ETag'),
+                    "last_modified": response.headers.get('Last-Modified')
+                }
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f)
+
+            resumed_from = offset
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    offset += len(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            raise Exception(f"Download failed: {response.status_code} - {response.text[:200]}")
+
+    if expected is not None and offset != expected:
+        raise IncompleteDownload(f"{file_id}: got {offset} of {expected} bytes (partial kept for resume)")
+
+    if output:
+        output_path = Path(output)
+    elif paths is not None:
+        output_path = paths.reserve(directory / name, file_id)
+    else:
+        output_path = directory / name
+    os.replace(part_path, output_path)
+    meta_path.unlink(missing_ok=True)
+    return {
+        "file_id": file_id,
+        "file": str(output_path),
+        "size": offset,
+        "resumed_from": resumed_from,
+        "seconds": round(time.perf_counter() - started, 2)
+    }
+
+
+def download_with_retries(client, agent_id, file_id, output=None, output_dir='.', resume=True,
+                          retries=DOWNLOAD_RETRIES, paths=None):
+    """Download, resuming from the part file after dropped connections or short bodies"""
+    import requests
+
+    for attempt in range(retries + 1):
+        try:
+            return download_file(client, agent_id, file_id, output, output_dir, resume=resume or attempt > 0,
+                                 paths=paths)
+        except (IncompleteDownload, requests.ConnectionError, requests.Timeout,
+                requests.exceptions.ChunkedEncodingError) as e:
+            if attempt == retries:
+                raise
+            print(f"[INFO] {file_id[:8]}: {' '.join(str(e).split())[:100]}; resuming", file=sys.stderr)
+            time.sleep(min(30, 2 ** attempt))
+
+
+def find_context_files(agent):
+    """
+    Context file entries ({id, name}) in an agent record.
+
+    Scans every list under a key containing 'file' (e.g. contextFiles) for
+    objects with an 'id'.
+    """
+    found = {}
+
+    def walk(value, key=''):
+        if isinstance(value, dict):
+            for child_key, child in value.items():
+                walk(child, child_key)
+        elif isinstance(value, list):
+            for item in value:
+                if 'file' in key.lower() and isinstance(item, dict) and item.get('id'):
+                    name = item.get('name') or item.get('fileName') or item.get('filename') or item.get('originalName')
+                    found.setdefault(item['id'], {"id": item['id'], "name": name})
+                walk(item, key)
+
+    walk(agent)
+    return list(found.values())
 
 
 def main():
     parser = argparse.ArgumentParser(description='Download agent context file')
     parser.add_argument('--agent-id', required=True, help='Agent ID')
-    parser.add_argument('--file-id', required=True, help='File ID')
-    parser.add_argument('--output', help='Output file path')
+    parser.add_argument('--file-id', action='append', help='File ID (repeat for several)')
+    parser.add_argument('--all', action='store_true', help="Download every context file listed on the agent")
+    parser.add_argument('--output', help='Output file path (single file)')
+    parser.add_argument('--output-dir', default='.', help='Directory for downloads (default: current)')
+    parser.add_argument('--workers', type=int, default=DOWNLOAD_WORKERS,
+                        help=f'Concurrent downloads (default: {DOWNLOAD_WORKERS})')
+    parser.add_argument('--retries', type=int, default=DOWNLOAD_RETRIES,
+                        help=f'Resume attempts per file (default: {DOWNLOAD_RETRIES})')
+    parser.add_argument('--no-resume', action='store_true', help='Ignore partial downloads and start over')
     parser.add_argument('--json', action='store_true', help='Output metadata as JSON')
     args = parser.parse_args()
 
+    if not args.file_id and not args.all:
+        parser.error('--file-id or --all is required')
+
     try:
-        import requests
-        client = get_client()
-        headers = client.get_headers()
+        client = BeamClient(pool_maxsize=max(POOL_MAXSIZE, args.workers))
 
-        url = f"{BASE_URL}/agent/{args.agent_id}/context/file/{args.file_id}/download"
-        response = requests.get(url, headers=headers, timeout=120)
+        file_ids = list(dict.fromkeys(args.file_id or []))
+        names = {}
+        if args.all:
+            files = find_context_files(client.get(f'/agent/{args.agent_id}'))
+            if not files and not file_ids:
+                raise Exception("No context files found on the agent record")
+            file_ids.extend(f['id'] for f in files if f['id'] not in file_ids)
+            names = {f['id']: f['name'] for f in files if f['name']}
 
-        if response.status_code != 200:
-            raise Exception(f"Download failed: {response.status_code}")
+        if args.output and len(file_ids) > 1:
+            parser.error('--output needs a single file; use --output-dir')
 
-        # Get filename from headers or use default
-        content_disp = response.headers.get('Content-Disposition', '')
-        if 'filename=' in content_disp:
-            filename = content_disp.split('filename=')[1].strip('"')
-        else:
-            filename = f"{args.file_id}.bin"
+        if len(file_ids) == 1:
+            result = download_with_retries(client, args.agent_id, file_ids[0], args.output,
+                                           args.output_dir, not args.no_resume, args.retries)
+            if args.json:
+                print(json.dumps({"status": "success", **result}, indent=2))
+            else:
+                resumed = f", resumed at {result['resumed_from']}" if result['resumed_from'] else ''
+                print(f"Downloaded: {result['file']} ({result['size']} bytes{resumed})")
+            return
 
-        output_path = args.output or filename
+        # Names known from the agent record are claimed up front; the rest claim theirs from
+        # Content-Disposition as they finish, so two files never share a path
+        paths = OutputPaths()
+        outputs = {}
+        for file_id in file_ids:
+            name = filename_from_headers({'Content-Disposition': f'filename="{names[file_id]}"'}, '') \
+                if file_id in names else ''
+            if name:
+                outputs[file_id] = str(paths.reserve(Path(args.output_dir) / name, file_id))
 
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        results, failed = {}, {}
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+            futures = {
+                pool.submit(download_with_retries, client, args.agent_id, file_id, outputs.get(file_id),
+                            args.output_dir, not args.no_resume, args.retries, paths): file_id
+                for file_id in file_ids
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                file_id = futures[future]
+                try:
+                    results[file_id] = future.result()
+                    if not args.json:
+                        print(f"[{done}/{len(file_ids)}] OK {results[file_id]['file']} "
+                              f"({results[file_id]['size']} bytes)")
+                except Exception as e:
+                    failed[file_id] = str(e)
+                    if not args.json:
+                        print(f"[{done}/{len(file_ids)}] FAIL {file_id}: {e}", file=sys.stderr)
 
         if args.json:
             print(json.dumps({
-                "status": "success",
-                "file": output_path,
-                "size": len(response.content)
+                "status": "success" if not failed else "partial",
+                "files": [results[f] for f in file_ids if f in results],
+                "failed": [{"file_id": f, "error": failed[f]} for f in file_ids if f in failed]
             }, indent=2))
         else:
-            print(f"Downloaded: {output_path} ({len(response.content)} bytes)")
+            total = sum(r['size'] for r in results.values())
+            print(f"\n{len(results)}/{len(file_ids)} files downloaded ({total} bytes) to {args.output_dir}")
+        if failed:
+            sys.exit(1)
 
     except Exception as e:
         if args.json:
@@ -8,6 +8,10 @@ Usage:
     python get_agent_graph.py --agent-id AGENT_ID
     python get_agent_graph.py --agent-id AGENT_ID --json
     python get_agent_graph.py --agent-id AGENT_ID --graph-id GRAPH_ID
+    python get_agent_graph.py --agent-id AGENT_ID --refresh
+
+Responses go through the shared graph cache (03-skills/_shared/beam_graph_cache.py);
+compare cached versions with 03-skills/get-beam-agent-graph/scripts/graph_cache.py graph-diff.
 """
 
 import sys
@@ -15,12 +19,18 @@ import json
 import argparse
 from beam_client import get_client
 
+try:
+    from _shared.beam_graph_cache import GraphCache  # 03-skills/_shared, put on sys.path by beam_client
+except ImportError:
+    GraphCache = None  # Cache unavailable: always fetch
+
 
 def main():
     parser = argparse.ArgumentParser(description='Get agent workflow graph')
     parser.add_argument('--agent-id', required=True, help='Agent ID')
     parser.add_argument('--graph-id', help='Specific graph version ID')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--refresh', action='store_true', help='Bypass the local graph cache')
     args = parser.parse_args()
 
     try:
@@ -30,7 +40,13 @@ def main():
         if args.graph_id:
             params['graphId'] = args.graph_id
 
-        result = client.get(f'/agent-graphs/{args.agent_id}', params=params)
+        def fetch():
+            return client.get(f'/agent-graphs/{args.agent_id}', params=params)
+
+        if GraphCache:
+            result = GraphCache().fetch(args.agent_id, fetch, graph_id=args.graph_id, refresh=args.refresh)
+        else:
+            result = fetch()
 
         if args.json:
             print(json.dumps(result, indent=2))
@@ -7,6 +7,7 @@ GET /agent-tasks/latest-executions - Get recent task executions.
 Usage:
     python get_latest_executions.py
     python get_latest_executions.py --agent-id AGENT
+    python get_latest_executions.py --agent-id AGENT --watch
 """
 
 import sys
@@ -20,8 +21,15 @@ def main():
     parser.add_argument('--agent-id', help='Filter by agent ID')
     parser.add_argument('--limit', type=int, default=10, help='Number of results')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep polling, printing new executions and status changes as NDJSON (see watch_status.py)')
+    parser.add_argument('--timeout', type=int, help='With --watch: stop after N seconds')
     args = parser.parse_args()
 
+    if args.watch:
+        from watch_status import ExecutionsTarget, watch
+        sys.exit(watch([ExecutionsTarget(args.agent_id, args.limit)], timeout=args.timeout))
+
     try:
         client = get_client()
 
@@ -7,12 +7,220 @@ GET /agent-graphs/agent-task-nodes/{toolFunctionName}
 Usage:
     python get_nodes_by_tool.py --tool send_email
     python get_nodes_by_tool.py --tool send_email --agent-id AGENT
+    python get_nodes_by_tool.py --tool send_email --rated --all --output nodes.ndjson --checkpoint nodes.ckpt
+    python get_nodes_by_tool.py --tool send_email --rated --all --output nodes.csv --workers 4
 """
 
+import os
 import sys
+import csv
 import json
+import hashlib
 import argparse
-from beam_client import get_client
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from beam_client import BeamClient, RateLimiter, get_client
+
+
+EXPORT_WORKERS = 4    # Concurrent page requests in --all mode
+EXPORT_RATE = 5.0     # Page requests per second across workers
+NODE_ID_KEYS = ('id', 'agentTaskNodeId', 'nodeId')
+
+
+def node_key(node):
+    """Node ID used for de-duplication (content hash if the node has no ID)"""
+    for key in NODE_ID_KEYS:
+        if node.get(key):
+            return str(node[key])
+    return 'sha256:' + hashlib.sha256(json.dumps(node, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def csv_row(node, fields):
+    """Flatten a node for CSV: nested values become JSON strings"""
+    row = {}
+    for field in fields:
+        value = node.get(field)
+        row[field] = json.dumps(value, separators=(',', ':')) if isinstance(value, (dict, list)) else value
+    return row
+
+
+def load_checkpoint(path):
+    """Load an export checkpoint (None if missing)"""
+    if not path or not Path(path).exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, state):
+    """Write the checkpoint atomically so an interrupt never leaves it half-written"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def truncate_to(path, size):
+    """Cut a file back to the length recorded in the checkpoint (drops rows written after it)"""
+    if os.path.exists(path) and os.path.getsize(path) > size:
+        with open(path, 'r+b') as f:
+            f.truncate(size)
+
+
+def export_nodes(client, tool, params, page_size, output, fmt, checkpoint_path=None, start=None,
+                 fields=None, workers=EXPORT_WORKERS, rate=EXPORT_RATE):
+    """
+    Write every node for a tool to NDJSON or CSV, de-duplicated by node ID.
+
+    Page 1 is fetched first; when it reports ``count`` the remaining pages
+    are fetched concurrently (a window of ``2 * workers`` pages ahead) and
+    written strictly in page order, otherwise pages are walked until a short
+    one. After each page the output and the seen-ID sidecar
+    (``<checkpoint>.seen``) are flushed and their sizes recorded in the
+    checkpoint; a resumed run truncates both back to those sizes, so rows
+    from a page that was written but not checkpointed are never duplicated.
+
+    Args:
+        client: BeamClient instance
+        tool: Tool function name
+        params: Filters (agentId, isRated)
+        page_size: Items per page
+        output: Output file path, or None for stdout (no resume)
+        fmt: 'ndjson' or 'csv'
+        checkpoint_path: Checkpoint file (optional)
+        start: Checkpoint state to resume from (optional)
+        fields: CSV columns (default: keys of the first node)
+        workers: Concurrent page requests
+        rate: Page requests per second
+
+    Returns:
+        Final checkpoint state
+    """
+    endpoint = f'/agent-graphs/agent-task-nodes/{tool}'
+    limiter = RateLimiter(rate, burst=max(1, workers))
+    state = dict(start) if start else {
+        "tool": tool,
+        "params": params,
+        "page_size": page_size,
+        "format": fmt,
+        "fields": fields,
+        "next_page": 1,
+        "total_pages": None,
+        "count": None,
+        "exported": 0,
+        "duplicates": 0,
+        "output_bytes": 0,
+        "seen_bytes": 0,
+        "done": False
+    }
+
+    def fetch(page):
+        limiter.acquire()
+        page_params = dict(params, pageNum=page, pageSize=page_size)
+        return client.get(endpoint, params=page_params)
+
+    seen = set()
+    seen_path = f"{checkpoint_path}.seen" if checkpoint_path else None
+    if output and start:
+        truncate_to(output, state["output_bytes"])
+    if seen_path:
+        if start:
+            truncate_to(seen_path, state["seen_bytes"])
+            if os.path.exists(seen_path):
+                with open(seen_path, 'r', encoding='utf-8') as f:
+                    seen.update(line.rstrip('\n') for line in f if line.strip())
+        seen_file = open(seen_path, 'a' if start else 'w', encoding='utf-8')
+    else:
+        seen_file = None
+
+    out = open(output, 'a' if start else 'w', encoding='utf-8', newline='') if output else sys.stdout
+    csv_writer = None
+
+    def write_page(page, nodes):
+        nonlocal csv_writer
+        for node in nodes:
+            key = node_key(node)
+            if key in seen:
+                state["duplicates"] += 1
+                continue
+            seen.add(key)
+            if seen_file:
+                seen_file.write(key + "\n")
+            if fmt == 'csv':
+                if csv_writer is None:
+                    if not state["fields"]:
+                        state["fields"] = list(node.keys())
+                    csv_writer = csv.DictWriter(out, fieldnames=state["fields"], extrasaction='ignore')
+                    if state["output_bytes"] == 0:
+                        csv_writer.writeheader()
+                csv_writer.writerow(csv_row(node, state["fields"]))
+            else:
+                out.write(json.dumps(node, separators=(',', ':')) + "\n")
+            state["exported"] += 1
+
+        state["next_page"] = page + 1
+        out.flush()
+        if output:
+            state["output_bytes"] = out.tell()
+        if seen_file:
+            seen_file.flush()
+            state["seen_bytes"] = seen_file.tell()
+        if checkpoint_path:
+            save_checkpoint(checkpoint_path, state)
+        if page % 20 == 0:
+            pages = f"/{state['total_pages']}" if state["total_pages"] else ''
+            print(f"[INFO] page {page}{pages}: {state['exported']} nodes exported", file=sys.stderr)
+
+    try:
+        if state["next_page"] == 1:
+            first = fetch(1)
+            nodes = first.get('agentTaskNodes', [])
+            count = first.get('count')
+            if isinstance(count, int):
+                state["count"] = count
+                state["total_pages"] = max(1, -(-count // page_size))
+            write_page(1, nodes)
+            finished = len(nodes) < page_size and (state["total_pages"] or 1) <= 1
+        else:
+            finished = False
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            pending = {}
+            page = state["next_page"]
+            last_submitted = page - 1
+            window = 2 * max(1, workers) if state["total_pages"] else 1
+
+            while not finished:
+                # Known total: keep a window of pages in flight; beyond it (or without a
+                # total) fetch one page at a time until a short page ends the export
+                limit = state["total_pages"] if state["total_pages"] and page <= state["total_pages"] else page
+                while last_submitted < min(limit, page + window - 1):
+                    last_submitted += 1
+                    pending[last_submitted] = pool.submit(fetch, last_submitted)
+
+                nodes = pending.pop(page).result().get('agentTaskNodes', [])
+                write_page(page, nodes)
+                finished = len(nodes) < page_size and (not state["total_pages"] or page >= state["total_pages"])
+                page += 1
+    finally:
+        if output:
+            out.close()
+        else:
+            out.flush()
+        if seen_file:
+            seen_file.close()
+
+    state["done"] = True
+    if checkpoint_path:
+        save_checkpoint(checkpoint_path, state)
+    return state
 
 
 def main():
@@ -23,20 +231,60 @@ def main():
     parser.add_argument('--page', type=int, default=1, help='Page number')
     parser.add_argument('--page-size', type=int, default=50, help='Items per page')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--all', action='store_true', help='Export every page (NDJSON or CSV)')
+    parser.add_argument('--output', '-o', help='Output file for --all (default: stdout)')
+    parser.add_argument('--format', choices=['ndjson', 'csv'],
+                        help='Export format (default: from --output extension, else ndjson)')
+    parser.add_argument('--fields', help='Comma-separated CSV columns (default: keys of the first node)')
+    parser.add_argument('--checkpoint', help='Checkpoint file for resumable --all runs (needs --output)')
+    parser.add_argument('--workers', type=int, default=EXPORT_WORKERS,
+                        help=f'Concurrent page requests for --all (default: {EXPORT_WORKERS})')
+    parser.add_argument('--rate', type=float, default=EXPORT_RATE,
+                        help=f'Max page requests per second for --all (default: {EXPORT_RATE})')
     args = parser.parse_args()
 
-    try:
-        client = get_client()
+    if args.checkpoint and not args.output:
+        parser.error('--checkpoint needs --output (stdout cannot be resumed)')
 
-        params = {
-            'pageNum': args.page,
-            'pageSize': args.page_size
-        }
+    try:
+        params = {}
         if args.agent_id:
             params['agentId'] = args.agent_id
         if args.rated:
             params['isRated'] = True
 
+        if args.all:
+            fmt = args.format or ('csv' if args.output and args.output.lower().endswith('.csv') else 'ndjson')
+            fields = [f.strip() for f in args.fields.split(',') if f.strip()] if args.fields else None
+
+            start = load_checkpoint(args.checkpoint)
+            if start and (start.get("tool"), start.get("params"), start.get("page_size"), start.get("format")) \
+                    != (args.tool, params, args.page_size, fmt):
+                print("[ERROR] Checkpoint was created with a different tool, filters, page size or format; "
+                      "use a new --checkpoint file", file=sys.stderr)
+                sys.exit(1)
+            if start and start.get("done"):
+                print(f"[OK] Checkpoint {args.checkpoint} is complete ({start.get('exported', 0)} nodes)",
+                      file=sys.stderr)
+                return
+            if start:
+                print(f"[INFO] Resuming at page {start['next_page']} "
+                      f"({start.get('exported', 0)} nodes already exported)", file=sys.stderr)
+
+            client = BeamClient(pool_maxsize=max(args.workers, 1))
+            state = export_nodes(client, args.tool, params, args.page_size, args.output, fmt,
+                                 args.checkpoint, start, fields, args.workers, args.rate)
+            total = f" of {state['count']} reported" if state.get('count') is not None else ''
+            print(f"[OK] {state['exported']} nodes exported{total} "
+                  f"({state['duplicates']} duplicates skipped)"
+                  f"{' to ' + args.output if args.output else ''}", file=sys.stderr)
+            return
+
+        client = get_client()
+
+        params['pageNum'] = args.page
+        params['pageSize'] = args.page_size
+
         result = client.get(f'/agent-graphs/agent-task-nodes/{args.tool}', params=params)
 
         if args.json:
@@ -57,6 +305,8 @@ def main():
             print(json.dumps({"error": str(e)}))
         else:
             print(f"Error: {e}", file=sys.stderr)
+        if args.all and args.checkpoint:
+            print(f"[INFO] Rerun with --checkpoint {args.checkpoint} to resume", file=sys.stderr)
         sys.exit(1)
 
 
@@ -6,6 +6,7 @@ POST /tool/optimization-status/thread/{threadId}
 
 Usage:
     python get_optimization_status.py --thread-id THREAD
+    python get_optimization_status.py --thread-id THREAD --watch
 """
 
 import sys
@@ -18,8 +19,15 @@ def main():
     parser = argparse.ArgumentParser(description='Check optimization status')
     parser.add_argument('--thread-id', required=True, help='Optimization thread ID')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--watch', action='store_true',
+                        help='Poll until terminal, printing status transitions as NDJSON (see watch_status.py)')
+    parser.add_argument('--timeout', type=int, help='With --watch: stop after N seconds')
     args = parser.parse_args()
 
+    if args.watch:
+        from watch_status import OptimizationTarget, watch
+        sys.exit(watch([OptimizationTarget(args.thread_id)], timeout=args.timeout))
+
     try:
         client = get_client()
         result = client.post(f'/tool/optimization-status/thread/{args.thread_id}')
@@ -23,7 +23,6 @@ def main():
     args = parser.parse_args()
 
     try:
-        import requests
         client = get_client()
         headers = client.get_headers()
         headers['Accept'] = 'text/event-stream'
@@ -33,7 +32,7 @@ def main():
         print(f"Streaming updates for task {args.task_id}...")
         print("Press Ctrl+C to stop\n")
 
-        with requests.get(url, headers=headers, stream=True, timeout=args.timeout) as response:
+        with client.session.get(url, headers=headers, stream=True, timeout=args.timeout) as response:
             if response.status_code != 200:
                 raise Exception(f"Failed to connect: {response.status_code}")
 
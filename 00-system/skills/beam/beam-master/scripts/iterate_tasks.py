@@ -7,12 +7,140 @@ GET /agent-tasks/iterate - Paginated task iteration.
 Usage:
     python iterate_tasks.py
     python iterate_tasks.py --agent-id AGENT
+    python iterate_tasks.py --all --output tasks.ndjson --checkpoint tasks.cursor
+    python iterate_tasks.py --all --max-items 500 > tasks.ndjson
 """
 
+import os
 import sys
 import json
 import argparse
+import tempfile
+from pathlib import Path
 from beam_client import get_client
+from get_nodes_by_tool import truncate_to
+
+
+def iterate_tasks(client, params, cursor=None, offset=0):
+    """
+    Stream tasks across pages by following nextCursor.
+
+    Only one page is held in memory at a time.
+
+    Args:
+        client: BeamClient instance
+        params: Query parameters (agentId, limit)
+        cursor: Cursor of the first page to fetch (None = start)
+        offset: Tasks of the first page already consumed (resume point)
+
+    Yields:
+        (task, resume) tuples, where resume is the position just after the
+        task: {"cursor": ..., "offset": ...}, or {"cursor": None, "done": True}
+        after the last task
+    """
+    while True:
+        page_params = dict(params)
+        if cursor:
+            page_params['cursor'] = cursor
+
+        result = client.get('/agent-tasks/iterate', params=page_params)
+        tasks = result.get('tasks', result.get('data', []))
+        next_cursor = result.get('nextCursor', result.get('cursor'))
+        if next_cursor == cursor:
+            next_cursor = None
+
+        for index in range(offset, len(tasks)):
+            if index + 1 < len(tasks):
+                resume = {"cursor": cursor, "offset": index + 1}
+            elif next_cursor:
+                resume = {"cursor": next_cursor, "offset": 0}
+            else:
+                resume = {"cursor": None, "done": True}
+            yield tasks[index], resume
+
+        if not next_cursor or not tasks:
+            return
+        cursor, offset = next_cursor, 0
+
+
+def load_checkpoint(path):
+    """Load a cursor checkpoint (None if missing)"""
+    if not path or not Path(path).exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, state):
+    """Write the checkpoint atomically so an interrupt never leaves it half-written"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def export_all(client, params, out, checkpoint_path=None, max_items=None, start=None):
+    """
+    Write every task as one NDJSON line, checkpointing at page boundaries.
+
+    For a file output the checkpoint also records its length
+    (``output_bytes``), so a resume can cut off rows written after the last
+    checkpoint (e.g. before a kill) instead of writing them twice.
+
+    Args:
+        client: BeamClient instance
+        params: Query parameters
+        out: Writable text stream
+        checkpoint_path: Cursor checkpoint file (optional)
+        max_items: Stop after this many tasks in this run (optional)
+        start: Checkpoint state to resume from (optional)
+
+    Returns:
+        Final checkpoint state
+    """
+    start = start or {}
+    state = {
+        "params": params,
+        "cursor": start.get("cursor"),
+        "offset": start.get("offset", 0),
+        "exported": start.get("exported", 0)
+    }
+    seekable = out.seekable()
+    if seekable:
+        state["output_bytes"] = out.tell()
+    written = 0
+
+    try:
+        for task, resume in iterate_tasks(client, params, state["cursor"], state["offset"]):
+            out.write(json.dumps(task, separators=(',', ':')) + "\n")
+            written += 1
+            state.update(resume)
+            state["exported"] += 1
+
+            at_page_boundary = resume.get("offset", 0) == 0
+            if checkpoint_path and at_page_boundary:
+                out.flush()
+                if seekable:
+                    state["output_bytes"] = out.tell()
+                save_checkpoint(checkpoint_path, state)
+            if written % 500 == 0:
+                print(f"[INFO] {state['exported']} tasks exported", file=sys.stderr)
+            if max_items and written >= max_items:
+                break
+    finally:
+        out.flush()
+        if seekable:
+            state["output_bytes"] = out.tell()
+        if checkpoint_path:
+            save_checkpoint(checkpoint_path, state)
+
+    return state
 
 
 def main():
@@ -21,6 +149,11 @@ def main():
     parser.add_argument('--cursor', help='Pagination cursor')
     parser.add_argument('--limit', type=int, default=50, help='Items per page')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--all', action='store_true',
+                        help='Follow nextCursor through every page, streaming NDJSON')
+    parser.add_argument('--output', '-o', help='NDJSON output file for --all (default: stdout)')
+    parser.add_argument('--max-items', type=int, help='Stop --all after N tasks')
+    parser.add_argument('--checkpoint', help='Cursor checkpoint file for resumable --all runs')
     args = parser.parse_args()
 
     try:
@@ -29,6 +162,42 @@ def main():
         params = {'limit': args.limit}
         if args.agent_id:
             params['agentId'] = args.agent_id
+
+        if args.all:
+            start = load_checkpoint(args.checkpoint)
+            if args.cursor:
+                start = {"cursor": args.cursor}
+            elif start and start.get("done"):
+                print(f"[OK] Checkpoint {args.checkpoint} is complete ({start.get('exported', 0)} tasks)",
+                      file=sys.stderr)
+                return
+            elif start and start.get("params", params) != params:
+                print("[ERROR] Checkpoint was created with different filters; "
+                      "use a new --checkpoint file", file=sys.stderr)
+                sys.exit(1)
+
+            if start and start.get("cursor"):
+                print(f"[INFO] Resuming from cursor {start['cursor']} "
+                      f"({start.get('exported', 0)} tasks already exported)", file=sys.stderr)
+
+            if args.output:
+                if start and "output_bytes" in start:
+                    truncate_to(args.output, start["output_bytes"])
+                mode = 'a' if start else 'w'
+                with open(args.output, mode, encoding='utf-8') as out:
+                    state = export_all(client, params, out, args.checkpoint, args.max_items, start)
+            else:
+                state = export_all(client, params, sys.stdout, args.checkpoint, args.max_items, start)
+
+            if state.get("done"):
+                status = "complete"
+            elif args.checkpoint:
+                status = f"stopped early; rerun with --checkpoint {args.checkpoint} to resume"
+            else:
+                status = "stopped early"
+            print(f"[OK] {state['exported']} tasks exported ({status})", file=sys.stderr)
+            return
+
         if args.cursor:
             params['cursor'] = args.cursor
 
@@ -47,7 +216,7 @@ def main():
 
             if next_cursor:
                 print(f"\nNext cursor: {next_cursor}")
-                print("Use --cursor to get next page")
+                print("Use --cursor to get next page, or --all to stream every page")
 
     except Exception as e:
         if args.json:
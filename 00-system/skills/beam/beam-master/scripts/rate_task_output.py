@@ -4,41 +4,348 @@ Rate Task Output
 
 PATCH /agent-tasks/execution/{taskId}/output-rating
 
+Bulk mode (--from-file) reads rows of task_id, node_id, rating, feedback,
+expected_output from CSV, JSONL or a JSON list and submits them through one
+pooled client on a bounded worker pool. Every applied rating (bulk or
+single) is recorded in a local journal (04-workspace/.rating-journal.jsonl),
+so re-running the same file only sends rows that differ from the rating last
+applied to their task node.
+
 Usage:
     python rate_task_output.py --task-id TASK --node-id NODE --rating positive
     python rate_task_output.py --task-id TASK --node-id NODE --rating negative --feedback "Issue description"
+    python rate_task_output.py --from-file ratings.csv --workers 4
+    python rate_task_output.py --from-file ratings.jsonl --dry-run
 """
 
+import os
 import sys
+import csv
 import json
+import time
+import hashlib
 import argparse
-from beam_client import get_client
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from beam_client import BeamClient, PROJECT_ROOT, RateLimiter, get_client
+
+
+RATINGS = ['positive', 'negative', 'excellent']
+JOURNAL_FILE = PROJECT_ROOT / '04-workspace' / '.rating-journal.jsonl'
+BULK_WORKERS = 4      # Concurrent PATCH requests
+BULK_RATE = 5.0       # Requests per second across workers
+COLUMN_ALIASES = {
+    'task_id': ('task_id', 'taskId'),
+    'node_id': ('node_id', 'nodeId', 'taskNodeId'),
+    'rating': ('rating',),
+    'feedback': ('feedback', 'userFeedback'),
+    'expected_output': ('expected_output', 'expectedOutput')
+}
+
+
+def build_payload(node_id, rating, feedback=None, expected_output=None):
+    data = {
+        "taskNodeId": node_id,
+        "rating": rating
+    }
+    if feedback:
+        data["userFeedback"] = feedback
+    if expected_output:
+        data["expectedOutput"] = expected_output
+    return data
+
+
+def load_rows(path):
+    """
+    Read rating rows from CSV, JSONL or a JSON list.
+
+    Column names may also be the API's camelCase (taskId, taskNodeId,
+    userFeedback, expectedOutput). Empty values become None.
+
+    Returns:
+        List of dicts with task_id, node_id, rating, feedback, expected_output
+    """
+    text = Path(path).read_text(encoding='utf-8-sig')
+    if str(path).lower().endswith('.csv'):
+        items = list(csv.DictReader(text.splitlines()))
+    elif text.lstrip().startswith('['):
+        items = json.loads(text)
+    else:
+        items = []
+        for line_no, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: invalid JSON ({e.msg})")
+
+    rows = []
+    for item in items:
+        row = {}
+        for field, aliases in COLUMN_ALIASES.items():
+            value = next((item.get(a) for a in aliases if item.get(a) not in (None, '')), None)
+            if isinstance(value, str):
+                value = value.strip() or None
+            elif value is not None and field == 'expected_output':
+                value = json.dumps(value, ensure_ascii=False)  # Structured expected output is sent as text
+            row[field] = value
+        if row['rating']:
+            row['rating'] = str(row['rating']).lower()
+        rows.append(row)
+    return rows
+
+
+def rating_key(workspace_id, row):
+    """Idempotency key: workspace plus every field that is sent"""
+    canonical = json.dumps([workspace_id, row['task_id'], row['node_id'], row['rating'],
+                            row['feedback'], row['expected_output']], ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class RatingJournal:
+    """
+    Append-only JSONL journal of submitted ratings.
+
+    Each finished request appends one line (key, workspace_id, task_id,
+    node_id, rating, status) and is flushed and fsynced before it is
+    reported; ``applied()`` returns the last applied rating per task node.
+    """
+
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def applied(self):
+        """Key of the last applied rating per (workspace_id, task_id, node_id), in journal order"""
+        last = {}
+        if not self.path.exists():
+            return last
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line from a crash
+                if record.get('status') == 'applied':
+                    last[(record.get('workspace_id'), record.get('task_id'), record.get('node_id'))] = record.get('key')
+        return last
+
+    def write(self, record):
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def plan_rows(rows, workspace_id, applied, force=False):
+    """
+    Decide what to do with every row.
+
+    Rows are 'invalid' (missing field / unknown rating), 'skipped' (the
+    same rating is the last one the journal applied to that task node),
+    'duplicate' (a later row repeats the same rating), 'superseded' (a later
+    row rates the same task node differently) or 'pending'.
+
+    Args:
+        applied: RatingJournal.applied() - last applied key per task node
+
+    Returns:
+        List of result dicts in file order (row number starts at 1)
+    """
+    results = []
+    last_for_node = {}
+    for number, row in enumerate(rows, 1):
+        result = {"row": number, "task_id": row['task_id'], "node_id": row['node_id'],
+                  "rating": row['rating'], "status": "pending", "error": None}
+        missing = [f for f in ('task_id', 'node_id', 'rating') if not row[f]]
+        if missing:
+            result.update(status="invalid", error=f"missing {', '.join(missing)}")
+        elif row['rating'] not in RATINGS:
+            result.update(status="invalid", error=f"rating must be one of {', '.join(RATINGS)}")
+        else:
+            result["key"] = rating_key(workspace_id, row)
+            last_for_node[(row['task_id'], row['node_id'])] = number
+        results.append(result)
+
+    for result, row in zip(results, rows):
+        if result['status'] != 'pending':
+            continue
+        final = results[last_for_node[(row['task_id'], row['node_id'])] - 1]
+        if final is not result:
+            result['status'] = 'duplicate' if final['key'] == result['key'] else 'superseded'
+        elif applied.get((workspace_id, row['task_id'], row['node_id'])) == result['key'] and not force:
+            result['status'] = 'skipped'
+    return results
+
+
+def journal_record(workspace_id, row, key, status, error=None):
+    return {
+        "ts": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        "key": key,
+        "workspace_id": workspace_id,
+        "task_id": row['task_id'],
+        "node_id": row['node_id'],
+        "rating": row['rating'],
+        "status": status,
+        "error": error
+    }
+
+
+def submit_ratings(client, rows, results, journal, workers=BULK_WORKERS, rate=BULK_RATE, quiet=False):
+    """
+    PATCH every pending row and journal the outcome.
+
+    Failed rows are not retried here: they stay out of the journal's applied
+    set, so re-running the same file sends exactly those rows again.
+    """
+    limiter = RateLimiter(rate, burst=max(1, workers))
+    pending = [(result, rows[result['row'] - 1]) for result in results if result['status'] == 'pending']
+
+    def submit(result, row):
+        limiter.acquire()
+        started = time.perf_counter()
+        try:
+            client.patch(f"/agent-tasks/execution/{row['task_id']}/output-rating",
+                         data=build_payload(row['node_id'], row['rating'], row['feedback'], row['expected_output']))
+            status, error = 'applied', None
+        except Exception as e:
+            status, error = 'failed', " ".join(str(e).split())[:300]
+        result.update(status=status, error=error, ms=round((time.perf_counter() - started) * 1000, 1))
+        journal.write(journal_record(client.workspace_id, row, result['key'], status, error))
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(submit, result, row) for result, row in pending]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            if quiet:
+                continue
+            if result['status'] == 'applied':
+                print(f"[{done}/{len(pending)}] OK   row {result['row']}: {result['task_id']} / "
+                      f"{result['node_id']} -> {result['rating']} ({result['ms']:.0f}ms)")
+            else:
+                print(f"[{done}/{len(pending)}] FAIL row {result['row']}: {result['task_id']} / "
+                      f"{result['node_id']}: {result['error']}", file=sys.stderr)
+    return results
+
+
+def run_bulk(args):
+    rows = load_rows(args.from_file)
+    if not rows:
+        raise ValueError(f"No rows in {args.from_file}")
+
+    client = BeamClient(pool_maxsize=max(args.workers, 1))
+    journal = RatingJournal(args.journal)
+    results = plan_rows(rows, client.workspace_id, journal.applied(), args.force)
+
+    pending = sum(1 for r in results if r['status'] == 'pending')
+    if not args.json:
+        print(f"[INFO] {len(rows)} rows: {pending} to submit, "
+              f"{sum(1 for r in results if r['status'] == 'skipped')} already applied (journal {journal.path})")
+        for result in results:
+            if result['status'] == 'invalid':
+                print(f"[ERROR] row {result['row']}: {result['error']}", file=sys.stderr)
+
+    if args.dry_run:
+        for result in results:
+            result.pop('key', None)
+        if args.json:
+            print(json.dumps({"dry_run": True, "results": results}, indent=2))
+        else:
+            for result in results:
+                print(f"  row {result['row']:>4}  {result['status']:<10}  {result['task_id']} / "
+                      f"{result['node_id']} -> {result['rating']}")
+        return 0
+
+    try:
+        submit_ratings(client, rows, results, journal, args.workers, args.rate, quiet=args.json)
+    finally:
+        journal.close()
+        client.close()
+
+    for result in results:
+        result.pop('key', None)
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    if args.json:
+        print(json.dumps({"summary": counts, "results": results}, indent=2))
+    else:
+        summary = ", ".join(f"{status}: {n}" for status, n in sorted(counts.items()))
+        failed = counts.get('failed', 0) + counts.get('invalid', 0)
+        print(f"\n[{'OK' if not failed else 'ERROR'}] {len(rows)} rows ({summary})")
+        if counts.get('failed'):
+            print(f"[INFO] Re-run the same command to retry failed rows; applied rows are skipped")
+        if args.report:
+            print(f"[INFO] Per-row report: {args.report}")
+
+    return 1 if counts.get('failed') or counts.get('invalid') else 0
 
 
 def main():
     parser = argparse.ArgumentParser(description='Rate task output')
-    parser.add_argument('--task-id', required=True, help='Task ID')
-    parser.add_argument('--node-id', required=True, help='Task node ID')
-    parser.add_argument('--rating', required=True, choices=['positive', 'negative', 'excellent'], help='Rating')
+    parser.add_argument('--task-id', help='Task ID')
+    parser.add_argument('--node-id', help='Task node ID')
+    parser.add_argument('--rating', choices=RATINGS, help='Rating')
     parser.add_argument('--feedback', help='User feedback')
     parser.add_argument('--expected-output', help='Expected output for comparison')
+    parser.add_argument('--from-file', help='CSV/JSONL/JSON rows: task_id, node_id, rating, feedback, expected_output')
+    parser.add_argument('--workers', type=int, default=BULK_WORKERS,
+                        help=f'Concurrent requests in bulk mode (default: {BULK_WORKERS})')
+    parser.add_argument('--rate', type=float, default=BULK_RATE,
+                        help=f'Max requests per second in bulk mode (default: {BULK_RATE})')
+    parser.add_argument('--journal', default=str(JOURNAL_FILE),
+                        help='Journal of applied ratings (default: 04-workspace/.rating-journal.jsonl)')
+    parser.add_argument('--force', action='store_true', help='Resubmit rows already recorded as applied')
+    parser.add_argument('--dry-run', action='store_true', help='Validate rows and show what would be sent')
+    parser.add_argument('--report', help='Write per-row status as JSONL')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
     args = parser.parse_args()
 
+    if not args.from_file and not (args.task_id and args.node_id and args.rating):
+        parser.error('--task-id, --node-id and --rating are required (or use --from-file)')
+
     try:
+        if args.from_file:
+            sys.exit(run_bulk(args))
+
         client = get_client()
 
-        data = {
-            "taskNodeId": args.node_id,
-            "rating": args.rating
-        }
-        if args.feedback:
-            data["userFeedback"] = args.feedback
-        if args.expected_output:
-            data["expectedOutput"] = args.expected_output
+        data = build_payload(args.node_id, args.rating, args.feedback, args.expected_output)
 
         result = client.patch(f'/agent-tasks/execution/{args.task_id}/output-rating', data=data)
 
+        # Record it, so a later bulk run does not treat an older rating of this node as current
+        row = {'task_id': args.task_id, 'node_id': args.node_id, 'rating': args.rating,
+               'feedback': args.feedback, 'expected_output': args.expected_output}
+        journal = RatingJournal(args.journal)
+        try:
+            journal.write(journal_record(client.workspace_id, row, rating_key(client.workspace_id, row), 'applied'))
+        except OSError as e:
+            print(f"[WARN] Could not update rating journal {journal.path}: {e}", file=sys.stderr)
+        finally:
+            journal.close()
+
         if args.json:
             print(json.dumps(result, indent=2))
         else:
@@ -4,15 +4,247 @@ Test Graph Node
 
 POST /agent-graphs/test-node - Test a specific node.
 
+Batch mode (--inputs) runs every input of a JSONL file concurrently under a
+request rate cap, caches successful results per (graph, node, input) in
+04-workspace/.test-node-cache/, and with --compare-graph-id runs the same
+inputs against a second graph version and prints them side by side.
+
 Usage:
     python test_graph_node.py --agent-id AGENT --node-id NODE --graph-id GRAPH
     python test_graph_node.py --agent-id AGENT --node-id NODE --graph-id GRAPH --input '{"key": "value"}'
+    python test_graph_node.py --agent-id AGENT --node-id NODE --graph-id GRAPH --inputs cases.jsonl
+    python test_graph_node.py --agent-id AGENT --node-id NODE --graph-id OLD --compare-graph-id NEW \\
+        --inputs cases.jsonl --workers 4 --rate 2 --output results.jsonl
 """
 
 import sys
 import json
+import time
+import hashlib
 import argparse
-from beam_client import get_client
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from beam_client import BeamClient, PROJECT_ROOT, RateLimiter, get_client
+from _shared.beam_cache import JsonFileCache  # 03-skills/_shared, put on sys.path by beam_client
+
+
+CACHE_DIR = PROJECT_ROOT / '04-workspace' / '.test-node-cache'
+BATCH_WORKERS = 4     # Concurrent test-node calls
+BATCH_RATE = 2.0      # Requests per second across all workers (each call runs the node's model)
+WRAPPER_KEYS = {'id', 'name', 'label'}
+
+
+def input_hash(params):
+    """Stable hash of an input: canonical JSON (sorted keys, compact)"""
+    canonical = json.dumps(params, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class NodeResultCache(JsonFileCache):
+    """
+    Successful test-node results on disk, keyed by graph ID, node ID and input hash.
+
+    Layout: ``<cache_dir>/<graph_id>/<node_id>/<input_hash>.json.gz``. A failed
+    write only warns, so a full disk never aborts a batch.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, read=True, write=True):
+        super().__init__(cache_dir, read=read, write=write)
+
+    def lookup(self, graph_id, node_id, params):
+        """Cached entry ({data, seconds, ...}) for an input, or None"""
+        return self.get((graph_id, node_id, input_hash(params)))
+
+    def store(self, graph_id, node_id, params, result, seconds):
+        self.put((graph_id, node_id, input_hash(params)), result, graph_id=graph_id, node_id=node_id,
+                 params=params, seconds=seconds,
+                 tested_at=datetime.now(timezone.utc).isoformat(timespec='seconds'))
+
+
+def load_inputs(path):
+    """
+    Read test inputs from a JSONL file (or a JSON list).
+
+    Each item is either the params object itself or a wrapper
+    ``{"id": "case-1", "params": {...}}``; blank lines and lines starting
+    with ``#`` are skipped.
+
+    Returns:
+        List of (label, params) tuples
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    stripped = text.lstrip()
+    if stripped.startswith('['):
+        try:
+            items = json.loads(stripped)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: invalid JSON ({e.msg})")
+    else:
+        items = []
+        for line_no, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: invalid JSON ({e.msg})")
+
+    inputs = []
+    for index, item in enumerate(items, 1):
+        if not isinstance(item, dict):
+            raise ValueError(f"{path}: input {index} is not a JSON object")
+        if isinstance(item.get('params'), dict) and set(item) - {'params'} <= WRAPPER_KEYS:
+            label = str(item.get('id') or item.get('name') or item.get('label') or index)
+            inputs.append((label, item['params']))
+        else:
+            inputs.append((str(index), item))
+    return inputs
+
+
+def run_node_test(client, cache, limiter, agent_id, graph_id, node_id, params):
+    """
+    Test one input, from the cache when possible.
+
+    Cache hits skip the rate limiter; live calls wait for a token before the
+    latency clock starts.
+
+    Returns:
+        Dict with status ('ok' | 'error'), cached, seconds, result and error
+    """
+    entry = cache.lookup(graph_id, node_id, params)
+    if entry is not None:
+        return {"status": "ok", "cached": True, "seconds": entry.get('seconds'),
+                "result": entry['data'], "error": None}
+
+    data = {
+        "agentId": agent_id,
+        "nodeId": node_id,
+        "graphId": graph_id,
+        "params": params
+    }
+    limiter.acquire()
+    started = time.perf_counter()
+    try:
+        result = client.post('/agent-graphs/test-node', data=data)
+    except Exception as e:
+        return {"status": "error", "cached": False, "seconds": round(time.perf_counter() - started, 3),
+                "result": None, "error": str(e)}
+    seconds = round(time.perf_counter() - started, 3)
+
+    cache.store(graph_id, node_id, params, result, seconds)
+    return {"status": "ok", "cached": False, "seconds": seconds, "result": result, "error": None}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (None when empty)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def run_stats(records):
+    """Per-run counts and latency (live calls only; cache hits carry no fresh latency)"""
+    live = [r['seconds'] for r in records if r['status'] == 'ok' and not r['cached']]
+    return {
+        "inputs": len(records),
+        "ok": sum(1 for r in records if r['status'] == 'ok'),
+        "errors": sum(1 for r in records if r['status'] == 'error'),
+        "cached": sum(1 for r in records if r['cached']),
+        "live": len(live),
+        "mean_s": round(sum(live) / len(live), 3) if live else None,
+        "p50_s": percentile(live, 50),
+        "p95_s": percentile(live, 95),
+        "max_s": max(live) if live else None
+    }
+
+
+def result_digest(result):
+    return input_hash(result)[:12] if result is not None else None
+
+
+def run_batch(client, cache, limiter, agent_id, runs, inputs, workers):
+    """
+    Run every input against every (graph_id, node_id) run on one worker pool.
+
+    Returns:
+        Dict of run label -> list of records in input order
+    """
+    records = {label: [None] * len(inputs) for label, _, _ in runs}
+    jobs = [(label, graph_id, node_id, index)
+            for label, graph_id, node_id in runs for index in range(len(inputs))]
+    done = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(run_node_test, client, cache, limiter, agent_id, graph_id, node_id, inputs[index][1]):
+                (label, graph_id, node_id, index)
+            for label, graph_id, node_id, index in jobs
+        }
+        for future in as_completed(futures):
+            label, graph_id, node_id, index = futures[future]
+            record = future.result()
+            record.update({"run": label, "graph_id": graph_id, "node_id": node_id,
+                           "input": inputs[index][0], "input_hash": input_hash(inputs[index][1])})
+            records[label][index] = record
+            done += 1
+            if record['status'] == 'error':
+                print(f"[ERROR] {label} {inputs[index][0]}: {record['error'][:150]}", file=sys.stderr)
+            if done % 10 == 0 or done == len(jobs):
+                print(f"[INFO] {done}/{len(jobs)} tests complete", file=sys.stderr)
+
+    return records
+
+
+def format_cell(record):
+    if record['status'] == 'error':
+        return 'ERROR'
+    if record['cached']:
+        return 'cached'
+    return f"{record['seconds'] * 1000:.0f}ms"
+
+
+def format_seconds(value):
+    return f"{value * 1000:.0f}ms" if value is not None else '-'
+
+
+def print_report(runs, inputs, records):
+    labels = [label for label, _, _ in runs]
+    width = min(max([len(label) for label, _ in inputs] + [5]), 30)
+
+    header = f"{'Input':<{width}}  " + '  '.join(f"{label:>10}" for label in labels)
+    if len(labels) == 2:
+        header += '  Output'
+    print(f"\n{header}")
+    print('-' * len(header))
+
+    for index, (name, _) in enumerate(inputs):
+        row = [records[label][index] for label in labels]
+        line = f"{name[:width]:<{width}}  " + '  '.join(f"{format_cell(r):>10}" for r in row)
+        if len(labels) == 2:
+            if any(r['status'] == 'error' for r in row):
+                line += '  -'
+            else:
+                line += '  same' if result_digest(row[0]['result']) == result_digest(row[1]['result']) else '  DIFF'
+        print(line)
+
+    print("\nRun stats (latency over live calls):")
+    print(f"  {'Run':<10} {'Graph':<38} {'OK':>4} {'Err':>4} {'Cache':>5} {'p50':>8} {'p95':>8} {'max':>8} {'mean':>8}")
+    for label, graph_id, _ in runs:
+        stats = run_stats(records[label])
+        print(f"  {label:<10} {graph_id[:38]:<38} {stats['ok']:>4} {stats['errors']:>4} {stats['cached']:>5} "
+              f"{format_seconds(stats['p50_s']):>8} {format_seconds(stats['p95_s']):>8} "
+              f"{format_seconds(stats['max_s']):>8} {format_seconds(stats['mean_s']):>8}")
+
+    if len(labels) == 2:
+        pairs = [(a, b) for a, b in zip(records[labels[0]], records[labels[1]])
+                 if a['status'] == 'ok' and b['status'] == 'ok']
+        changed = sum(1 for a, b in pairs if result_digest(a['result']) != result_digest(b['result']))
+        print(f"\nOutputs differing: {changed}/{len(pairs)} comparable inputs")
 
 
 def main():
@@ -21,31 +253,81 @@ def main():
     parser.add_argument('--node-id', required=True, help='Node ID')
     parser.add_argument('--graph-id', required=True, help='Graph ID')
     parser.add_argument('--input', help='JSON input params', default='{}')
+    parser.add_argument('--inputs', help='JSONL file of inputs to run as a batch')
+    parser.add_argument('--compare-graph-id', help='Second graph version to run the same inputs against')
+    parser.add_argument('--compare-node-id', help='Node ID in the compared graph (default: --node-id)')
+    parser.add_argument('--workers', type=int, default=BATCH_WORKERS,
+                        help=f'Concurrent tests in batch mode (default: {BATCH_WORKERS})')
+    parser.add_argument('--rate', type=float, default=BATCH_RATE,
+                        help=f'Max requests per second in batch mode (default: {BATCH_RATE})')
+    parser.add_argument('--no-cache', action='store_true', help='Neither read nor write the result cache')
+    parser.add_argument('--refresh', action='store_true', help='Re-run every input and overwrite cached results')
+    parser.add_argument('--output', help='Write one JSON record per test to this JSONL file')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
     args = parser.parse_args()
 
+    if args.compare_graph_id and not args.inputs:
+        parser.error('--compare-graph-id requires --inputs')
+
     try:
-        client = get_client()
+        if not args.inputs:
+            client = get_client()
 
-        input_params = json.loads(args.input)
+            input_params = json.loads(args.input)
 
-        data = {
-            "agentId": args.agent_id,
-            "nodeId": args.node_id,
-            "graphId": args.graph_id,
-            "params": input_params
-        }
+            data = {
+                "agentId": args.agent_id,
+                "nodeId": args.node_id,
+                "graphId": args.graph_id,
+                "params": input_params
+            }
 
-        result = client.post('/agent-graphs/test-node', data=data)
+            result = client.post('/agent-graphs/test-node', data=data)
+
+            if args.json:
+                print(json.dumps(result, indent=2))
+            else:
+                print("\nNode Test Result:")
+                print("-" * 50)
+                print(f"Objective: {result.get('objective', 'N/A')}")
+                print(f"Evaluation Criteria: {result.get('evaluationCriteria', [])}")
+                print(f"\nFull response saved - use --json for details")
+            return
+
+        inputs = load_inputs(args.inputs)
+        if not inputs:
+            raise ValueError(f"No inputs in {args.inputs}")
+
+        runs = [('A' if args.compare_graph_id else 'run', args.graph_id, args.node_id)]
+        if args.compare_graph_id:
+            runs.append(('B', args.compare_graph_id, args.compare_node_id or args.node_id))
+
+        cache = NodeResultCache(read=not (args.no_cache or args.refresh), write=not args.no_cache)
+        client = BeamClient(pool_maxsize=max(args.workers, 1))
+        limiter = RateLimiter(args.rate)
+        print(f"[INFO] {len(inputs)} inputs x {len(runs)} run(s), {args.workers} workers, "
+              f"{args.rate}/s", file=sys.stderr)
+        records = run_batch(client, cache, limiter, args.agent_id, runs, inputs, args.workers)
+
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                for label, _, _ in runs:
+                    for record in records[label]:
+                        f.write(json.dumps(record, ensure_ascii=False) + '\n')
 
         if args.json:
-            print(json.dumps(result, indent=2))
+            print(json.dumps({
+                "runs": [{"run": label, "graph_id": graph_id, "node_id": node_id,
+                          "stats": run_stats(records[label]), "results": records[label]}
+                         for label, graph_id, node_id in runs]
+            }, indent=2))
         else:
-            print("\nNode Test Result:")
-            print("-" * 50)
-            print(f"Objective: {result.get('objective', 'N/A')}")
-            print(f"Evaluation Criteria: {result.get('evaluationCriteria', [])}")
-            print(f"\nFull response saved - use --json for details")
+            print_report(runs, inputs, records)
+            if args.output:
+                print(f"\nResults: {args.output}")
+
+        if any(r['status'] == 'error' for label, _, _ in runs for r in records[label]):
+            sys.exit(1)
 
     except json.JSONDecodeError:
         print(f"Error: Invalid JSON in --input", file=sys.stderr)
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Watch Status (adaptive polling)
+
+Polls optimization threads (POST /tool/optimization-status/thread/{threadId})
+and latest executions (GET /agent-tasks/latest-executions) for many targets
+from one process and writes only state transitions as NDJSON.
+
+Each target has its own interval: it tightens to --min-interval after a
+change and backs off exponentially (x --backoff, up to --max-interval) while
+nothing changes. GETs are conditional (If-None-Match / If-Modified-Since when
+the server sent a validator; 304 = unchanged) and identical bodies are
+deduplicated by hash before any parsing. Optimization threads stop being
+polled once they reach a terminal status.
+
+Usage:
+    python watch_status.py --thread-id THREAD1 --thread-id THREAD2
+    python watch_status.py --agent-id AGENT1 --agent-id AGENT2 --timeout 3600
+    python watch_status.py --thread-id THREAD --executions --output transitions.ndjson
+"""
+
+import sys
+import json
+import time
+import heapq
+import random
+import hashlib
+import argparse
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timezone
+from beam_client import BeamClient
+
+
+OPTIMIZATION_TERMINAL = {"COMPLETED", "COMPLETE", "SUCCESS", "SUCCEEDED", "DONE",
+                         "FAILED", "ERROR", "CANCELLED", "STOPPED"}
+MIN_INTERVAL = 5.0       # Seconds between polls while a target is changing
+MAX_INTERVAL = 120.0     # Ceiling for idle backoff
+BACKOFF = 2.0            # Interval multiplier per unchanged poll
+POLL_WORKERS = 4         # Concurrent requests
+EXECUTIONS_LIMIT = 10
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def body_hash(body):
+    return hashlib.sha256(json.dumps(body, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def conditional_get(client, endpoint, params, target):
+    """
+    GET with the target's stored validators, through the client's middleware
+    (401 replay, 429/5xx retries, latency histograms).
+
+    Returns:
+        Parsed JSON body, or None on 304 Not Modified
+    """
+    headers = {}
+    if target.etag:
+        headers['If-None-Match'] = target.etag
+    elif target.last_modified:
+        headers['If-Modified-Since'] = target.last_modified
+    response = client.request('GET', endpoint, params=params, headers=headers)
+
+    if response.status_code == 304:
+        response.close()
+        return None
+    body = client._handle_response(response)
+    target.etag = response.headers.get('ETag') or target.etag
+    target.last_modified = response.headers.get('Last-Modified') or target.last_modified
+    return body
+
+
+class PollTarget(ABC):
+    """One polled resource: how to fetch it, reduce it to a state, and diff states"""
+
+    def __init__(self, key):
+        self.key = key
+        self.etag = None
+        self.last_modified = None
+        self.body_hash = None
+        self.state = None
+        self.interval = None
+        self.error = None
+        self.done = False
+
+    @abstractmethod
+    def fetch(self, client):
+        """Request the resource; returns the response body (None if unchanged, e.g. 304)"""
+
+    @abstractmethod
+    def project(self, body):
+        """Reduce a response body to the state compared between polls"""
+
+    @abstractmethod
+    def transitions(self, old, new):
+        """Event records for the change from state ``old`` (None on first poll) to ``new``"""
+
+    def is_terminal(self, state):
+        return False
+
+
+class OptimizationTarget(PollTarget):
+    def __init__(self, thread_id):
+        super().__init__(f"optimization:{thread_id}")
+        self.thread_id = thread_id
+
+    def fetch(self, client):
+        # POST endpoint: no conditional request, so unchanged bodies are caught by hash
+        return client.post(f'/tool/optimization-status/thread/{self.thread_id}')
+
+    def project(self, body):
+        return {
+            "status": str(body.get('status', 'unknown')).upper(),
+            "progress": body.get('progress'),
+            "message": body.get('message')
+        }
+
+    def transitions(self, old, new):
+        event = "snapshot" if old is None else ("terminal" if self.is_terminal(new) else "changed")
+        record = {"event": event, "thread_id": self.thread_id, **new}
+        if old is not None:
+            record["from"] = old["status"]
+        return [record]
+
+    def is_terminal(self, state):
+        return state["status"] in OPTIMIZATION_TERMINAL
+
+
+class ExecutionsTarget(PollTarget):
+    def __init__(self, agent_id=None, limit=EXECUTIONS_LIMIT):
+        super().__init__(f"executions:{agent_id or 'all'}")
+        self.agent_id = agent_id
+        self.limit = limit
+
+    def fetch(self, client):
+        params = {'limit': self.limit}
+        if self.agent_id:
+            params['agentId'] = self.agent_id
+        return conditional_get(client, '/agent-tasks/latest-executions', params, self)
+
+    def project(self, body):
+        executions = body if isinstance(body, list) else body.get('executions', [])
+        state = {}
+        for ex in executions:
+            ex_id = ex.get('id') or ex.get('customId')
+            if ex_id:
+                state[ex_id] = {"status": ex.get('status'), "customId": ex.get('customId'),
+                                "createdAt": ex.get('createdAt')}
+        return state
+
+    def transitions(self, old, new):
+        if old is None:
+            counts = {}
+            for ex in new.values():
+                counts[ex['status']] = counts.get(ex['status'], 0) + 1
+            return [{"event": "snapshot", "agent_id": self.agent_id, "executions": len(new), "statuses": counts}]
+        records = []
+        for ex_id, ex in new.items():
+            before = old.get(ex_id)
+            if before is None:
+                records.append({"event": "new", "agent_id": self.agent_id, "execution_id": ex_id, **ex})
+            elif before['status'] != ex['status']:
+                records.append({"event": "changed", "agent_id": self.agent_id, "execution_id": ex_id,
+                                "from": before['status'], **ex})
+        return records
+
+
+class AdaptivePoller:
+    """
+    Schedule every target on one heap and poll due targets on a small thread pool.
+
+    A target's next poll is ``interval`` seconds (with +/-10% jitter) after
+    its last one finished. The interval resets to ``min_interval`` when the
+    target's state changed and is multiplied by ``backoff`` otherwise,
+    including after errors.
+    """
+
+    def __init__(self, client, targets, out, workers=POLL_WORKERS,
+                 min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL, backoff=BACKOFF):
+        self.client = client
+        self.targets = {t.key: t for t in targets}
+        self.out = out
+        self.workers = max(1, workers)
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.backoff = max(1.0, backoff)
+        self.stats = {"polls": 0, "not_modified": 0, "unchanged": 0, "transitions": 0, "errors": 0}
+
+    def emit(self, target, record):
+        self.stats["transitions"] += 1
+        self.out.write(json.dumps({"ts": now_iso(), "target": target.key, **record},
+                                  separators=(',', ':')) + "\n")
+        self.out.flush()
+
+    def _poll(self, target):
+        """Blocking: fetch one target. Returns the body, None (304) or raises"""
+        return target.fetch(self.client)
+
+    def _handle(self, target, future):
+        """Process one finished poll and return whether the target changed"""
+        self.stats["polls"] += 1
+        try:
+            body = future.result()
+        except Exception as e:
+            self.stats["errors"] += 1
+            message = " ".join(str(e).split())[:200]
+            if target.error != message:
+                target.error = message
+                self.emit(target, {"event": "error", "error": message})
+            return False
+
+        if target.error is not None:
+            target.error = None
+            self.emit(target, {"event": "recovered"})
+
+        if body is None:
+            self.stats["not_modified"] += 1
+            return False
+        digest = body_hash(body)
+        if digest == target.body_hash:
+            self.stats["unchanged"] += 1
+            return False
+        target.body_hash = digest
+
+        state = target.project(body)
+        if state == target.state:
+            self.stats["unchanged"] += 1
+            return False
+        for record in target.transitions(target.state, state):
+            self.emit(target, record)
+        target.state = state
+        target.done = target.is_terminal(state)
+        return True
+
+    def _next_interval(self, target, changed):
+        if changed or target.interval is None:
+            target.interval = self.min_interval
+        else:
+            target.interval = min(self.max_interval, target.interval * self.backoff)
+        return target.interval * random.uniform(0.9, 1.1)
+
+    def run(self, timeout=None):
+        """
+        Poll until every target is finished (only optimization threads finish)
+        or the timeout expires.
+
+        Returns:
+            True if every target reached a terminal state
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        heap = [(time.monotonic(), key) for key in self.targets]
+        heapq.heapify(heap)
+        inflight = {}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while heap or inflight:
+                now = time.monotonic()
+                if deadline and now >= deadline:
+                    for future in inflight:
+                        future.cancel()
+                    return False
+
+                while heap and heap[0][0] <= now and len(inflight) < self.workers:
+                    _, key = heapq.heappop(heap)
+                    inflight[pool.submit(self._poll, self.targets[key])] = key
+
+                wake = heap[0][0] if heap and len(inflight) < self.workers else None
+                if deadline:
+                    wake = min(wake, deadline) if wake else deadline
+                wait_for = max(0.0, wake - now) if wake else None
+
+                if not inflight:
+                    time.sleep(wait_for or 0)
+                    continue
+                finished, _ = wait(list(inflight), timeout=wait_for, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    target = self.targets[inflight.pop(future)]
+                    changed = self._handle(target, future)
+                    if not target.done:
+                        heapq.heappush(heap, (time.monotonic() + self._next_interval(target, changed), target.key))
+
+        return all(t.done for t in self.targets.values())
+
+
+def watch(targets, output=None, timeout=None, workers=POLL_WORKERS,
+          min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL, backoff=BACKOFF):
+    """
+    Run an AdaptivePoller and print a summary to stderr.
+
+    Returns:
+        Exit code: 0 when all targets finished, 2 on timeout/interrupt
+        (executions feeds never finish, so they always end this way)
+    """
+    client = BeamClient(pool_maxsize=max(workers, 1))
+    out = open(output, 'a', encoding='utf-8') if output else sys.stdout
+    poller = AdaptivePoller(client, targets, out, workers, min_interval, max_interval, backoff)
+    print(f"[INFO] Watching {len(poller.targets)} targets (interval {min_interval:g}-{max_interval:g}s)",
+          file=sys.stderr)
+    started = time.perf_counter()
+    finished = False
+    try:
+        finished = poller.run(timeout=timeout)
+    except KeyboardInterrupt:
+        print("\nWatch stopped by user", file=sys.stderr)
+    finally:
+        if output:
+            out.close()
+        client.close()
+
+    stats = poller.stats
+    print(f"[{'OK' if finished else 'INFO'}] {stats['polls']} polls, {stats['transitions']} transitions, "
+          f"{stats['not_modified']} not modified, {stats['unchanged']} unchanged, {stats['errors']} errors, "
+          f"{time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0 if finished else 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Poll optimization status and latest executions, emitting transitions')
+    parser.add_argument('--thread-id', action='append', default=[], help='Optimization thread ID (repeatable)')
+    parser.add_argument('--agent-id', action='append', default=[],
+                        help='Watch latest executions for this agent (repeatable)')
+    parser.add_argument('--executions', action='store_true', help='Watch latest executions across all agents')
+    parser.add_argument('--limit', type=int, default=EXECUTIONS_LIMIT,
+                        help=f'Executions per feed (default: {EXECUTIONS_LIMIT})')
+    parser.add_argument('--min-interval', type=float, default=MIN_INTERVAL,
+                        help=f'Seconds between polls while changing (default: {MIN_INTERVAL:g})')
+    parser.add_argument('--max-interval', type=float, default=MAX_INTERVAL,
+                        help=f'Idle backoff ceiling in seconds (default: {MAX_INTERVAL:g})')
+    parser.add_argument('--backoff', type=float, default=BACKOFF,
+                        help=f'Interval multiplier per unchanged poll (default: {BACKOFF:g})')
+    parser.add_argument('--workers', type=int, default=POLL_WORKERS,
+                        help=f'Concurrent requests (default: {POLL_WORKERS})')
+    parser.add_argument('--timeout', type=int, help='Stop after N seconds overall')
+    parser.add_argument('--output', '-o', help='NDJSON output file (default: stdout)')
+    args = parser.parse_args()
+
+    targets = [OptimizationTarget(t) for t in dict.fromkeys(args.thread_id)]
+    targets += [ExecutionsTarget(a, args.limit) for a in dict.fromkeys(args.agent_id)]
+    if args.executions:
+        targets.append(ExecutionsTarget(None, args.limit))
+    if not targets:
+        parser.error('give at least one --thread-id, --agent-id or --executions')
+
+    try:
+        sys.exit(watch(targets, args.output, args.timeout, args.workers,
+                       args.min_interval, args.max_interval, args.backoff))
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
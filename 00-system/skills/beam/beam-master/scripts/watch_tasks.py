@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Watch Tasks (multiplexed SSE)
+
+GET /agent-tasks/{taskId}/updates for many tasks at once, merged into one
+timestamped NDJSON event stream that ends when every task is terminal.
+
+Usage:
+    python watch_tasks.py --task-ids TASK1 TASK2 TASK3
+    python watch_tasks.py --from-file task_ids.txt --concurrency 20
+    python watch_tasks.py --from-file created.json --output events.ndjson --timeout 1800
+"""
+
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from beam_client import BeamClient, BASE_URL, POOL_MAXSIZE
+from _shared.beam_ids import load_task_ids  # 03-skills/_shared, put on sys.path by beam_client
+from _shared.beam_status import TERMINAL_STATUSES
+
+
+CONCURRENCY = 16            # Open SSE connections at once
+READ_TIMEOUT = 90           # Seconds without a byte before reconnecting
+BACKOFF_BASE = 1.0          # Reconnect backoff (seconds), doubled per failure
+BACKOFF_CAP = 60
+
+
+def parse_sse(lines):
+    """
+    Parse Server-Sent Events from decoded lines.
+
+    Yields:
+        Dicts with 'id', 'event', 'data' (joined data lines) and 'retry'
+    """
+    event = {"id": None, "event": "message", "data": [], "retry": None}
+    for line in lines:
+        if line == "":
+            if event["data"] or event["id"] is not None:
+                yield {**event, "data": "\n".join(event["data"])}
+            event = {"id": None, "event": "message", "data": [], "retry": None}
+            continue
+        if line.startswith(":"):
+            continue  # Comment / keep-alive
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            event["data"].append(value)
+        elif field == "id":
+            event["id"] = value
+        elif field == "event":
+            event["event"] = value
+        elif field == "retry" and value.isdigit():
+            event["retry"] = int(value)
+    if event["data"]:
+        yield {**event, "data": "\n".join(event["data"])}
+
+
+def extract_status(data):
+    """Best-effort task status from an update payload"""
+    if not isinstance(data, dict):
+        return None
+    for key in ('status', 'taskStatus'):
+        if isinstance(data.get(key), str):
+            return data[key].upper()
+    for nested in ('task', 'agentTask', 'data'):
+        if isinstance(data.get(nested), dict):
+            status = extract_status(data[nested])
+            if status:
+                return status
+    return None
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+class TaskWatcher:
+    """
+    Multiplex SSE update streams for many tasks.
+
+    Each stream is a blocking requests iterator running on a worker thread
+    (the shared keep-alive session); asyncio coordinates the concurrency cap,
+    reconnect backoff and the single merged output queue.
+    """
+
+    def __init__(self, client, task_ids, out, concurrency=CONCURRENCY, read_timeout=READ_TIMEOUT):
+        self.client = client
+        self.task_ids = list(dict.fromkeys(task_ids))
+        self.out = out
+        self.concurrency = max(1, concurrency)
+        self.read_timeout = read_timeout
+        self.final_status = {}
+        self.events = 0
+        self.reconnects = 0
+        self.last_event_ids = {}
+        self._responses = {}
+        self._stopping = False
+
+    def _stream(self, task_id, emit):
+        """
+        Blocking: read one SSE connection until it ends or the task is terminal.
+
+        The last seen event ID is kept in ``last_event_ids`` (even if the
+        connection drops mid-stream) and sent as Last-Event-ID on reconnect.
+
+        Returns:
+            (terminal_status or None, server retry ms or None)
+        """
+        last_event_id = self.last_event_ids.get(task_id)
+        headers = self.client.get_headers()
+        headers['Accept'] = 'text/event-stream'
+        headers['Cache-Control'] = 'no-cache'
+        if last_event_id:
+            headers['Last-Event-ID'] = last_event_id
+
+        url = f"{BASE_URL}/agent-tasks/{task_id}/updates"
+        retry_ms = None
+        with self.client.session.get(url, headers=headers, stream=True,
+                                     timeout=(10, self.read_timeout)) as response:
+            if response.status_code == 401:
+                self.client._ensure_token(force_auth=True)
+                raise ConnectionError("401 Unauthorized (token refreshed)")
+            if response.status_code == 404:
+                return "NOT_FOUND", None
+            if response.status_code != 200:
+                raise ConnectionError(f"HTTP {response.status_code}")
+
+            self._responses[task_id] = response
+            try:
+                lines = (line.decode('utf-8', errors='replace')
+                         for line in response.iter_lines(delimiter=b"\n"))
+                for event in parse_sse(line.rstrip("\r") for line in lines):
+                    if event["retry"] is not None:
+                        retry_ms = event["retry"]
+                    if event["id"] is not None:
+                        self.last_event_ids[task_id] = event["id"]
+                    try:
+                        data = json.loads(event["data"]) if event["data"] else None
+                    except json.JSONDecodeError:
+                        data = event["data"]
+                    status = extract_status(data)
+                    emit({
+                        "ts": now_iso(),
+                        "task_id": task_id,
+                        "event": event["event"],
+                        "id": event["id"],
+                        "status": status,
+                        "data": data
+                    })
+                    if status in TERMINAL_STATUSES:
+                        return status, retry_ms
+            finally:
+                self._responses.pop(task_id, None)
+        return None, retry_ms
+
+    def _poll_status(self, task_id):
+        """Blocking: fetch the task's current status (used between reconnects)"""
+        try:
+            task = self.client.get(f"/agent-tasks/{task_id}")
+        except Exception:
+            return None
+        return extract_status(task)
+
+    async def _watch(self, task_id, semaphore, emit, loop):
+        failures = 0
+        async with semaphore:
+            while not self._stopping:
+                try:
+                    status, retry_ms = await loop.run_in_executor(None, self._stream, task_id, emit)
+                    failures = 0 if status is None else failures
+                    reason = "stream ended"
+                except Exception as e:
+                    if self._stopping:
+                        return
+                    status, retry_ms = None, None
+                    failures += 1
+                    reason = " ".join(str(e).split())[:120]
+
+                if status:
+                    self.final_status[task_id] = status
+                    return
+
+                # Disconnected before a terminal event: the task may have finished meanwhile
+                status = await loop.run_in_executor(None, self._poll_status, task_id)
+                if status in TERMINAL_STATUSES:
+                    emit({"ts": now_iso(), "task_id": task_id, "event": "status",
+                          "id": None, "status": status, "data": {"status": status, "source": "poll"}})
+                    self.final_status[task_id] = status
+                    return
+
+                delay = retry_ms / 1000 if retry_ms else min(BACKOFF_CAP, BACKOFF_BASE * (2 ** failures))
+                delay = random.uniform(delay / 2, delay)
+                self.reconnects += 1
+                last_event_id = self.last_event_ids.get(task_id)
+                print(f"[INFO] {task_id[:8]}: reconnecting in {delay:.1f}s ({reason}"
+                      f"{', Last-Event-ID ' + last_event_id if last_event_id else ''})", file=sys.stderr)
+                await asyncio.sleep(delay)
+
+    async def _writer(self, queue):
+        while True:
+            record = await queue.get()
+            if record is None:
+                return
+            self.events += 1
+            self.out.write(json.dumps(record, separators=(',', ':')) + "\n")
+            self.out.flush()
+
+    async def run(self, timeout=None):
+        """
+        Watch every task until all are terminal (or the timeout expires).
+
+        Returns:
+            True if all tasks reached a terminal status
+        """
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=self.concurrency + 4))
+        queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        def emit(record):
+            loop.call_soon_threadsafe(queue.put_nowait, record)
+
+        writer = asyncio.create_task(self._writer(queue))
+        watchers = [asyncio.create_task(self._watch(task_id, semaphore, emit, loop))
+                    for task_id in self.task_ids]
+        try:
+            await asyncio.wait_for(asyncio.gather(*watchers), timeout=timeout)
+            finished = True
+        except asyncio.TimeoutError:
+            finished = False
+        finally:
+            self._stopping = True
+            for response in list(self._responses.values()):
+                response.close()  # Unblock reader threads
+            for watcher in watchers:
+                watcher.cancel()
+            await asyncio.sleep(0)  # Let threads deliver their last events
+            queue.put_nowait(None)
+            await writer
+        return finished
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Watch update streams for many tasks (merged NDJSON)')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--task-ids', nargs='+', help='Task IDs to watch')
+    source.add_argument('--from-file', help='File with task IDs (one per line, or JSON list)')
+    parser.add_argument('--concurrency', type=int, default=CONCURRENCY,
+                        help=f'Max open SSE connections (default: {CONCURRENCY})')
+    parser.add_argument('--timeout', type=int, help='Stop after N seconds overall')
+    parser.add_argument('--read-timeout', type=int, default=READ_TIMEOUT,
+                        help=f'Reconnect after N idle seconds on a stream (default: {READ_TIMEOUT})')
+    parser.add_argument('--output', '-o', help='NDJSON output file (default: stdout)')
+    args = parser.parse_args()
+
+    try:
+        task_ids = args.task_ids or load_task_ids(args.from_file)
+        if not task_ids:
+            print("[ERROR] No task IDs to watch", file=sys.stderr)
+            sys.exit(1)
+
+        client = BeamClient(pool_maxsize=max(POOL_MAXSIZE, args.concurrency))
+        out = open(args.output, 'a', encoding='utf-8') if args.output else sys.stdout
+        watcher = TaskWatcher(client, task_ids, out, args.concurrency, args.read_timeout)
+
+        print(f"[INFO] Watching {len(watcher.task_ids)} tasks "
+              f"({min(args.concurrency, len(watcher.task_ids))} concurrent streams)", file=sys.stderr)
+        started = time.perf_counter()
+        try:
+            finished = asyncio.run(watcher.run(timeout=args.timeout))
+        finally:
+            if args.output:
+                out.close()
+            client.close()
+
+        counts = {}
+        for status in watcher.final_status.values():
+            counts[status] = counts.get(status, 0) + 1
+        summary = ", ".join(f"{status}: {n}" for status, n in sorted(counts.items())) or "none"
+        print(f"[{'OK' if finished else 'INFO'}] {len(watcher.final_status)}/{len(watcher.task_ids)} tasks terminal "
+              f"({summary}); {watcher.events} events, {watcher.reconnects} reconnects, "
+              f"{time.perf_counter() - started:.1f}s", file=sys.stderr)
+        if not finished:
+            pending = [t for t in watcher.task_ids if t not in watcher.final_status]
+            print(f"[INFO] Timed out with {len(pending)} tasks still running", file=sys.stderr)
+            sys.exit(2)
+
+    except KeyboardInterrupt:
+        print("\nWatch stopped by user", file=sys.stderr)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+archive-project.py - Pack projects into compressed archives and restore them on demand
+
+Usage:
+    python archive-project.py archive --project <project-id>            # Pack into 05-archived/
+    python archive-project.py archive --project 01 --format gz           # gzip instead of xz
+    python archive-project.py list                                       # List archived projects
+    python archive-project.py restore --project <project-id>            # Extract back to 02-projects/
+
+Purpose:
+    Archived projects used to be moved folder-by-folder into 05-archived/, so
+    they still cost a full walk in every project/workspace scan. This script
+    packs a project into a single compressed tarball (stdlib tarfile + lzma or
+    gzip) with a small JSON sidecar manifest next to it:
+
+        05-archived/
+        ├── 03-website-redesign.tar.xz
+        └── 03-website-redesign.manifest.json
+
+    The manifest carries the overview.md frontmatter and final progress, so
+    "list archived" never has to decompress anything.
+
+Crash-safety:
+    The archive and manifest are written to temp files and atomically renamed.
+    The project folder is only removed after the archive has been verified.
+    Restore extracts into a temp folder that is renamed into place.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tarfile
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+ARCHIVE_DIR = "05-archived"
+PROJECTS_DIR = "02-projects"
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+ARCHIVE_FORMATS = {
+    "xz": {"mode": "w:xz", "suffix": ".tar.xz"},
+    "gz": {"mode": "w:gz", "suffix": ".tar.gz"},
+}
+
+
+def find_project_path(base: Path, project_id: str) -> Optional[Path]:
+    """
+    Resolve a project ID to its folder under 02-projects/.
+
+    Args:
+        base: Base path to Nexus
+        project_id: Project identifier (e.g., "01-first-project" or just "01")
+
+    Returns:
+        Path to the project directory, or None if not found
+    """
+    possible_folders = [
+        base / PROJECTS_DIR / project_id,  # Full ID provided
+        base / PROJECTS_DIR / f"{project_id.zfill(2)}-*",  # Just number provided
+        base / PROJECTS_DIR / "00-onboarding" / project_id,  # Onboarding subfolder
+        base / PROJECTS_DIR / "00-onboarding" / f"{project_id.zfill(2)}-*",  # Onboarding with number
+    ]
+
+    for pattern in possible_folders:
+        matches = [m for m in base.glob(str(pattern.relative_to(base))) if m.is_dir()]
+        if matches:
+            return matches[0]
+
+    return None
+
+
+def read_frontmatter(overview_file: Path) -> Dict[str, Any]:
+    """Parse YAML frontmatter from overview.md (dates converted to ISO strings)."""
+    if not overview_file.exists():
+        return {}
+
+    content = overview_file.read_text(encoding="utf-8")
+    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+    if not match:
+        return {}
+
+    metadata = yaml.safe_load(match.group(1)) or {}
+    for key, value in metadata.items():
+        if hasattr(value, "isoformat"):
+            metadata[key] = value.isoformat()
+    return metadata
+
+
+def count_progress(project_path: Path) -> Dict[str, Any]:
+    """Count checkboxes in steps.md (or legacy tasks.md)."""
+    planning_dir = project_path / "01-planning"
+    for name in ("steps.md", "tasks.md"):
+        task_file = planning_dir / name
+        if task_file.exists():
+            content = task_file.read_text(encoding="utf-8")
+            completed = len(re.findall(r"^\s*-\s*\[x\]", content, re.MULTILINE | re.IGNORECASE))
+            uncompleted = len(re.findall(r"^\s*-\s*\[\s\]", content, re.MULTILINE))
+            total = completed + uncompleted
+            return {
+                "tasks_total": total,
+                "tasks_completed": completed,
+                "progress": round(completed / total, 3) if total > 0 else 0.0,
+            }
+
+    return {"tasks_total": 0, "tasks_completed": 0, "progress": 0.0}
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def archive_paths(archive_dir: Path, name: str, fmt: str) -> Tuple[Path, Path]:
+    """Return (archive file, manifest file) for a project folder name."""
+    return (
+        archive_dir / f"{name}{ARCHIVE_FORMATS[fmt]['suffix']}",
+        archive_dir / f"{name}{MANIFEST_SUFFIX}",
+    )
+
+
+def archive_project(
+    project_id: str,
+    base_path: str = ".",
+    fmt: str = "xz",
+    keep: bool = False,
+    no_confirm: bool = False,
+) -> bool:
+    """
+    Pack a project into 05-archived/<name>.tar.<fmt> plus a sidecar manifest.
+
+    Args:
+        project_id: Project identifier (e.g., "01-first-project" or just "01")
+        base_path: Base path to Nexus
+        fmt: Compression format ("xz" or "gz")
+        keep: If True, leave the project folder in place after packing
+        no_confirm: If True, skip confirmation prompt (for AI automation)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    base = Path(base_path)
+    project_path = find_project_path(base, project_id)
+
+    if not project_path:
+        print(f"[ERROR] Project not found: {project_id}")
+        print(f"[INFO] Searched in: {PROJECTS_DIR}/")
+        return False
+
+    archive_dir = base / ARCHIVE_DIR
+    archive_file, manifest_file = archive_paths(archive_dir, project_path.name, fmt)
+
+    if manifest_file.exists():
+        print(f"[ERROR] {project_path.name} is already archived: {manifest_file.relative_to(base)}")
+        return False
+
+    frontmatter = read_frontmatter(project_path / "01-planning" / "overview.md")
+    progress = count_progress(project_path)
+
+    print(f"Project: {frontmatter.get('name', project_path.name)}")
+    print(f"Progress: {progress['tasks_completed']}/{progress['tasks_total']} tasks "
+          f"({progress['progress'] * 100:.0f}%)")
+    print(f"Status: {frontmatter.get('status', 'UNKNOWN')}")
+    print()
+
+    if not no_confirm:
+        response = input(f"Archive {project_path.name} to {archive_file.relative_to(base)}? (y/n): ").strip().lower()
+        if response != "y":
+            print("[CANCELLED] No changes made")
+            return False
+
+    archive_dir.mkdir(parents=True, exist_ok=True)
+
+    # Pack into a temp file, then verify and atomically rename
+    fd, tmp_name = tempfile.mkstemp(dir=archive_dir, prefix=f".{archive_file.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        file_count = 0
+        original_bytes = 0
+        with tarfile.open(tmp_name, ARCHIVE_FORMATS[fmt]["mode"]) as tar:
+            for path in sorted(project_path.rglob("*")):
+                if path.is_file():
+                    file_count += 1
+                    original_bytes += path.stat().st_size
+            tar.add(project_path, arcname=project_path.name)
+
+        with tarfile.open(tmp_name, "r:*") as tar:
+            packed_files = sum(1 for member in tar if member.isfile())
+        if packed_files != file_count:
+            raise RuntimeError(f"archive verification failed ({packed_files}/{file_count} files)")
+
+        os.replace(tmp_name, archive_file)
+    except BaseException as e:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        if isinstance(e, Exception):
+            print(f"[ERROR] Failed to pack {project_path.name}: {e}")
+            return False
+        raise
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "name": project_path.name,
+        "archive": archive_file.name,
+        "format": fmt,
+        "archived": date.today().isoformat(),
+        "source": project_path.relative_to(base).as_posix(),
+        "frontmatter": frontmatter,
+        **progress,
+        "file_count": file_count,
+        "original_bytes": original_bytes,
+        "archive_bytes": archive_file.stat().st_size,
+        "sha256": sha256_file(archive_file),
+    }
+    write_json_atomic(manifest_file, manifest)
+
+    if not keep:
+        shutil.rmtree(project_path)
+
+    ratio = manifest["archive_bytes"] / original_bytes * 100 if original_bytes else 0
+    print(f"[SUCCESS] Archived: {project_path.name}")
+    print(f"Location: {archive_file.relative_to(base)} ({file_count} files, "
+          f"{original_bytes:,} -> {manifest['archive_bytes']:,} bytes, {ratio:.0f}%)")
+    print(f"Manifest: {manifest_file.relative_to(base)}")
+    return True
+
+
+def list_archived(base_path: str = ".") -> List[Dict[str, Any]]:
+    """
+    List archived projects from their manifests (no decompression).
+
+    Legacy archives (plain folders moved into 05-archived/) are included too,
+    read from their overview.md.
+
+    Returns:
+        List of archived project summaries
+    """
+    base = Path(base_path)
+    archive_dir = base / ARCHIVE_DIR
+    if not archive_dir.exists():
+        return []
+
+    archived = []
+    for manifest_file in sorted(archive_dir.glob(f"*{MANIFEST_SUFFIX}")):
+        try:
+            manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            archived.append({"name": manifest_file.name, "error": str(e)})
+            continue
+        frontmatter = manifest.get("frontmatter", {})
+        archived.append({
+            "id": frontmatter.get("id", manifest.get("name")),
+            "name": frontmatter.get("name", manifest.get("name")),
+            "status": frontmatter.get("status"),
+            "archived": manifest.get("archived"),
+            "progress": manifest.get("progress"),
+            "tasks_total": manifest.get("tasks_total"),
+            "tasks_completed": manifest.get("tasks_completed"),
+            "archive": f"{ARCHIVE_DIR}/{manifest.get('archive')}",
+            "compressed": True,
+        })
+
+    for overview_file in sorted(archive_dir.glob("*/01-planning/overview.md")):
+        project_path = overview_file.parent.parent
+        frontmatter = read_frontmatter(overview_file)
+        progress = count_progress(project_path)
+        archived.append({
+            "id": frontmatter.get("id", project_path.name),
+            "name": frontmatter.get("name", project_path.name),
+            "status": frontmatter.get("status"),
+            "archived": frontmatter.get("archived"),
+            **progress,
+            "archive": f"{ARCHIVE_DIR}/{project_path.name}/",
+            "compressed": False,
+        })
+
+    return archived
+
+
+def _find_manifest(archive_dir: Path, project_id: str) -> Optional[Path]:
+    for pattern in (f"{project_id}{MANIFEST_SUFFIX}", f"{project_id.zfill(2)}-*{MANIFEST_SUFFIX}"):
+        matches = sorted(archive_dir.glob(pattern))
+        if matches:
+            return matches[0]
+    return None
+
+
+def _safe_members(tar: tarfile.TarFile, root_name: str):
+    """Yield only regular members that stay inside the project folder."""
+    for member in tar:
+        parts = Path(member.name).parts
+        if not parts or parts[0] != root_name or ".." in parts or Path(member.name).is_absolute():
+            raise RuntimeError(f"unsafe path in archive: {member.name}")
+        if not (member.isfile() or member.isdir()):
+            continue
+        yield member
+
+
+def restore_project(project_id: str, base_path: str = ".", keep_archive: bool = False) -> bool:
+    """
+    Extract an archived project back to its original location.
+
+    Args:
+        project_id: Project identifier (e.g., "01-first-project" or just "01")
+        base_path: Base path to Nexus
+        keep_archive: If True, keep the archive and manifest after restoring
+
+    Returns:
+        True if successful, False otherwise
+    """
+    base = Path(base_path)
+    archive_dir = base / ARCHIVE_DIR
+    manifest_file = _find_manifest(archive_dir, project_id) if archive_dir.exists() else None
+
+    if not manifest_file:
+        print(f"[ERROR] No archive found for: {project_id}")
+        print(f"[INFO] Searched in: {ARCHIVE_DIR}/ (run 'list' to see archived projects)")
+        return False
+
+    manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+    archive_file = archive_dir / manifest["archive"]
+    destination = base / manifest.get("source", f"{PROJECTS_DIR}/{manifest['name']}")
+
+    if destination.exists():
+        print(f"[ERROR] Destination already exists: {destination.relative_to(base)}")
+        return False
+
+    if manifest.get("sha256") and sha256_file(archive_file) != manifest["sha256"]:
+        print(f"[ERROR] Checksum mismatch for {archive_file.name} - archive may be corrupted")
+        return False
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=destination.parent, prefix=f".restore-{manifest['name']}."))
+    try:
+        with tarfile.open(archive_file, "r:*") as tar:
+            extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+            tar.extractall(staging, members=_safe_members(tar, manifest["name"]), **extract_kwargs)
+        os.replace(staging / manifest["name"], destination)
+    except Exception as e:
+        print(f"[ERROR] Failed to restore {manifest['name']}: {e}")
+        return False
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    if not keep_archive:
+        archive_file.unlink()
+        manifest_file.unlink()
+
+    print(f"[SUCCESS] Restored: {manifest['name']}")
+    print(f"Location: {destination.relative_to(base)}/")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Archive projects as compressed tarballs and restore them on demand",
+        epilog="""
+Examples:
+  python archive-project.py archive --project 03 --no-confirm   # Pack 03-* into 05-archived/
+  python archive-project.py list                                # List archived (no decompression)
+  python archive-project.py list --json                         # Machine-readable list
+  python archive-project.py restore --project 03                # Extract back to 02-projects/
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--base-path", default=".", help="Base path to Nexus (default: current directory)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    archive_parser = subparsers.add_parser("archive", help="Pack a project into 05-archived/")
+    archive_parser.add_argument("--project", required=True, help="Project ID (e.g., 01-first-project or just 01)")
+    archive_parser.add_argument("--format", choices=sorted(ARCHIVE_FORMATS), default="xz",
+                                help="Compression: xz (smaller, default) or gz (faster)")
+    archive_parser.add_argument("--keep", action="store_true", help="Keep the project folder after packing")
+    archive_parser.add_argument("--no-confirm", action="store_true",
+                                help="Skip confirmation prompt (for AI automation)")
+
+    list_parser = subparsers.add_parser("list", help="List archived projects from their manifests")
+    list_parser.add_argument("--json", action="store_true", help="Output JSON")
+
+    restore_parser = subparsers.add_parser("restore", help="Extract an archived project")
+    restore_parser.add_argument("--project", required=True, help="Project ID (e.g., 01-first-project or just 01)")
+    restore_parser.add_argument("--keep-archive", action="store_true",
+                                help="Keep the archive and manifest after restoring")
+
+    args = parser.parse_args()
+
+    if args.command == "archive":
+        success = archive_project(args.project, args.base_path, args.format, args.keep, args.no_confirm)
+    elif args.command == "restore":
+        success = restore_project(args.project, args.base_path, args.keep_archive)
+    else:
+        archived = list_archived(args.base_path)
+        if args.json:
+            print(json.dumps(archived, indent=2, ensure_ascii=False))
+        elif not archived:
+            print(f"[INFO] No archived projects in {ARCHIVE_DIR}/")
+        else:
+            print(f"Archived projects ({len(archived)}):")
+            for project in archived:
+                if "error" in project:
+                    print(f"  [!] {project['name']}: {project['error']}")
+                    continue
+                progress = project.get("progress") or 0
+                kind = "packed" if project["compressed"] else "folder"
+                print(f"  {project['id']} - {project['name']} "
+                      f"({project.get('tasks_completed', 0)}/{project.get('tasks_total', 0)}, "
+                      f"{progress * 100:.0f}%) archived {project.get('archived') or '?'} [{kind}]")
+        success = True
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ Usage:
     python bulk-complete.py --project 01 --tasks 1-5,7,10-15          # Complete specific tasks
     python bulk-complete.py --project 01 --section 3                  # Complete all in Section 3
     python bulk-complete.py --project 01 --section "Section 4"        # Complete all in Section 4
+    python bulk-complete.py --batch projects.txt                      # Many projects, JSON report
+    cat projects.txt | python bulk-complete.py --batch -              # Batch from stdin
 
 Purpose:
     Quickly mark tasks in a project's steps.md or tasks.md as complete.
@@ -27,15 +29,28 @@ Use When:
     - Individual tasks are complete (use --tasks)
     - Interactive selection needed (run without flags)
 
+Batch Mode:
+    - One project per line: "01", "02 1-5,7", "03 section:Phase 2" (or JSON objects)
+    - Each task file is rewritten in a single streaming pass to a temp file,
+      then atomically renamed over the original (no half-written steps.md)
+    - Projects are processed in parallel (--workers)
+    - Prints one JSON report with per-project and combined before/after progress
+
 Performance:
     - Completes 100 tasks in <1 second
     - Single file operation (read → replace → write)
 """
 
+import contextlib
+import json
+import os
+import shutil
 import sys
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Set
+from typing import Iterable, List, Tuple, Set
 
 
 def find_task_file(project_path: Path) -> Path:
@@ -65,6 +80,33 @@ def find_task_file(project_path: Path) -> Path:
     return None
 
 
+def find_project_path(base: Path, project_id: str) -> Path:
+    """
+    Resolve a project ID to its folder under 02-projects/.
+
+    Args:
+        base: Base path to Nexus-v3
+        project_id: Project identifier (e.g., "01-first-project" or just "01")
+
+    Returns:
+        Path to the project directory, or None if not found
+    """
+    # Find project folder - try multiple patterns
+    possible_folders = [
+        base / "02-projects" / project_id,  # Full ID provided
+        base / "02-projects" / f"{project_id.zfill(2)}-*",  # Just number provided
+        base / "02-projects" / "00-onboarding" / project_id,  # Onboarding subfolder
+        base / "02-projects" / "00-onboarding" / f"{project_id.zfill(2)}-*",  # Onboarding with number
+    ]
+
+    for pattern in possible_folders:
+        matches = list(base.glob(str(pattern.relative_to(base))))
+        if matches and matches[0].exists():
+            return matches[0]
+
+    return None
+
+
 def extract_tasks(content: str) -> List[Tuple[int, str, bool]]:
     """
     Extract all tasks with their line numbers and completion status.
@@ -197,6 +239,22 @@ def count_tasks(content: str) -> tuple[int, int]:
     return uncompleted, completed
 
 
+def atomic_write_text(path: Path, content: str):
+    """Write content to a temp file beside path, then atomically replace it."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
 def bulk_complete_tasks(
     project_id: str,
     base_path: str = ".",
@@ -222,23 +280,9 @@ def bulk_complete_tasks(
         True if successful, False otherwise
     """
     base = Path(base_path)
+    project_path = find_project_path(base, project_id)
 
-    # Find project folder - try multiple patterns
-    possible_folders = [
-        base / "02-projects" / project_id,  # Full ID provided
-        base / "02-projects" / f"{project_id.zfill(2)}-*",  # Just number provided
-        base / "02-projects" / "00-onboarding" / project_id,  # Onboarding subfolder
-        base / "02-projects" / "00-onboarding" / f"{project_id.zfill(2)}-*",  # Onboarding with number
-    ]
-
-    project_path = None
-    for pattern in possible_folders:
-        matches = list(base.glob(str(pattern.relative_to(base))))
-        if matches:
-            project_path = matches[0]
-            break
-
-    if not project_path or not project_path.exists():
+    if not project_path:
         print(f"[ERROR] Project not found: {project_id}")
         print(f"[INFO] Searched in: 02-projects/")
         return False
@@ -377,8 +421,8 @@ def bulk_complete_tasks(
 
         updated_content = '\n'.join(lines)
 
-        # Write updated content
-        task_file.write_text(updated_content, encoding='utf-8')
+        # Write updated content (temp file + atomic rename)
+        atomic_write_text(task_file, updated_content)
 
         # VALIDATE by re-reading file (CRITICAL for evidence)
         try:
@@ -401,6 +445,262 @@ def bulk_complete_tasks(
         return False
 
 
+# ============================================================================
+# BATCH MODE
+# ============================================================================
+
+def parse_batch_entries(lines: Iterable[str]) -> List[dict]:
+    """
+    Parse batch input into a list of {project, all, tasks, section} entries.
+
+    Each non-empty line (lines starting with # are ignored) is either a JSON
+    object like {"project": "01", "section": "Phase 2"} or plain text:
+
+        01                      # Complete all tasks (default)
+        01 all                  # Complete all tasks
+        02 1-5,7,10-15          # Complete specific tasks
+        03 section:Phase 2      # Complete all tasks in a section
+
+    A whole-file JSON array of objects is also accepted.
+
+    Returns:
+        List of entry dicts (exactly one of all/tasks/section is set)
+    """
+    text = ''.join(lines).strip()
+    if text.startswith('['):
+        raw_entries = json.loads(text)
+    else:
+        raw_entries = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('{'):
+                raw_entries.append(json.loads(line))
+                continue
+            project, _, selection = line.partition(' ')
+            selection = selection.strip()
+            if not selection or selection.lower() == 'all':
+                raw_entries.append({'project': project, 'all': True})
+            elif selection.lower().startswith('section:'):
+                raw_entries.append({'project': project, 'section': selection[len('section:'):].strip()})
+            else:
+                raw_entries.append({'project': project, 'tasks': selection})
+
+    entries = []
+    for raw in raw_entries:
+        if 'project' not in raw:
+            raise ValueError(f"Batch entry missing 'project': {raw}")
+        entry = {
+            'project': str(raw['project']),
+            'all': bool(raw.get('all')),
+            'tasks': raw.get('tasks'),
+            'section': raw.get('section'),
+        }
+        if not (entry['tasks'] or entry['section']):
+            entry['all'] = True
+        entries.append(entry)
+
+    return entries
+
+
+def _section_patterns(section_name: str) -> List[re.Pattern]:
+    """Header patterns for a section (mirrors extract_section_tasks)."""
+    section_num = section_name.replace('Section', '').replace('section', '').replace('Phase', '').replace('phase', '').strip()
+    return [
+        re.compile(rf'^##\s+(Section|Phase)\s+{re.escape(section_num)}(?:[:\s]|$)', re.IGNORECASE),
+        re.compile(rf'^##\s+{re.escape(section_name)}\s*$', re.IGNORECASE),
+    ]
+
+
+def stream_complete_tasks(task_file: Path, selections: List[dict]) -> dict:
+    """
+    Mark selected tasks complete in a single streaming pass.
+
+    Lines are read one at a time and written to a temp file next to the task
+    file, which then atomically replaces it (os.replace). A crash at any point
+    leaves either the old or the new file - never a half-written one.
+
+    Args:
+        task_file: Path to steps.md or tasks.md
+        selections: Entries from parse_batch_entries(); a task is completed if
+                    ANY selection matches it
+
+    Returns:
+        Dict with before/after counts and the task numbers that were marked
+    """
+    unchecked_re = re.compile(r'^(\s*)- \[ \] (.+)$')
+    checked_re = re.compile(r'^(\s*)- \[x\] (.+)$', re.IGNORECASE)
+    next_section_re = re.compile(r'^##\s+(Section\s+\d+|Phase\s+\d+|[A-Z])', re.IGNORECASE)
+
+    complete_all = any(sel['all'] for sel in selections)
+    task_numbers = set()
+    for sel in selections:
+        if sel.get('task_numbers'):
+            task_numbers |= sel['task_numbers']
+    # Per-section state: 'before' -> 'in' -> 'after'
+    sections = [
+        {'patterns': _section_patterns(sel['section']), 'state': 'before'}
+        for sel in selections if sel['section']
+    ]
+
+    before = {'uncompleted': 0, 'completed': 0}
+    after = {'uncompleted': 0, 'completed': 0}
+    marked = []
+    task_num = 0
+
+    fd, tmp_name = tempfile.mkstemp(dir=task_file.parent, prefix=f".{task_file.name}.", suffix='.tmp')
+    try:
+        with open(task_file, 'r', encoding='utf-8', newline='') as src, \
+                os.fdopen(fd, 'w', encoding='utf-8', newline='') as dst:
+            for line in src:
+                body = line.rstrip('\r\n')
+
+                for section in sections:
+                    if section['state'] != 'after' and any(p.search(body) for p in section['patterns']):
+                        section['state'] = 'in'
+                    elif section['state'] == 'in' and next_section_re.search(body):
+                        section['state'] = 'after'
+
+                if unchecked_re.match(body):
+                    task_num += 1
+                    before['uncompleted'] += 1
+                    selected = (
+                        complete_all
+                        or task_num in task_numbers
+                        or any(section['state'] == 'in' for section in sections)
+                    )
+                    if selected:
+                        line = re.sub(r'- \[ \]', '- [x]', line)
+                        marked.append(task_num)
+                        after['completed'] += 1
+                    else:
+                        after['uncompleted'] += 1
+                elif checked_re.match(body):
+                    task_num += 1
+                    before['completed'] += 1
+                    after['completed'] += 1
+
+                dst.write(line)
+
+            dst.flush()
+            os.fsync(dst.fileno())
+
+        if marked:
+            shutil.copymode(task_file, tmp_name)
+            os.replace(tmp_name, task_file)
+        else:
+            os.unlink(tmp_name)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+    for counts in (before, after):
+        counts['total'] = counts['uncompleted'] + counts['completed']
+
+    return {'before': before, 'after': after, 'marked': marked}
+
+
+def _resolve_batch_project(base: Path, project_id: str) -> dict:
+    """Resolve a batch project ID to its folder and task file (a result with 'error' if either is missing)."""
+    result = {'project': project_id, 'status': 'error'}
+
+    project_path = find_project_path(base, project_id)
+    if not project_path:
+        result['error'] = f"Project not found: {project_id}"
+        return result
+    result['project'] = project_path.name
+
+    task_file = find_task_file(project_path)
+    if not task_file:
+        result['error'] = "No task file found (expected steps.md or tasks.md in 01-planning/)"
+        return result
+    result['task_file'] = task_file
+    return result
+
+
+def _process_batch_project(base: Path, resolved: dict, selections: List[dict]) -> dict:
+    """Stream-complete one resolved project's task file (worker body)."""
+    result = dict(resolved)
+    if 'error' in result:
+        return result
+    task_file = result['task_file']
+    result['task_file'] = str(task_file.relative_to(base))
+
+    try:
+        result.update(stream_complete_tasks(task_file, selections))
+    except Exception as e:
+        result['error'] = f"Failed to update tasks: {e}"
+        return result
+
+    result['status'] = 'updated' if result['marked'] else 'unchanged'
+    return result
+
+
+def bulk_complete_batch(entries: List[dict], base_path: str = ".", max_workers: int = 4) -> dict:
+    """
+    Complete tasks across many projects in parallel.
+
+    Entries are grouped by the task file their project resolves to, so
+    entries naming the same project differently ("1", "01-first-project")
+    are merged and each task file is rewritten exactly once.
+
+    Args:
+        entries: Output of parse_batch_entries()
+        base_path: Base path to Nexus-v3
+        max_workers: Number of projects processed concurrently
+
+    Returns:
+        JSON-serialisable report with per-project and combined progress
+    """
+    base = Path(base_path)
+
+    resolved = {}  # Project ID as given -> _resolve_batch_project() result
+    grouped = {}   # Resolved task file (or unresolved project ID) -> (resolved, selections)
+    for entry in entries:
+        selection = dict(entry)
+        if selection['tasks']:
+            # Warnings from parse_task_selection must not corrupt the JSON report
+            with contextlib.redirect_stdout(sys.stderr):
+                selection['task_numbers'] = parse_task_selection(selection['tasks'], sys.maxsize)
+        project_id = entry['project']
+        if project_id not in resolved:
+            resolved[project_id] = _resolve_batch_project(base, project_id)
+        project = resolved[project_id]
+        key = project['task_file'].resolve() if 'task_file' in project else ('unresolved', project_id)
+        grouped.setdefault(key, (project, []))[1].append(selection)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            executor.submit(_process_batch_project, base, project, selections)
+            for project, selections in grouped.values()
+        ]
+        projects = [future.result() for future in futures]
+
+    combined = {
+        key: {'uncompleted': 0, 'completed': 0, 'total': 0}
+        for key in ('before', 'after')
+    }
+    for project in projects:
+        for key in ('before', 'after'):
+            for field in combined[key]:
+                combined[key][field] += project.get(key, {}).get(field, 0)
+
+    return {
+        'projects': projects,
+        'summary': {
+            'projects': len(projects),
+            'updated': sum(1 for p in projects if p['status'] == 'updated'),
+            'unchanged': sum(1 for p in projects if p['status'] == 'unchanged'),
+            'errors': sum(1 for p in projects if p['status'] == 'error'),
+            'tasks_marked': sum(len(p.get('marked', [])) for p in projects),
+            'before': combined['before'],
+            'after': combined['after'],
+        },
+    }
+
+
 def main():
     import argparse
 
@@ -413,6 +713,8 @@ Examples:
   python bulk-complete.py --project 01 --tasks 1-5,7,10-15  # Complete specific tasks
   python bulk-complete.py --project 01 --section 3          # Complete Section 3
   python bulk-complete.py --project 01 --section "Phase 2"  # Complete Phase 2 (new format)
+  python bulk-complete.py --batch projects.txt              # Batch mode (JSON report)
+  python bulk-complete.py --batch - < projects.txt          # Batch mode from stdin
 
 Version 2.0 Features:
   - Auto-detects steps.md (new projects) or tasks.md (legacy/onboarding)
@@ -423,9 +725,19 @@ Version 2.0 Features:
     )
     parser.add_argument(
         '--project',
-        required=True,
         help='Project ID (e.g., 01-first-project or just 01)'
     )
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        help='Batch file of projects and selections ("-" for stdin); implies --no-confirm'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Projects processed in parallel in batch mode (default: 4)'
+    )
     parser.add_argument(
         '--all',
         action='store_true',
@@ -454,6 +766,24 @@ Version 2.0 Features:
 
     args = parser.parse_args()
 
+    if args.batch:
+        try:
+            if args.batch == '-':
+                entries = parse_batch_entries(sys.stdin)
+            else:
+                with open(args.batch, 'r', encoding='utf-8') as f:
+                    entries = parse_batch_entries(f)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Failed to read batch input: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        report = bulk_complete_batch(entries, base_path=args.base_path, max_workers=args.workers)
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if report['summary']['errors'] else 0)
+
+    if not args.project:
+        parser.error('--project is required (or use --batch)')
+
     print("Bulk Task Completion Tool V2.0 (steps.md + tasks.md support)")
     print("=" * 60)
     print()
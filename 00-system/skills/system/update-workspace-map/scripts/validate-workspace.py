@@ -8,17 +8,35 @@ This script:
 3. Identifies discrepancies (missing, extra, stale entries)
 4. Outputs JSON report for AI to process
 
+Incremental scanning:
+    The scan is persisted as a directory-hash tree in 04-workspace/.workspace-scan.json.
+    Each directory node stores its own mtime, its child files (mtime/size) and child
+    directories, plus a hash over all of them (a Merkle tree). On re-validation a
+    directory whose mtime is unchanged is not re-listed (its known files are only
+    re-stat'ed, since editing a file in place does not bump the directory mtime);
+    only changed subtrees are re-hashed, and the report lists which subtrees changed.
+
 Usage:
     python validate-workspace.py
-    python validate-workspace.py --auto-fix  # Generate updated map content
+    python validate-workspace.py --auto-fix  # Emit a minimal patch for workspace-map.md
+    python validate-workspace.py --auto-fix --apply  # ...and apply it
+    python validate-workspace.py --full      # Ignore the persisted scan state
 """
 
 import os
 import json
 import sys
 import re
+import difflib
+import hashlib
+import argparse
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+SCAN_STATE_FILE = '.workspace-scan.json'
+SCAN_STATE_VERSION = 1
+MAX_SCAN_DEPTH = 3  # root -> level 1 -> level 2 -> level 3 (see SKILL.md)
 
 def get_workspace_root() -> Path:
     """Find workspace root (contains 04-workspace/)."""
@@ -29,51 +47,159 @@ def get_workspace_root() -> Path:
         current = current.parent
     raise FileNotFoundError("Could not find workspace root (no 04-workspace/ found)")
 
-def scan_workspace(workspace_path: Path) -> Dict:
+def hash_node(files: Dict[str, List[int]], dirs: Dict[str, Optional[Dict]]) -> str:
+    """Hash a directory from its child names/mtimes/sizes and child directory hashes."""
+    digest = hashlib.sha1()
+    for name in sorted(files):
+        mtime_ns, size = files[name]
+        digest.update(f"f:{name}:{mtime_ns}:{size}\n".encode('utf-8'))
+    for name in sorted(dirs):
+        child = dirs[name]
+        digest.update(f"d:{name}:{child['hash'] if child else ''}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def scan_tree(path: Path, cached: Optional[Dict], depth: int, stats: Dict, rel: str = '') -> Dict:
+    """
+    Build (or incrementally refresh) the directory-hash node for path.
+
+    A directory whose own mtime matches the cached node keeps its cached
+    listing - adding, removing or renaming an entry always bumps the parent
+    directory's mtime, so only changed directories are re-listed. The cached
+    files are re-stat'ed (an in-place edit only changes the file's own
+    mtime/size), and child directories are still visited (down to
+    MAX_SCAN_DEPTH) because their changes don't propagate to the parent's mtime.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+
+    files = None
+    if cached and cached.get('mtime_ns') == mtime_ns:
+        files = {}
+        for name in cached['files']:
+            try:
+                st = (path / name).stat()
+            except OSError:
+                files = None  # Listing changed within the mtime granularity: re-list
+                break
+            files[name] = [st.st_mtime_ns, st.st_size]
+
+    if files is not None:
+        dir_names = list(cached['dirs'])
+        stats['dirs_reused'] += 1
+    else:
+        files = {}
+        dir_names = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):  # Skip hidden
+                        continue
+                    if depth == 0 and entry.name == 'workspace-map.md':  # Skip the map itself
+                        continue
+                    if entry.is_dir():
+                        dir_names.append(entry.name)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        files[entry.name] = [st.st_mtime_ns, st.st_size]
+        except PermissionError:
+            pass
+        stats['dirs_listed'] += 1
+
+    dirs = {}
+    cached_dirs = (cached or {}).get('dirs', {})
+    for name in dir_names:
+        if depth + 1 < MAX_SCAN_DEPTH:
+            dirs[name] = scan_tree(path / name, cached_dirs.get(name), depth + 1, stats, f"{rel}{name}/")
+        else:
+            dirs[name] = None  # Beyond scan depth: name only
+
+    node = {
+        'mtime_ns': mtime_ns,
+        'files': files,
+        'dirs': dirs,
+        'hash': hash_node(files, dirs),
+    }
+
+    if not cached or cached.get('hash') != node['hash']:
+        # Record only the deepest changed subtrees
+        changed = stats['changed_subtrees']
+        if not any(c.startswith(rel) for c in changed if c != rel):
+            changed.append(rel or './')
+
+    return node
+
+
+def load_scan_state(state_path: Path) -> Optional[Dict]:
+    """Load the persisted directory-hash tree (None if missing or outdated)."""
+    try:
+        state = json.loads(state_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if state.get('version') != SCAN_STATE_VERSION or state.get('max_depth') != MAX_SCAN_DEPTH:
+        return None
+    return state.get('tree')
+
+
+def save_scan_state(state_path: Path, tree: Dict) -> None:
+    """
+    Persist the directory-hash tree (best effort).
+
+    Written in place rather than via temp file + rename: renaming would bump
+    04-workspace/'s mtime and force a re-listing of the root on every run. A
+    torn write is harmless - load_scan_state() then falls back to a full scan.
+    """
+    state = {'version': SCAN_STATE_VERSION, 'max_depth': MAX_SCAN_DEPTH, 'tree': tree}
+    try:
+        state_path.write_text(json.dumps(state), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def scan_workspace(workspace_path: Path, incremental: bool = True) -> Dict:
     """Scan 04-workspace/ and return structure."""
     if not workspace_path.exists():
         return {"folders": [], "files": {}, "structure": {}}
 
+    state_path = workspace_path / SCAN_STATE_FILE
+    cached = load_scan_state(state_path) if incremental else None
+
+    stats = {'dirs_listed': 0, 'dirs_reused': 0, 'changed_subtrees': []}
+    tree = scan_tree(workspace_path, cached, 0, stats)
+    if not cached or cached.get('hash') != tree['hash'] or stats['dirs_listed']:
+        save_scan_state(state_path, tree)
+
     folders = []
     files = {}
     structure = {}
 
-    # Scan top-level folders
-    for item in workspace_path.iterdir():
-        if item.name.startswith('.'):  # Skip hidden
-            continue
-        if item.name == 'workspace-map.md':  # Skip the map itself
-            continue
-
-        if item.is_dir():
-            folder_name = item.name + '/'
-            folders.append(folder_name)
+    # Top-level folders
+    for name, node in tree['dirs'].items():
+        folder_name = name + '/'
+        folders.append(folder_name)
 
-            # Scan files in this folder
-            folder_files = []
-            folder_subfolders = []
+        folder_files = sorted(node['files']) if node else []
+        folder_subfolders = sorted(sub + '/' for sub in node['dirs']) if node else []
 
-            try:
-                for subitem in item.iterdir():
-                    if subitem.name.startswith('.'):
-                        continue
-                    if subitem.is_file():
-                        folder_files.append(subitem.name)
-                    elif subitem.is_dir():
-                        folder_subfolders.append(subitem.name + '/')
-            except PermissionError:
-                pass
-
-            files[folder_name] = folder_files
-            structure[folder_name] = {
-                "files": folder_files,
-                "subfolders": folder_subfolders
-            }
+        files[folder_name] = folder_files
+        structure[folder_name] = {
+            "files": folder_files,
+            "subfolders": folder_subfolders
+        }
 
     return {
         "folders": sorted(folders),
         "files": files,
-        "structure": structure
+        "structure": structure,
+        "tree_hash": tree['hash'],
+        "scan": {
+            "incremental": cached is not None,
+            "dirs_listed": stats['dirs_listed'],
+            "dirs_reused": stats['dirs_reused'],
+            "changed_subtrees": sorted(stats['changed_subtrees']) if cached else [],
+        }
     }
 
 def parse_workspace_map(map_path: Path) -> Dict:
@@ -95,9 +221,10 @@ def parse_workspace_map(map_path: Path) -> Dict:
     if structure_match:
         structure_section = structure_match.group(1)
 
-        # Method 1: Find folders in tree structure (├──, └──)
-        tree_pattern = r'[├└]──\s+(\w[\w-]*/)'
-        for match in re.finditer(tree_pattern, structure_section):
+        # Method 1: Find top-level folders in tree structure (├──, └── at column 0;
+        # nested entries are subfolders, which the scan does not compare)
+        tree_pattern = r'^[├└]──\s+(\w[\w-]*/)'
+        for match in re.finditer(tree_pattern, structure_section, re.MULTILINE):
             folder_name = match.group(1)
             folders.add(folder_name)
 
@@ -183,16 +310,161 @@ def generate_recommendations(comparison: Dict) -> List[str]:
 
     return recs
 
+def _remove_tree_entries(block: str, folders: Set[str]) -> str:
+    """
+    Drop top-level tree entries (├──/└── name/) for the given folders, with their nested lines.
+
+    Nested entries that happen to share a stale folder's name are kept. If the
+    last top-level entry goes, the new last one gets └── and its nested lines
+    lose the │ guide.
+    """
+    kept = []
+    dropping = False
+    dropped_last = False
+    for line in block.split('\n'):
+        match = re.match(r'[├└]──\s+(\w[\w-]*/)?', line)
+        if match:  # Top-level entry (starts at column 0)
+            dropping = bool(match.group(1)) and match.group(1) in folders
+            dropped_last = dropping and line.startswith('└──')
+        elif not line.strip() or not line.startswith(('│', ' ')):
+            dropping = False
+        if not dropping:
+            kept.append(line)
+
+    if dropped_last:
+        last = max((i for i, line in enumerate(kept) if line.startswith('├──')), default=None)
+        if last is not None:
+            kept[last] = '└──' + kept[last][len('├──'):]
+            for i in range(last + 1, len(kept)):
+                if not kept[i].startswith('│'):
+                    break
+                kept[i] = ' ' + kept[i][1:]
+    return '\n'.join(kept)
+
+
+def _add_tree_entries(block: str, folders: List[str]) -> str:
+    """
+    Append top-level tree lines for the given folders, keeping └── on the last one.
+
+    The previous last entry becomes ├── and its nested lines get the │ guide back.
+    """
+    lines = block.rstrip('\n').split('\n')
+    # The previous last top-level entry is no longer last
+    for idx in range(len(lines) - 1, -1, -1):
+        if lines[idx].startswith('└──'):
+            lines[idx] = '├──' + lines[idx][len('└──'):]
+            for i in range(idx + 1, len(lines)):
+                if not lines[i].strip() or not lines[i].startswith(' '):
+                    break
+                lines[i] = '│' + lines[i][1:]
+            break
+    for i, folder in enumerate(folders):
+        connector = '└──' if i == len(folders) - 1 else '├──'
+        lines.append(f"{connector} {folder}")
+    return '\n'.join(lines) + '\n'
+
+
+def _remove_description_headings(content: str, folders: Set[str]) -> str:
+    """Drop '### folder/' entries (heading + body) from the Folder Descriptions section."""
+    section = re.search(r'## Folder Descriptions(.*?)(?=^## |\Z)', content, re.DOTALL | re.MULTILINE)
+    if not section:
+        return content
+
+    body = section.group(1)
+    for folder in folders:
+        name = re.escape(folder)
+        body = re.sub(
+            rf'^###\s+(?:\*\*{name}\*\*|{name})[^\n]*\n.*?(?=^###?\s|\Z)',
+            '',
+            body,
+            flags=re.DOTALL | re.MULTILINE
+        )
+    return content[:section.start(1)] + body + content[section.end(1):]
+
+
+def build_map_patch(map_path: Path, comparison: Dict) -> Dict:
+    """
+    Build a minimal unified-diff patch that brings workspace-map.md in sync.
+
+    Only the lines for missing/stale folders are touched: new folders are
+    appended to the "Your Workspace Structure" tree, stale ones are removed
+    from the tree and from "Folder Descriptions". Everything else in the
+    user's map is left exactly as it is.
+
+    Returns:
+        Dict with 'patch' (unified diff text) and 'content' (patched map)
+    """
+    original = map_path.read_text(encoding='utf-8') if map_path.exists() else ''
+    missing = comparison["missing_from_map"]
+    extra = set(comparison["extra_in_map"])
+    updated = original
+
+    if extra:
+        updated = _remove_description_headings(updated, extra)
+
+    structure = re.search(r'(## Your Workspace Structure\s*\n```[^\n]*\n)(.*?)(```)', updated, re.DOTALL)
+    if structure:
+        block = structure.group(2)
+        if extra:
+            block = _remove_tree_entries(block, extra)
+        if missing:
+            block = _add_tree_entries(block, missing)
+        updated = updated[:structure.start(2)] + block + updated[structure.end(2):]
+    elif missing:
+        # No structure section yet - add one (before the first horizontal rule after the title)
+        section = (
+            "## Your Workspace Structure\n\n```\n04-workspace/\n"
+            + _add_tree_entries('', missing).lstrip('\n')
+            + "```\n\n---\n\n"
+        )
+        anchor = re.search(r'^## ', updated, re.MULTILINE)
+        if anchor:
+            updated = updated[:anchor.start()] + section + updated[anchor.start():]
+        else:
+            updated = updated.rstrip('\n') + '\n\n' + section
+
+    patch = ''.join(difflib.unified_diff(
+        original.splitlines(keepends=True),
+        updated.splitlines(keepends=True),
+        fromfile='a/04-workspace/workspace-map.md',
+        tofile='b/04-workspace/workspace-map.md',
+        n=1
+    ))
+    return {'patch': patch, 'content': updated}
+
+
+def apply_map_patch(map_path: Path, content: str) -> None:
+    """Write the patched map via temp file + atomic rename."""
+    fd, tmp_name = tempfile.mkstemp(dir=map_path.parent, prefix=f".{map_path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_name, map_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
 def main():
     """Main validation workflow."""
+    parser = argparse.ArgumentParser(description="Validate workspace-map.md against 04-workspace/")
+    parser.add_argument('--auto-fix', action='store_true',
+                        help='Emit a minimal patch for workspace-map.md in the report')
+    parser.add_argument('--apply', action='store_true',
+                        help='With --auto-fix: apply the patch to workspace-map.md')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the persisted scan state and walk everything')
+    args = parser.parse_args()
+
     try:
         # Find workspace root
         root = get_workspace_root()
         workspace_path = root / '04-workspace'
         map_path = workspace_path / 'workspace-map.md'
 
-        # Scan actual structure
-        actual = scan_workspace(workspace_path)
+        # Scan actual structure (only changed subtrees are re-listed)
+        actual = scan_workspace(workspace_path, incremental=not args.full)
 
         # Parse documented structure
         documented = parse_workspace_map(map_path)
@@ -203,6 +475,13 @@ def main():
         # Generate report
         report = generate_report(actual, documented, comparison)
 
+        if args.auto_fix and not comparison["perfect_match"]:
+            fix = build_map_patch(map_path, comparison)
+            report["auto_fix"] = {"patch": fix["patch"], "applied": False}
+            if args.apply and fix["patch"]:
+                apply_map_patch(map_path, fix["content"])
+                report["auto_fix"]["applied"] = True
+
         # Output JSON
         print(json.dumps(report, indent=2))
 
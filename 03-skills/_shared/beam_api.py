@@ -6,13 +6,19 @@ Shared client for interacting with Beam.ai API.
 Supports both BID (staging) and Production workspaces.
 """
 
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 import requests
 from dotenv import load_dotenv
 
+from .beam_http import (
+    POOL_CONNECTIONS, POOL_MAXSIZE, RATE_LIMIT, PooledHTTPAdapter, RateLimiter, connection_stats, create_session
+)
+
 
 # Workspace configurations
 WORKSPACES = {
@@ -29,6 +35,12 @@ WORKSPACES = {
 }
 
 
+DEFAULT_TIMEOUT = 60   # Seconds
+
+# Concurrent pagination defaults (RATE_LIMIT, requests per second, comes from beam_http)
+PAGE_WORKERS = 4       # Pages fetched in parallel once totalCount is known
+
+
 def find_project_root() -> Path:
     """Find project root by looking for CLAUDE.md or .git directory."""
     current = Path(__file__).resolve().parent
@@ -45,17 +57,23 @@ class BeamClient:
     """
     Client for Beam.ai API.
 
+    All requests go through one pooled keep-alive session, so multi-page
+    fetches and per-task loops reuse the same TCP+TLS connection.
+
     Usage:
         client = BeamClient(workspace='prod')
         tasks = client.get('/agent-tasks', params={'agentId': '...'})
+        print(client.connection_stats())
     """
 
-    def __init__(self, workspace: str = "bid"):
+    def __init__(self, workspace: str = "bid", pool_maxsize: int = POOL_MAXSIZE):
         """
         Initialize Beam API client.
 
         Args:
             workspace: 'bid' for staging, 'prod' for production
+            pool_maxsize: Keep-alive connections kept per host (raise for
+                          concurrent callers)
         """
         if workspace not in WORKSPACES:
             raise ValueError(f"Unknown workspace: {workspace}. Use 'bid' or 'prod'")
@@ -65,7 +83,8 @@ class BeamClient:
         load_dotenv(env_path)
 
         config = WORKSPACES[workspace]
-        self.base_url = config["base_url"]
+        # BEAM_API_BASE_URL points every workspace at another server (e.g. the local mock API)
+        self.base_url = os.getenv("BEAM_API_BASE_URL") or config["base_url"]
         self.workspace = workspace
 
         # Get credentials
@@ -77,6 +96,27 @@ class BeamClient:
         if not self.workspace_id:
             raise ValueError(f"{config['workspace_id_env']} not found in environment")
 
+        self.session = create_session(pool_maxsize=pool_maxsize)
+
+    def connection_stats(self) -> dict:
+        """
+        Connection reuse counters for this client.
+
+        Returns:
+            Dict with 'requests', 'connections_opened' and 'connections_reused'
+        """
+        return connection_stats(self.session, self.base_url)
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def _get_headers(self) -> dict:
         """Get headers for API requests."""
         return {
@@ -97,7 +137,7 @@ class BeamClient:
             JSON response as dict
         """
         url = f"{self.base_url}{endpoint}"
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self.session.get(url, headers=self._get_headers(), params=params, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
         return response.json()
 
@@ -113,7 +153,7 @@ class BeamClient:
             JSON response as dict (or empty dict for 201 responses)
         """
         url = f"{self.base_url}{endpoint}"
-        response = requests.post(url, headers=self._get_headers(), json=data)
+        response = self.session.post(url, headers=self._get_headers(), json=data, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
 
         # Handle empty responses (e.g., 201 Created)
@@ -136,5 +176,166 @@ class BeamClient:
         """
         url = f"{self.base_url}{endpoint}"
         kwargs.setdefault("headers", self._get_headers())
-        response = requests.request(method, url, **kwargs)
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        response = self.session.request(method, url, **kwargs)
         return response
+
+
+class PaginationError(Exception):
+    """A page request failed; ``items`` holds the items of the pages fetched before it."""
+
+    def __init__(self, cause: Exception, items: list):
+        super().__init__(str(cause))
+        self.cause = cause
+        self.items = items
+        self.response = getattr(cause, "response", None)  # HTTP error details, like requests.HTTPError
+
+
+def run_concurrently(
+    fn: Callable,
+    items: Iterable,
+    max_workers: int = PAGE_WORKERS,
+    limiter: Optional[RateLimiter] = None
+) -> list:
+    """
+    Call ``fn(item)`` for every item on a bounded thread pool.
+
+    Args:
+        fn: Function taking one item
+        items: Inputs
+        max_workers: Concurrency cap
+        limiter: Optional RateLimiter acquired before each call
+
+    Returns:
+        Results in input order (the first exception is re-raised)
+    """
+    def call(item):
+        if limiter:
+            limiter.acquire()
+        return fn(item)
+
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(call, items))
+
+
+def extract_page_items(result: dict) -> list:
+    """
+    Extract the item list from a paginated response.
+
+    Handles both ``{"data": [{"tasks": [...]}], "totalCount": N}`` and
+    ``{"data": [...]}`` / ``{"tasks": [...]}`` shapes.
+    """
+    data = result.get("data", [])
+    if data and isinstance(data, list):
+        first_item = data[0]
+        if isinstance(first_item, dict) and "tasks" in first_item:
+            return first_item.get("tasks", [])
+        return data
+    return result.get("tasks", data) or []
+
+
+def extract_total(result: dict) -> Optional[int]:
+    """Total item count reported by a paginated response, if any."""
+    for key in ("totalCount", "total"):
+        value = result.get(key)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def paginate(
+    client: "BeamClient",
+    endpoint: str,
+    params: Optional[dict] = None,
+    page_size: int = 100,
+    max_pages: int = 50,
+    max_workers: int = PAGE_WORKERS,
+    rate_limit: float = RATE_LIMIT,
+    page_param: str = "page",
+    size_param: str = "limit",
+    stop: Optional[Callable[[list], bool]] = None
+) -> list:
+    """
+    Fetch every page of a page-numbered endpoint.
+
+    Page 1 is fetched first; if it reports ``totalCount`` the remaining
+    pages are fetched concurrently, ``max_workers`` at a time (bounded by
+    ``rate_limit``), and merged in page order. Without a total the pages
+    are walked serially until a short or empty page. A result of exactly
+    ``max_pages * page_size`` items means the cap may have cut it short.
+
+    Args:
+        client: BeamClient instance
+        endpoint: API endpoint (e.g., '/agent-tasks')
+        params: Query parameters other than page/size
+        page_size: Items per page
+        max_pages: Maximum pages to fetch
+        max_workers: Concurrent page requests
+        rate_limit: Requests per second (0 disables the limit)
+        page_param: Name of the page-number parameter
+        size_param: Name of the page-size parameter
+        stop: Optional ``stop(items_so_far)``; fetching ends once it returns
+              True (checked after each page, or each concurrent batch)
+
+    Returns:
+        List of all items, in page order
+
+    Raises:
+        PaginationError: A page failed (``items`` has the pages before it)
+    """
+    limiter = RateLimiter(rate_limit)
+    items = []
+
+    def fetch(page: int) -> dict:
+        page_params = dict(params or {})
+        page_params[page_param] = page
+        page_params[size_param] = page_size
+        return client.get(endpoint, params=page_params)
+
+    def attempt(page: int) -> tuple:
+        # Keep going past a failed page so the pages before it are still merged
+        try:
+            return fetch(page), None
+        except Exception as e:
+            return None, e
+
+    try:
+        limiter.acquire()
+        first = fetch(1)
+        items.extend(extract_page_items(first))
+        total = extract_total(first)
+
+        if not items or max_pages <= 1 or (stop and stop(items)):
+            return items
+
+        if total is None:
+            page = 2
+            last_count = len(items)
+            while page <= max_pages and last_count >= page_size:
+                limiter.acquire()
+                page_items = extract_page_items(fetch(page))
+                if not page_items:
+                    break
+                items.extend(page_items)
+                last_count = len(page_items)
+                page += 1
+                if stop and stop(items):
+                    break
+            return items
+
+        pages = min(max_pages, math.ceil(total / page_size))
+        batch = max(1, max_workers) if stop else pages
+        for first_page in range(2, pages + 1, batch):
+            batch_pages = range(first_page, min(first_page + batch, pages + 1))
+            for result, error in run_concurrently(attempt, batch_pages, max_workers=max_workers, limiter=limiter):
+                if error is not None:
+                    raise error
+                items.extend(extract_page_items(result))
+            if stop and stop(items):
+                break
+        return items
+    except Exception as e:
+        raise PaginationError(e, items) from e
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Beam Disk Cache
+
+Gzip-compressed JSON entries on disk, one file per key, written atomically
+(mkstemp in the target directory + os.replace) so readers never see a
+half-written file. Used for Langfuse traces, analytics windows, task
+details and test-node results. Stdlib only.
+
+Usage:
+    from _shared.beam_cache import JsonFileCache
+
+    cache = JsonFileCache(project_root / "04-workspace" / ".task-cache")
+    entry = cache.get(("prod", task_id))
+    if entry is None:
+        task = fetch()
+        cache.put(("prod", task_id), task, updated_at=task.get("updatedAt"))
+    else:
+        task = entry["data"]
+"""
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+Key = Union[str, Tuple[str, ...]]
+
+
+def safe_segment(value: str) -> str:
+    """Reduce a key part to a safe file name (letters, digits, '-' and '_')."""
+    cleaned = "".join(c if c.isalnum() or c in "-_" else "_" for c in str(value))
+    return cleaned or "_"
+
+
+class JsonFileCache:
+    """
+    Thread-safe on-disk JSON cache.
+
+    Each entry is stored as ``{"cached_at": ..., <meta>..., "data": ...}`` at
+    ``<cache_dir>/<part>/.../<last part>.json.gz``. Entries that cannot be read
+    (missing, corrupt, or written by an older format) are misses. A failed
+    write only prints a warning: the caller already has the live data.
+    """
+
+    suffix = ".json.gz"
+
+    def __init__(self, cache_dir: Path, read: bool = True, write: bool = True):
+        """
+        Args:
+            cache_dir: Root directory of the cache
+            read: Serve hits (False always misses, e.g. --no-cache / --refresh)
+            write: Store entries (False for a read-only run)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.read = read
+        self.write = write
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def path(self, key: Key) -> Path:
+        parts = [key] if isinstance(key, str) else list(key)
+        *dirs, name = [safe_segment(part) for part in parts]
+        return self.cache_dir.joinpath(*dirs, name + self.suffix)
+
+    def get(self, key: Key, max_age: Optional[float] = None) -> Optional[dict]:
+        """
+        Cached entry for ``key``, or None.
+
+        Args:
+            key: Key part, or tuple of parts (one directory level each)
+            max_age: Treat entries older than this many seconds as misses
+
+        Returns:
+            Entry dict (the cached value is under "data")
+        """
+        entry = None
+        if self.read:
+            try:
+                with gzip.open(self.path(key), "rt", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None  # Missing or corrupt: refetch and overwrite
+            if not isinstance(entry, dict) or "data" not in entry:
+                entry = None
+            elif max_age is not None and time.time() - entry.get("cached_at", 0) > max_age:
+                entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def put(self, key: Key, data, **meta) -> bool:
+        """
+        Store ``data`` (plus metadata fields) under ``key``.
+
+        Returns:
+            True if written, False if writing is disabled or failed
+        """
+        if not self.write:
+            return False
+        path = self.path(key)
+        entry = {"cached_at": time.time(), **meta, "data": data}
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".cache-", suffix=".tmp")
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(entry, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            print(f"[WARN] Could not write cache entry {path}: {e}", file=sys.stderr)
+            return False
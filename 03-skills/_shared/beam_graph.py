@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Beam Agent Graph Model
+
+Indexed, read-only view of an ``/agent-graphs/{agentId}`` response.
+
+All lookups are built once in the constructor (O(nodes + edges)) so analysis
+code never scans the node list to resolve an edge or match a tool:
+
+- ``by_id``: node ID -> node dict
+- ``edges``: de-duplicated edges from every node's ``childEdges``/``parentEdges``
+  (and a top-level ``edges`` list if present), normalised to
+  ``{"id", "source", "target", "condition", "name"}``
+- ``children`` / ``parents`` / ``out_edges``: adjacency by node ID
+- ``entry_ids`` / ``exit_ids``: flagged entry/exit nodes (falling back to
+  nodes without parents / children)
+- ``order``: topological order, entry nodes first
+- ``by_tool`` / ``by_function``: tool name / function name -> node IDs
+- ``tool_text``: lower-cased "toolName toolFunctionName" per node for keyword matching
+
+Self-contained (stdlib only) so it can be imported both as
+``_shared.beam_graph`` and, with ``03-skills/_shared`` on sys.path, as
+``beam_graph``.
+
+Usage:
+    from _shared.beam_graph import AgentGraph
+
+    graph = AgentGraph(data)
+    for node in graph.ordered_nodes():
+        print(graph.tool_name(node["id"]), [graph.by_id[c]["objective"] for c in graph.children[node["id"]]])
+    gmail_nodes = graph.match_keywords(["gmail"])["gmail"]
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+
+class AgentGraph:
+    """Indexed agent graph built from an API response (``{"graph": {...}}``) or a bare graph dict."""
+
+    def __init__(self, data: dict):
+        graph = data.get("graph", data) if isinstance(data, dict) else {}
+        self.graph = graph or {}
+        self.nodes: List[dict] = [n for n in self.graph.get("nodes", []) or [] if isinstance(n, dict)]
+        self.by_id: Dict[str, dict] = {}
+        self.position: Dict[str, int] = {}
+        for position, node in enumerate(self.nodes):
+            node_id = node.get("id")
+            self.by_id[node_id] = node
+            self.position[node_id] = position
+
+        self.edges: List[dict] = []
+        self.children: Dict[str, List[str]] = {node_id: [] for node_id in self.by_id}
+        self.parents: Dict[str, List[str]] = {node_id: [] for node_id in self.by_id}
+        self.out_edges: Dict[str, List[dict]] = {node_id: [] for node_id in self.by_id}
+        self._index_edges()
+
+        flagged_entry = {i for i, n in self.by_id.items() if n.get("isEntryNode")}
+        flagged_exit = {i for i, n in self.by_id.items() if n.get("isExitNode")}
+        self.entry_ids = flagged_entry or {i for i in self.by_id if not self.parents[i]}
+        self.exit_ids = flagged_exit or {i for i in self.by_id if not self.children[i]}
+
+        self.by_tool: Dict[str, List[str]] = {}
+        self.by_function: Dict[str, List[str]] = {}
+        self.tool_text: Dict[str, str] = {}
+        for node_id, node in self.by_id.items():
+            config = node.get("toolConfiguration") or {}
+            tool_name = config.get("toolName") or ""
+            function_name = config.get("toolFunctionName") or ""
+            if tool_name:
+                self.by_tool.setdefault(tool_name, []).append(node_id)
+            if function_name:
+                self.by_function.setdefault(function_name, []).append(node_id)
+            self.tool_text[node_id] = f"{tool_name} {function_name}".lower()
+
+        self.order: List[str] = self._topological_order()
+
+    def _index_edges(self):
+        """Collect edges once, keyed by (source, target) so both sides' copies count once."""
+        seen = set()
+        raw_edges = list(self.graph.get("edges", []) or [])
+        for node in self.nodes:
+            raw_edges.extend(node.get("childEdges", []) or [])
+            raw_edges.extend(node.get("parentEdges", []) or [])
+
+        for raw in raw_edges:
+            source = raw.get("sourceAgentGraphNodeId") or raw.get("source")
+            target = raw.get("targetAgentGraphNodeId") or raw.get("target")
+            if (source, target) in seen or source not in self.by_id or target not in self.by_id:
+                continue
+            seen.add((source, target))
+            edge = {
+                "id": raw.get("id"),
+                "source": source,
+                "target": target,
+                "condition": raw.get("condition") or "",
+                "name": raw.get("name") or "",
+            }
+            self.edges.append(edge)
+            self.children[source].append(target)
+            self.parents[target].append(source)
+            self.out_edges[source].append(edge)
+
+    def _topological_order(self) -> List[str]:
+        """
+        Kahn's algorithm, entry nodes first and ties broken by API order.
+
+        Nodes on cycles (retry loops) are appended in API order after the
+        acyclic part, so every node appears exactly once.
+        """
+        remaining = {node_id: len(parents) for node_id, parents in self.parents.items()}
+        ready = deque(sorted((i for i, count in remaining.items() if count == 0),
+                             key=lambda i: (i not in self.entry_ids, self.position[i])))
+        order = []
+        while ready:
+            node_id = ready.popleft()
+            order.append(node_id)
+            for child in sorted(self.children[node_id], key=self.position.__getitem__):
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        if len(order) < len(self.nodes):
+            placed = set(order)
+            order.extend(node["id"] for node in self.nodes if node.get("id") not in placed)
+        return order
+
+    # -- convenience ---------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def ordered_nodes(self) -> List[dict]:
+        """Node dicts in topological order."""
+        return [self.by_id[node_id] for node_id in self.order]
+
+    def tool_config(self, node_id: str) -> dict:
+        """The node's ``toolConfiguration`` ({} if none)."""
+        return self.by_id[node_id].get("toolConfiguration") or {}
+
+    def tool_name(self, node_id: str) -> str:
+        return self.tool_config(node_id).get("toolName") or ""
+
+    def is_entry(self, node_id: str) -> bool:
+        return node_id in self.entry_ids
+
+    def is_exit(self, node_id: str) -> bool:
+        return node_id in self.exit_ids
+
+    def match_keywords(self, keywords: Iterable[str], node_ids: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """
+        Find nodes whose tool name or function name contains each keyword.
+
+        Keywords are lower-cased once; node text was lower-cased at build time.
+
+        Returns:
+            {keyword: [node IDs in topological order]} (only keywords with matches)
+        """
+        lowered = [(keyword, keyword.lower()) for keyword in keywords]
+        matches: Dict[str, List[str]] = {}
+        for node_id in (self.order if node_ids is None else node_ids):
+            text = self.tool_text[node_id]
+            if text == " ":
+                continue
+            for keyword, needle in lowered:
+                if needle in text:
+                    matches.setdefault(keyword, []).append(node_id)
+        return matches
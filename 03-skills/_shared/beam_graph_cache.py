@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Beam Graph Cache
+
+Versioned, content-addressed local cache of Beam.ai agent graphs.
+
+Every graph response is stored once under the SHA-256 of its canonical JSON
+(gzipped, so identical re-downloads cost nothing on disk). An index records,
+per agent, each version (graph ID + updatedAt + hash) in the order it became
+current (a reverted graph is recorded again) and when each ref (``latest`` or
+a specific graph ID) was last fetched, so repeat fetches within ``ttl``
+seconds are served locally. Index updates hold an exclusive file lock so
+concurrent scripts do not drop each other's versions. ``diff_graphs`` compares two cached
+versions node by node, edge by edge and tool config by tool config.
+
+Stdlib only; import it as ``_shared.beam_graph_cache``.
+
+Usage:
+    from _shared.beam_graph_cache import GraphCache, diff_graphs
+
+    cache = GraphCache()
+    data = cache.fetch(agent_id, lambda: client.get(f"/agent-graphs/{agent_id}"))
+
+    old, new = cache.resolve(agent_id, "previous"), cache.resolve(agent_id, "latest")
+    changes = diff_graphs(cache.load(old["hash"]), cache.load(new["hash"]))
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+from .beam_lock import file_lock
+
+
+def _project_root() -> Path:
+    """Find project root by looking for CLAUDE.md or .git directory."""
+    current = Path(__file__).resolve().parent
+    for _ in range(10):
+        if (current / "CLAUDE.md").exists() or (current / ".git").exists():
+            return current
+        if current.parent == current:
+            break
+        current = current.parent
+    return Path(__file__).resolve().parent.parent.parent
+
+
+DEFAULT_CACHE_DIR = _project_root() / "04-workspace" / ".beam-graph-cache"
+CACHE_TTL = int(os.getenv("BEAM_GRAPH_CACHE_TTL", "900"))   # Seconds a fetched ref is served locally
+
+# Ignored when diffing: timestamps change on every save and say nothing about behaviour
+VOLATILE_FIELDS = {"createdAt", "updatedAt", "deletedAt"}
+EDGE_FIELDS = {"childEdges", "parentEdges"}
+LIST_ITEM_KEYS = ("paramName", "name", "id")   # Match list items by these keys instead of position
+
+
+def canonical_json(data) -> bytes:
+    """Serialise with sorted keys and no whitespace so equal graphs hash equally."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def content_hash(data) -> str:
+    """SHA-256 of the canonical JSON of a graph response."""
+    return hashlib.sha256(canonical_json(data)).hexdigest()
+
+
+def graph_body(data: dict) -> dict:
+    """The graph object of an ``/agent-graphs`` response (unwraps ``{"graph": ...}``)."""
+    if isinstance(data, dict) and isinstance(data.get("graph"), dict):
+        return data["graph"]
+    return data or {}
+
+
+def _latest_timestamp(obj, key="updatedAt") -> Optional[str]:
+    """Newest ``updatedAt`` anywhere in the structure (ISO strings sort chronologically)."""
+    latest = None
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            value = item.get(key)
+            if isinstance(value, str) and (latest is None or value > latest):
+                latest = value
+            stack.extend(v for v in item.values() if isinstance(v, (dict, list)))
+        elif isinstance(item, list):
+            stack.extend(v for v in item if isinstance(v, (dict, list)))
+    return latest
+
+
+def graph_version(data: dict) -> dict:
+    """
+    Identify a graph version.
+
+    The API has no graph-level ``updatedAt``, so the newest ``updatedAt`` of
+    any node, edge or tool config stands in for it.
+
+    Returns:
+        Dict with agent_id, graph_id, updated_at, name and node_count
+    """
+    graph = graph_body(data)
+    return {
+        "agent_id": graph.get("agentId") or (graph.get("agent") or {}).get("id"),
+        "graph_id": graph.get("id"),
+        "updated_at": graph.get("updatedAt") or _latest_timestamp(graph.get("nodes", [])),
+        "name": (graph.get("agent") or {}).get("name") or graph.get("name"),
+        "node_count": len(graph.get("nodes", [])),
+    }
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _atomic_write(path: Path, payload: bytes):
+    """Write via a temp file + rename so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class GraphCache:
+    """
+    Content-addressed agent graph store.
+
+    Layout under ``cache_dir``::
+
+        objects/ab/abcdef....json.gz   one blob per distinct graph content
+        index.json                     {agent_id: {"versions": [...], "refs": {...}}}
+    """
+
+    def __init__(self, cache_dir=None, ttl: int = CACHE_TTL):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / "index.json"
+        self.lock_path = self.cache_dir / "index.lock"
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    # -- storage -------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json.gz"
+
+    def _load_index(self) -> dict:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @contextmanager
+    def _index_lock(self):
+        """Hold an exclusive cross-process lock for an index read-modify-write."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.lock_path):
+            yield
+
+    def _save_index(self, index: dict):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self.index_path, json.dumps(index, indent=2).encode("utf-8"))
+
+    def load(self, digest: str) -> dict:
+        """Load a cached graph by full hash or unique prefix."""
+        path = self._object_path(digest)
+        if not path.exists():
+            matches = sorted(self.objects_dir.glob(f"{digest[:2]}/{digest}*.json.gz")) if len(digest) >= 4 else []
+            if len(matches) != 1:
+                raise KeyError(f"No unique cached graph for hash {digest!r}")
+            path = matches[0]
+        with gzip.open(path, "rb") as f:
+            return json.loads(f.read().decode("utf-8"))
+
+    def put(self, data: dict, ref: Optional[str] = None, source: str = "api",
+            agent_id: Optional[str] = None) -> dict:
+        """
+        Store a graph response and record its version.
+
+        Args:
+            data: Graph response (``{"graph": {...}}``)
+            ref: Ref this response answers (``"latest"`` or a graph ID), if fetched
+            source: Where the graph came from ("api" or an imported file path)
+            agent_id: Agent to file it under (default: the graph's agentId)
+
+        Returns:
+            The version record
+        """
+        payload = canonical_json(data)
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, gzip.compress(payload, compresslevel=6))
+
+        info = graph_version(data)
+        agent_id = agent_id or info.pop("agent_id") or "unknown"
+        info.pop("agent_id", None)
+        now = _now_iso()
+
+        with self._index_lock():
+            index = self._load_index()
+            entry = index.setdefault(agent_id, {"versions": [], "refs": {}})
+            versions = entry["versions"]
+            record = versions[-1] if versions and versions[-1]["hash"] == digest else None
+            if record is None and ref != "latest":
+                # Imports and explicit graph-ID fetches of a known version do not make it current
+                record = next((v for v in reversed(versions) if v["hash"] == digest), None)
+            if record:
+                record["last_seen"] = now
+            else:
+                # New content, or latest reverted to an older version (A -> B -> A)
+                record = {"hash": digest, **info, "first_seen": now, "last_seen": now,
+                          "size": len(payload), "source": source}
+                versions.append(record)
+            if ref:
+                entry["refs"][ref] = {"hash": digest, "fetched_at": time.time()}
+            self._save_index(index)
+        return record
+
+    # -- lookup --------------------------------------------------------------
+
+    def agents(self) -> dict:
+        """Index of all cached agents."""
+        return self._load_index()
+
+    def versions(self, agent_id: str) -> list:
+        """Cached versions of an agent's graph in the order they became current, oldest first."""
+        return self._load_index().get(agent_id, {}).get("versions", [])
+
+    @staticmethod
+    def _current(entry: dict) -> int:
+        """Position of the version ``latest`` was last fetched as (default: the newest record)."""
+        versions = entry.get("versions", [])
+        latest = entry.get("refs", {}).get("latest")
+        if latest:
+            for position in range(len(versions) - 1, -1, -1):
+                if versions[position]["hash"] == latest["hash"]:
+                    return position
+        return len(versions) - 1
+
+    def resolve(self, agent_id: str, ref: str) -> dict:
+        """
+        Find a cached version.
+
+        Args:
+            ref: ``latest``, ``previous``, a 1-based version number (as shown
+                 by ``versions``), a graph ID or a hash prefix
+
+        Returns:
+            The version record
+        """
+        entry = self._load_index().get(agent_id, {})
+        versions = entry.get("versions", [])
+        if not versions:
+            raise KeyError(f"No cached graphs for agent {agent_id}")
+        current = self._current(entry)
+        if ref in (None, "latest"):
+            return versions[current]
+        if ref == "previous":
+            if current < 1:
+                raise KeyError(f"No version of agent {agent_id} before the latest")
+            return versions[current - 1]
+        if ref.isdigit() and int(ref) <= len(versions):
+            return versions[int(ref) - 1]
+        matches = [v for v in versions if v.get("graph_id") == ref] or \
+                  [v for v in versions if v["hash"].startswith(ref)]
+        if not matches:
+            raise KeyError(f"No cached version {ref!r} for agent {agent_id}")
+        return matches[-1]
+
+    def fetch(self, agent_id: str, fetch_fn: Callable[[], Optional[dict]], graph_id: Optional[str] = None,
+              refresh: bool = False, max_age: Optional[int] = None) -> Optional[dict]:
+        """
+        Return an agent graph, from the cache if it was fetched recently.
+
+        Args:
+            agent_id: Agent ID
+            fetch_fn: Zero-argument callable that downloads the graph
+                      (returns None or raises on failure)
+            graph_id: Specific graph version requested (None = latest)
+            refresh: Always download (the result is still cached)
+            max_age: Override ``ttl`` for this call (seconds)
+
+        Returns:
+            Graph response dict, or None if the download failed
+        """
+        ref = graph_id or "latest"
+        max_age = self.ttl if max_age is None else max_age
+        if not refresh and max_age > 0:
+            cached = self._load_index().get(agent_id, {}).get("refs", {}).get(ref)
+            if cached and time.time() - cached["fetched_at"] < max_age:
+                try:
+                    data = self.load(cached["hash"])
+                    self.hits += 1
+                    return data
+                except (KeyError, OSError, ValueError):
+                    pass  # Blob missing or corrupt: fall through to a download
+
+        self.misses += 1
+        data = fetch_fn()
+        if data:
+            self.put(data, ref=ref, agent_id=agent_id)
+        return data
+
+
+# -- diffing -----------------------------------------------------------------
+
+def _list_key(items: list) -> Optional[str]:
+    """Key to match dict list items by, if every item has a unique value for it."""
+    if not items or not all(isinstance(i, dict) for i in items):
+        return None
+    for key in LIST_ITEM_KEYS:
+        values = [i.get(key) for i in items]
+        if all(values) and len(set(map(str, values))) == len(values):
+            return key
+    return None
+
+
+def _flatten(obj, prefix: str = "", out: Optional[dict] = None, skip=VOLATILE_FIELDS) -> dict:
+    """Flatten nested dicts/lists into {"a.b[key]": value} leaves for comparison."""
+    out = {} if out is None else out
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key not in skip:
+                _flatten(value, f"{prefix}.{key}" if prefix else key, out, skip)
+    elif isinstance(obj, list) and obj and any(isinstance(i, (dict, list)) for i in obj):
+        key = _list_key(obj)
+        for position, item in enumerate(obj):
+            label = item[key] if key else position
+            _flatten(item, f"{prefix}[{label}]", out, skip)
+    else:
+        out[prefix] = obj
+    return out
+
+
+def _field_changes(old, new, skip=VOLATILE_FIELDS) -> dict:
+    """{path: [old, new]} for every leaf that differs (missing = None)."""
+    old_flat, new_flat = _flatten(old, skip=skip), _flatten(new, skip=skip)
+    return {path: [old_flat.get(path), new_flat.get(path)]
+            for path in sorted(set(old_flat) | set(new_flat))
+            if old_flat.get(path) != new_flat.get(path)}
+
+
+def node_label(node: dict) -> str:
+    """Short human label for a node: its objective, else its ID prefix."""
+    objective = " ".join((node.get("objective") or "").split())
+    return objective[:60] if objective else (node.get("id") or "?")[:8]
+
+
+def _edges(graph: dict) -> dict:
+    """All edges keyed by (source, target); nested childEdges plus any top-level list."""
+    edges = {}
+    for edge in graph.get("edges", []) or []:
+        edges[(edge.get("sourceAgentGraphNodeId"), edge.get("targetAgentGraphNodeId"))] = edge
+    for node in graph.get("nodes", []):
+        for edge in node.get("childEdges", []) or []:
+            edges[(edge.get("sourceAgentGraphNodeId"), edge.get("targetAgentGraphNodeId"))] = edge
+    return edges
+
+
+def diff_graphs(old: dict, new: dict) -> dict:
+    """
+    Compare two graph responses.
+
+    Nodes and edges are matched by ID (edges by source/target node), tool
+    configs per node. Timestamps are ignored.
+
+    Returns:
+        Dict with ``graph`` (top-level field changes), ``nodes``
+        (added/removed/changed), ``edges`` (added/removed/changed) and
+        ``tools`` (per-node tool swaps and config changes)
+    """
+    old_graph, new_graph = graph_body(old), graph_body(new)
+    skip_graph = VOLATILE_FIELDS | {"nodes", "edges"}
+    old_nodes = {n.get("id"): n for n in old_graph.get("nodes", [])}
+    new_nodes = {n.get("id"): n for n in new_graph.get("nodes", [])}
+    labels = {node_id: node_label(node) for node_id, node in {**old_nodes, **new_nodes}.items()}
+    skip_node = VOLATILE_FIELDS | EDGE_FIELDS | {"toolConfiguration"}
+
+    changes = {
+        "graph": _field_changes(old_graph, new_graph, skip_graph),
+        "nodes": {"added": [], "removed": [], "changed": []},
+        "edges": {"added": [], "removed": [], "changed": []},
+        "tools": [],
+    }
+
+    for node_id in new_nodes.keys() - old_nodes.keys():
+        changes["nodes"]["added"].append({"id": node_id, "label": labels[node_id]})
+    for node_id in old_nodes.keys() - new_nodes.keys():
+        changes["nodes"]["removed"].append({"id": node_id, "label": labels[node_id]})
+
+    for node_id in old_nodes.keys() & new_nodes.keys():
+        old_node, new_node = old_nodes[node_id], new_nodes[node_id]
+        fields = _field_changes(old_node, new_node, skip_node)
+        if fields:
+            changes["nodes"]["changed"].append({"id": node_id, "label": labels[node_id], "fields": fields})
+
+        old_tool = old_node.get("toolConfiguration") or {}
+        new_tool = new_node.get("toolConfiguration") or {}
+        tool_fields = _field_changes(old_tool, new_tool)
+        if tool_fields:
+            changes["tools"].append({
+                "node_id": node_id,
+                "label": labels[node_id],
+                "old_tool": old_tool.get("toolName") or old_tool.get("toolFunctionName"),
+                "new_tool": new_tool.get("toolName") or new_tool.get("toolFunctionName"),
+                "fields": tool_fields,
+            })
+
+    old_edges, new_edges = _edges(old_graph), _edges(new_graph)
+
+    def describe(key, edge):
+        source, target = key
+        return {"source": source, "target": target,
+                "source_label": labels.get(source, (source or "?")[:8]),
+                "target_label": labels.get(target, (target or "?")[:8]),
+                "condition": edge.get("condition") or ""}
+
+    for key in new_edges.keys() - old_edges.keys():
+        changes["edges"]["added"].append(describe(key, new_edges[key]))
+    for key in old_edges.keys() - new_edges.keys():
+        changes["edges"]["removed"].append(describe(key, old_edges[key]))
+    for key in old_edges.keys() & new_edges.keys():
+        fields = _field_changes(old_edges[key], new_edges[key], VOLATILE_FIELDS | {"id"})
+        if fields:
+            changes["edges"]["changed"].append({**describe(key, new_edges[key]), "fields": fields})
+
+    for group in ("nodes", "edges"):
+        for items in changes[group].values():
+            items.sort(key=lambda item: str(item.get("label") or item.get("source_label")))
+    changes["tools"].sort(key=lambda item: item["label"])
+    return changes
+
+
+def diff_is_empty(changes: dict) -> bool:
+    """True if ``diff_graphs`` found no differences."""
+    return not (changes["graph"] or changes["tools"]
+                or any(changes["nodes"].values()) or any(changes["edges"].values()))
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Beam HTTP Plumbing
+
+Connection pooling and client-side rate limiting shared by both Beam
+clients (03-skills/_shared/beam_api.py and beam-master's beam_client.py).
+Depends only on requests/urllib3, so it is safe to import from scripts
+that do not use python-dotenv. create_auto_trigger.py copies RateLimiter
+into the standalone webhook runners it generates.
+"""
+
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+# Connection pool tuning: one keep-alive pool per host, sized for concurrent callers
+POOL_CONNECTIONS = 4   # Distinct hosts kept in the pool manager
+POOL_MAXSIZE = 16      # Keep-alive connections kept per host
+RATE_LIMIT = 10.0      # Default requests per second across all workers
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with tuned keep-alive pools that counts connection reuse.
+
+    Every request sent through the adapter increments ``requests_sent``;
+    every new TCP(+TLS) connection opened by urllib3 increments
+    ``connections_opened``. The difference is the number of requests that
+    reused a pooled keep-alive connection.
+    """
+
+    def __init__(self, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE):
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.connections_opened = 0
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+            pool_block=False,
+        )
+
+    def _count_connection(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        adapter = self
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                adapter._count_connection()
+                return super()._new_conn()
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                adapter._count_connection()
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.requests_sent += 1
+        return super().send(request, **kwargs)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by concurrent workers.
+
+    ``acquire()`` blocks until a token is available, so at most ``rate``
+    requests per second start (with bursts of up to ``burst``).
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = max(1, burst) if burst is not None else max(1, int(rate or 1))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate or self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def create_session(pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """Create a keep-alive requests.Session backed by a PooledHTTPAdapter."""
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def connection_stats(session: Optional[requests.Session], base_url: str) -> dict:
+    """
+    Connection reuse counters for the adapter serving ``base_url``.
+
+    Returns:
+        Dict with 'requests', 'connections_opened' and 'connections_reused'
+    """
+    if session is None:
+        return {"requests": 0, "connections_opened": 0, "connections_reused": 0}
+    adapter = session.get_adapter(base_url)
+    sent = getattr(adapter, "requests_sent", 0)
+    opened = getattr(adapter, "connections_opened", 0)
+    return {
+        "requests": sent,
+        "connections_opened": opened,
+        "connections_reused": max(sent - opened, 0),
+    }
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Beam ID Files
+
+Read task / agent IDs for ``--from-file`` options from whatever an earlier
+script wrote. Stdlib only.
+
+Accepted formats:
+    - one ID per line (first word; '#' lines are comments)
+    - NDJSON, one object per line (e.g. iterate_tasks.py --all)
+    - JSON: a list of IDs or of objects, optionally wrapped in a dict under a
+      list key ('tasks', 'agents', 'data', ...)
+
+Usage:
+    from _shared.beam_ids import load_task_ids, load_agent_ids
+
+    task_ids = load_task_ids("failed.json")
+"""
+
+import json
+from pathlib import Path
+from typing import List, Sequence, Union
+
+# Object keys holding the ID, and dict keys wrapping the list, in lookup order
+TASK_ID_KEYS = ("task_id", "taskId", "id")
+TASK_LIST_KEYS = ("tasks", "issue_tasks", "success", "data")   # debug_issue_tasks, retry_tasks output
+AGENT_ID_KEYS = ("agentId", "agent_id", "id")
+AGENT_LIST_KEYS = ("agents", "data", "items")                  # list_agents.py --json output
+
+
+def load_ids(path: Union[str, Path], id_keys: Sequence[str], list_keys: Sequence[str]) -> List[str]:
+    """
+    Read IDs from a file.
+
+    Args:
+        path: ID file
+        id_keys: Keys tried, in order, for the ID of an object
+        list_keys: Keys tried, in order, for the list inside a JSON object
+
+    Returns:
+        IDs in file order (duplicates kept)
+    """
+    text = Path(path).read_text(encoding="utf-8").strip()
+    if not text:
+        return []
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if text[0] not in "[{":
+        return [line.split()[0] for line in lines if not line.startswith("#")]
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = [json.loads(line) for line in lines]  # NDJSON
+
+    if isinstance(data, dict):
+        for key in list_keys:
+            if isinstance(data.get(key), list):
+                data = data[key]
+                break
+        else:
+            data = [data]
+    ids = []
+    for item in data:
+        if isinstance(item, str):
+            ids.append(item)
+        elif isinstance(item, dict):
+            item_id = next((item[key] for key in id_keys if item.get(key)), None)
+            if item_id:
+                ids.append(item_id)
+    return ids
+
+
+def load_task_ids(path: Union[str, Path]) -> List[str]:
+    """Task IDs from a file ('task_id' / 'taskId' / 'id' objects)."""
+    return load_ids(path, TASK_ID_KEYS, TASK_LIST_KEYS)
+
+
+def load_agent_ids(path: Union[str, Path]) -> List[str]:
+    """Agent IDs from a file ('agentId' / 'agent_id' / 'id' objects)."""
+    return load_ids(path, AGENT_ID_KEYS, AGENT_LIST_KEYS)
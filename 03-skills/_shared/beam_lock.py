@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Beam File Lock
+
+Exclusive cross-process lock on a lock file (fcntl.flock, msvcrt.locking on
+Windows), for read-modify-write updates of files shared by concurrently
+running scripts. Stdlib only.
+
+Usage:
+    from _shared.beam_lock import file_lock
+
+    with file_lock(cache_dir / "index.lock"):
+        index = load_index()
+        ...
+        save_index(index)
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union
+
+
+@contextmanager
+def file_lock(path: Union[str, Path]):
+    """
+    Hold an exclusive lock on ``path`` (created 0600 if missing) for the block.
+
+    Args:
+        path: Lock file; its parent directory must exist
+    """
+    fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if os.name == "nt":
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                import msvcrt
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Beam Task Statuses
+
+Status sets shared by the Beam scripts. Stdlib only.
+
+Usage:
+    from _shared.beam_status import TERMINAL_STATUSES, COMPLETED_STATUSES
+
+    if task["status"].upper() in COMPLETED_STATUSES:
+        ...
+"""
+
+# A task in one of these statuses has stopped running
+TERMINAL_STATUSES = frozenset({
+    "COMPLETED", "COMPLETE", "FAILED", "ERROR", "CANCELLED", "STOPPED", "TIMEOUT", "REJECTED"
+})
+
+# Finished successfully: nothing about the task changes any more. Failed or
+# stopped tasks are terminal too, but beam-retry-tasks re-runs them in place.
+COMPLETED_STATUSES = frozenset({"COMPLETED", "COMPLETE"})
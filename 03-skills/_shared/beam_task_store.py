@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Beam Task Store
+
+Local SQLite mirror of Beam.ai agent tasks with incremental sync.
+
+Tasks are upserted per agent from ``/agent-tasks`` using its
+``startDate``/``endDate`` filters. The store records the createdAt range
+it has fully mirrored per agent (``synced_from`` .. ``synced_until``);
+later syncs only request the window since the last sync (plus any
+recent task that has not completed yet), and backfill older days when a larger ``days`` is
+asked for, so repeated analysis queries run locally instead of
+re-downloading task lists.
+
+Usage:
+    from _shared.beam_api import BeamClient
+    from _shared.beam_task_store import TaskStore
+
+    with TaskStore() as store:
+        store.sync(BeamClient(workspace='prod'), agent_id, days=30)
+        rows = store.daily_counts(agent_id, statuses=['FAILED'], days=30)
+"""
+
+import json
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .beam_api import PAGE_WORKERS, find_project_root, paginate
+from .beam_status import COMPLETED_STATUSES
+
+
+DEFAULT_DB_PATH = find_project_root() / "04-workspace" / ".beam-task-store.db"
+SYNC_OVERLAP = timedelta(hours=1)   # Re-fetch this much before the last sync point
+SYNC_PAGE_SIZE = 100
+
+# Tasks that have not completed can still change: open ones settle, and failed or
+# stopped ones are re-run in place by beam-retry-tasks. They are re-synced while
+# they were created within this window; older ones are treated as settled.
+RESYNC_WINDOW = timedelta(days=3)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id          TEXT PRIMARY KEY,
+    workspace   TEXT NOT NULL,
+    agent_id    TEXT NOT NULL,
+    status      TEXT,
+    created_at  TEXT,
+    updated_at  TEXT,
+    custom_id   TEXT,
+    data        TEXT NOT NULL,
+    synced_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_agent_id ON tasks (agent_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_agent_created ON tasks (agent_id, created_at);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    workspace     TEXT NOT NULL,
+    agent_id      TEXT NOT NULL,
+    synced_until  TEXT NOT NULL,
+    last_sync_at  REAL NOT NULL,
+    synced_from   TEXT,
+    PRIMARY KEY (workspace, agent_id)
+);
+"""
+
+
+def format_timestamp(dt: datetime) -> str:
+    """Format a datetime as the UTC ISO string used by the API and the store."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (with or without Z); None if invalid."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def normalize_timestamp(value: str) -> Optional[str]:
+    """Normalize API timestamps so they sort and slice (day = [:10]) consistently."""
+    dt = parse_timestamp(value)
+    return format_timestamp(dt) if dt else value
+
+
+class TaskStore:
+    """
+    SQLite-backed mirror of Beam agent tasks.
+
+    Usage:
+        store = TaskStore()
+        stats = store.sync(client, agent_id, days=30)
+        failed = store.query(agent_id, statuses=['FAILED'], days=7)
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Open (and create if needed) the task store.
+
+        Args:
+            db_path: SQLite file (default: 04-workspace/.beam-task-store.db)
+        """
+        self.db_path = Path(db_path or DEFAULT_DB_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(sync_state)")}
+        if "synced_from" not in columns:
+            # Stores created before synced_from existed: their range is unknown, so the
+            # next sync of each agent re-fetches its whole window once
+            self.conn.execute("ALTER TABLE sync_state ADD COLUMN synced_from TEXT")
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def get_sync_state(self, workspace: str, agent_id: str) -> Optional[dict]:
+        """Return {'synced_from', 'synced_until', 'last_sync_at'} for an agent, or None if never synced."""
+        row = self.conn.execute(
+            "SELECT synced_from, synced_until, last_sync_at FROM sync_state WHERE workspace = ? AND agent_id = ?",
+            (workspace, agent_id),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def _oldest_unsettled_task(self, workspace: str, agent_id: str, since: datetime) -> Optional[str]:
+        completed = sorted(COMPLETED_STATUSES)
+        placeholders = ",".join("?" for _ in completed)
+        row = self.conn.execute(
+            f"SELECT MIN(created_at) FROM tasks WHERE workspace = ? AND agent_id = ? "
+            f"AND created_at >= ? AND (status IS NULL OR status NOT IN ({placeholders}))",
+            (workspace, agent_id, format_timestamp(since), *completed),
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync_window(self, workspace: str, agent_id: str, days: int = 30, full: bool = False) -> tuple:
+        """
+        Work out the createdAt windows that need fetching.
+
+        The incremental window starts at the last sync point (minus
+        SYNC_OVERLAP), or earlier if a stored task created within
+        RESYNC_WINDOW has not completed (still open, or failed and possibly
+        retried since), but never before ``days`` ago.
+        When ``days`` reaches further back than the mirrored range (e.g. a
+        7-day sync followed by a 30-day one), the older part is returned as
+        a separate backfill window. Without a usable sync state, or when the
+        last sync is older than ``days``, the whole window is fetched.
+
+        Returns:
+            (incremental, backfill): (start, end) UTC datetime pairs;
+            backfill is None when nothing older is missing
+        """
+        end = datetime.now(timezone.utc)
+        floor = end - timedelta(days=days)
+        state = None if full else self.get_sync_state(workspace, agent_id)
+        if not state or not state.get("synced_from"):
+            return (floor, end), None
+
+        synced_from = parse_timestamp(state["synced_from"])
+        start = parse_timestamp(state["synced_until"]) - SYNC_OVERLAP
+        if start <= floor:
+            return (floor, end), None  # Gap since the last sync: the old range no longer connects
+
+        oldest_unsettled = parse_timestamp(self._oldest_unsettled_task(workspace, agent_id, end - RESYNC_WINDOW))
+        if oldest_unsettled and oldest_unsettled < start:
+            start = oldest_unsettled
+        backfill = (floor, synced_from) if floor < synced_from else None
+        return (max(start, floor), end), backfill
+
+    def upsert_tasks(self, workspace: str, agent_id: str, tasks: Iterable[dict]) -> int:
+        """
+        Insert or replace tasks.
+
+        Returns:
+            Number of tasks written
+        """
+        now = time.time()
+        rows = [
+            (
+                task["id"],
+                workspace,
+                task.get("agentId") or agent_id,
+                (task.get("status") or "").upper() or None,
+                normalize_timestamp(task.get("createdAt") or task.get("created_at")),
+                normalize_timestamp(task.get("updatedAt") or task.get("updated_at")),
+                task.get("customId"),
+                json.dumps(task, separators=(",", ":")),
+                now,
+            )
+            for task in tasks
+            if task.get("id")
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO tasks "
+                "(id, workspace, agent_id, status, created_at, updated_at, custom_id, data, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def sync(
+        self,
+        client,
+        agent_id: str,
+        days: int = 30,
+        full: bool = False,
+        max_workers: int = PAGE_WORKERS,
+        max_pages: int = 500
+    ) -> dict:
+        """
+        Fetch the delta for an agent from the API and upsert it.
+
+        Args:
+            client: _shared.beam_api.BeamClient instance
+            agent_id: Agent ID
+            days: Oldest createdAt to mirror (days back from now)
+            full: Ignore the sync state and re-fetch the whole window
+            max_workers: Concurrent page requests
+            max_pages: Safety cap on pages per sync
+
+        Returns:
+            Dict with 'start', 'end', 'backfill', 'fetched', 'stored', 'written',
+            'complete' (False if max_pages cut a window short; the mirrored
+            range is then not extended over it) and 'seconds'
+        """
+        started = time.perf_counter()
+        workspace = client.workspace
+        state = self.get_sync_state(workspace, agent_id)
+        incremental, backfill = self.sync_window(workspace, agent_id, days=days, full=full)
+
+        def fetch(window: tuple) -> tuple:
+            tasks = paginate(
+                client,
+                "/agent-tasks",
+                {
+                    "agentId": agent_id,
+                    "startDate": format_timestamp(window[0]),
+                    "endDate": format_timestamp(window[1]),
+                },
+                page_size=SYNC_PAGE_SIZE,
+                max_pages=max_pages,
+                max_workers=max_workers,
+            )
+            # A window is only mirrored if pagination ran out of tasks before max_pages
+            return tasks, len(tasks) < max_pages * SYNC_PAGE_SIZE
+
+        tasks, complete = fetch(incremental)
+        written = self.upsert_tasks(workspace, agent_id, tasks)
+        fetched = len(tasks)
+        backfill_complete = True
+        if backfill:
+            backfill_tasks, backfill_complete = fetch(backfill)
+            written += self.upsert_tasks(workspace, agent_id, backfill_tasks)
+            fetched += len(backfill_tasks)
+
+        # The mirrored range grows only over windows that were fetched completely;
+        # keep the newest contiguous range
+        ranges = [window for window, ok in ((incremental, complete), (backfill, backfill_complete))
+                  if window and ok]
+        if state and state.get("synced_from"):
+            ranges.append((parse_timestamp(state["synced_from"]), parse_timestamp(state["synced_until"])))
+        merged = []
+        for range_start, range_end in sorted(ranges):
+            if merged and range_start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], range_end)
+            else:
+                merged.append([range_start, range_end])
+        mirrored = max(merged, key=lambda r: r[1]) if merged else None
+
+        if mirrored:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO sync_state "
+                    "(workspace, agent_id, synced_from, synced_until, last_sync_at) VALUES (?, ?, ?, ?, ?)",
+                    (workspace, agent_id, format_timestamp(mirrored[0]), format_timestamp(mirrored[1]),
+                     time.time()),
+                )
+
+        return {
+            "start": format_timestamp(incremental[0]),
+            "end": format_timestamp(incremental[1]),
+            "backfill": [format_timestamp(backfill[0]), format_timestamp(backfill[1])] if backfill else None,
+            "fetched": fetched,
+            "stored": self.count(agent_id, workspace=workspace),
+            "written": written,
+            "complete": complete and backfill_complete,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _where(
+        self,
+        agent_id: Optional[str],
+        statuses: Optional[Iterable[str]],
+        days: Optional[int],
+        workspace: Optional[str]
+    ) -> tuple:
+        clauses, params = [], []
+        if workspace:
+            clauses.append("workspace = ?")
+            params.append(workspace)
+        if agent_id:
+            clauses.append("agent_id = ?")
+            params.append(agent_id)
+        if statuses:
+            statuses = [s.upper() for s in statuses]
+            clauses.append(f"status IN ({','.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if days:
+            clauses.append("created_at >= ?")
+            params.append(format_timestamp(datetime.now(timezone.utc) - timedelta(days=days)))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query(
+        self,
+        agent_id: Optional[str] = None,
+        statuses: Optional[Iterable[str]] = None,
+        days: Optional[int] = None,
+        workspace: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> list:
+        """
+        Return stored tasks (full API objects), newest first.
+
+        Args:
+            agent_id: Filter by agent
+            statuses: Filter by status (case-insensitive)
+            days: Only tasks created in the last N days
+            workspace: Filter by workspace ('bid'/'prod')
+            limit: Max tasks to return
+        """
+        where, params = self._where(agent_id, statuses, days, workspace)
+        sql = f"SELECT data FROM tasks {where} ORDER BY created_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row["data"]) for row in self.conn.execute(sql, params)]
+
+    def count(self, agent_id: Optional[str] = None, statuses: Optional[Iterable[str]] = None,
+              days: Optional[int] = None, workspace: Optional[str] = None) -> int:
+        """Count stored tasks matching the filters."""
+        where, params = self._where(agent_id, statuses, days, workspace)
+        return self.conn.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+
+    def status_counts(self, agent_id: Optional[str] = None, days: Optional[int] = None,
+                      workspace: Optional[str] = None) -> dict:
+        """Return {status: count} for the matching tasks."""
+        where, params = self._where(agent_id, None, days, workspace)
+        rows = self.conn.execute(
+            f"SELECT status, COUNT(*) AS n FROM tasks {where} GROUP BY status ORDER BY n DESC",
+            params,
+        )
+        return {row["status"] or "UNKNOWN": row["n"] for row in rows}
+
+    def daily_counts(self, agent_id: Optional[str] = None, statuses: Optional[Iterable[str]] = None,
+                     days: Optional[int] = 30, workspace: Optional[str] = None) -> list:
+        """
+        Tasks per day and status (e.g. ISSUE tasks per day for the last 30 days).
+
+        Returns:
+            List of {'day', 'status', 'count'} dicts, oldest day first
+        """
+        where, params = self._where(agent_id, statuses, days, workspace)
+        rows = self.conn.execute(
+            f"SELECT substr(created_at, 1, 10) AS day, status, COUNT(*) AS n FROM tasks {where} "
+            f"GROUP BY day, status ORDER BY day, status",
+            params,
+        )
+        return [{"day": row["day"], "status": row["status"], "count": row["n"]} for row in rows]
+
+    def agents(self) -> list:
+        """Synced agents with task counts and last sync time."""
+        rows = self.conn.execute(
+            "SELECT s.workspace, s.agent_id, s.synced_from, s.synced_until, s.last_sync_at, "
+            "(SELECT COUNT(*) FROM tasks t WHERE t.workspace = s.workspace AND t.agent_id = s.agent_id) AS tasks "
+            "FROM sync_state s ORDER BY s.last_sync_at DESC"
+        )
+        return [dict(row) for row in rows]
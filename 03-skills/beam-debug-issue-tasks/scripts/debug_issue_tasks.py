@@ -22,6 +22,8 @@ Usage:
 import argparse
 import json
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from collections import defaultdict
@@ -30,7 +32,9 @@ from collections import defaultdict
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 try:
-    from _shared.beam_api import BeamClient
+    from _shared.beam_api import BeamClient, PAGE_WORKERS, paginate
+    from _shared.beam_cache import JsonFileCache
+    from _shared.beam_status import TERMINAL_STATUSES
     from _shared.langfuse_api import LangfuseClient, get_project_id, LANGFUSE_PROJECTS
 except ImportError as e:
     print(f"Error: Could not import shared modules: {e}")
@@ -42,6 +46,9 @@ except ImportError as e:
 ISSUE_STATUSES = ["FAILED", "ERROR", "ISSUE", "CANCELLED", "TIMEOUT", "STOPPED", "USER_INPUT_REQUIRED"]
 # Statuses to exclude (normal operation)
 EXCLUDE_STATUSES = ["IN_PROGRESS", "QUEUED", "COMPLETED", "COMPLETE", "RUNNING"]
+TRACE_WORKERS = 4  # Concurrent Langfuse trace lookups
+# Langfuse ingests traces asynchronously, so a session's trace list is re-read after this
+SESSION_CACHE_TTL = 6 * 3600
 
 
 def find_project_root() -> Path:
@@ -79,6 +86,63 @@ def get_agent_debug_dir(agent_name: str) -> Path:
     return debug_dir
 
 
+class TraceCache(JsonFileCache):
+    """
+    On-disk cache of Langfuse responses for tasks that have finished.
+
+    Entries are keyed by trace ID (full traces) or session ID plus the
+    task's updatedAt (trace lists, so a retried task gets a fresh list).
+    Empty results are never stored. Each entry records how long the
+    original fetch took, so hits can report the time they saved. Safe to
+    share between worker threads.
+    """
+
+    def __init__(self, cache_dir: Path = None, enabled: bool = True):
+        super().__init__(cache_dir or find_project_root() / "04-workspace" / ".trace-cache",
+                         read=enabled, write=enabled)
+        self.seconds_saved = 0.0
+        self.seconds_fetching = 0.0
+
+    def fetch(self, kind: str, key: str, fetch_fn, cacheable: bool = True, max_age: float = None):
+        """
+        Return a cached response, or call fetch_fn() and cache a non-empty result.
+
+        Args:
+            kind: 'trace' or 'session'
+            key: Trace ID, or session (task) ID + updatedAt
+            fetch_fn: Zero-argument function performing the API call
+            cacheable: False for tasks that may still change (bypasses cache)
+            max_age: Seconds after which a cached entry is refetched
+        """
+        use_cache = cacheable and bool(key)
+        if use_cache:
+            entry = self.get((kind, key), max_age=max_age)
+            if entry is not None:
+                with self._lock:
+                    self.seconds_saved += entry.get("fetch_seconds", 0.0)
+                return entry["data"]
+        else:
+            with self._lock:
+                self.misses += 1
+
+        started = time.perf_counter()
+        data = fetch_fn()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.seconds_fetching += elapsed
+
+        if use_cache and data:
+            self.put((kind, key), data, fetch_seconds=elapsed)
+        return data
+
+    def summary(self) -> str:
+        """One-line summary of hits, misses and time saved."""
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0
+        return (f"Trace cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate), "
+                f"~{self.seconds_saved:.1f}s saved, {self.seconds_fetching:.1f}s fetching")
+
+
 def save_debug_report(
     agent_name: str,
     task_id: str,
@@ -320,11 +384,15 @@ def fetch_all_tasks(
     start_date: str = None,
     end_date: str = None,
     max_pages: int = 50,
-    page_size: int = 100
+    page_size: int = 100,
+    max_workers: int = PAGE_WORKERS
 ) -> list:
     """
     Fetch all tasks across pages.
 
+    Page 1 establishes totalCount; the remaining pages are fetched
+    concurrently and merged in page order.
+
     Args:
         client: BeamClient instance
         agent_id: Agent ID
@@ -332,42 +400,25 @@ def fetch_all_tasks(
         end_date: ISO 8601 end date (optional)
         max_pages: Maximum pages to fetch
         page_size: Items per page (default 100)
+        max_workers: Concurrent page requests
 
     Returns:
         List of all tasks
     """
-    all_tasks = []
-    page = 1
-
-    while page <= max_pages:
-        result = list_agent_tasks(client, agent_id, start_date, end_date, limit=page_size, page=page)
-
-        # Handle nested structure: {"data": [{"tasks": [...]}], "totalCount": N}
-        data = result.get("data", [])
-        if data and isinstance(data, list) and len(data) > 0:
-            # New API format: tasks nested inside data[0].tasks
-            first_item = data[0]
-            if isinstance(first_item, dict) and "tasks" in first_item:
-                tasks = first_item.get("tasks", [])
-            else:
-                tasks = data
-        else:
-            # Old format: tasks directly in response
-            tasks = result.get("tasks", data)
-
-        if not tasks:
-            break
-
-        all_tasks.extend(tasks)
-
-        # Check if more pages
-        total = result.get("totalCount", result.get("total", len(all_tasks)))
-        if len(all_tasks) >= total:
-            break
-
-        page += 1
+    params = {"agentId": agent_id}
+    if start_date:
+        params["startDate"] = start_date
+    if end_date:
+        params["endDate"] = end_date
 
-    return all_tasks
+    return paginate(
+        client,
+        "/agent-tasks",
+        params,
+        page_size=page_size,
+        max_pages=max_pages,
+        max_workers=max_workers
+    )
 
 
 def filter_issue_tasks(tasks: list) -> list:
@@ -449,7 +500,12 @@ def extract_reasoning_from_content(content: str) -> str:
     return ""
 
 
-def analyze_trace_for_errors(langfuse: LangfuseClient, trace_id: str) -> dict:
+def analyze_trace_for_errors(
+    langfuse: LangfuseClient,
+    trace_id: str,
+    cache: TraceCache = None,
+    cacheable: bool = True
+) -> dict:
     """
     Analyze a trace for errors and issues by examining observations.
     Focuses on GENERATION spans: ParameterSelection, ExecuteGPT_Tool, NodeSelection:EdgeEvaluation
@@ -457,12 +513,17 @@ def analyze_trace_for_errors(langfuse: LangfuseClient, trace_id: str) -> dict:
     Args:
         langfuse: LangfuseClient instance
         trace_id: Trace ID to analyze
+        cache: Optional TraceCache for the full trace
+        cacheable: Whether the trace is final (task in a terminal status)
 
     Returns:
         Dict with error analysis results
     """
     try:
-        trace = langfuse.get_trace(trace_id)
+        if cache:
+            trace = cache.fetch("trace", trace_id, lambda: langfuse.get_trace(trace_id), cacheable)
+        else:
+            trace = langfuse.get_trace(trace_id)
         observations = trace.get("observations", [])
 
         errors = []
@@ -588,7 +649,10 @@ def get_task_trace_info(
     langfuse: LangfuseClient,
     task_id: str,
     project_id: str,
-    analyze_errors: bool = True
+    analyze_errors: bool = True,
+    cache: TraceCache = None,
+    task_status: str = None,
+    task_updated_at: str = None
 ) -> dict:
     """
     Get Langfuse trace information for a task.
@@ -598,12 +662,25 @@ def get_task_trace_info(
         task_id: Beam task ID (= Langfuse session ID)
         project_id: Langfuse project ID
         analyze_errors: Whether to analyze observations for errors
+        cache: Optional TraceCache (only used for terminal tasks)
+        task_status: Beam task status, used to decide cacheability
+        task_updated_at: Beam task updatedAt; part of the session cache key, so a
+                         retried task does not reuse the previous run's trace list
 
     Returns:
         Dict with trace info and URLs
     """
+    cacheable = (task_status or "").upper() in TERMINAL_STATUSES
     try:
-        traces = langfuse.get_traces_by_session(task_id, limit=10)
+        if cache:
+            traces = cache.fetch(
+                "session", f"{task_id}_{task_updated_at or ''}",
+                lambda: langfuse.get_traces_by_session(task_id, limit=10),
+                cacheable,
+                max_age=SESSION_CACHE_TTL
+            )
+        else:
+            traces = langfuse.get_traces_by_session(task_id, limit=10)
 
         if not traces:
             return {
@@ -633,7 +710,7 @@ def get_task_trace_info(
 
         # Analyze for errors if requested
         if analyze_errors and trace_id:
-            analysis = analyze_trace_for_errors(langfuse, trace_id)
+            analysis = analyze_trace_for_errors(langfuse, trace_id, cache, cacheable)
             result["analysis"] = analysis
 
         return result
@@ -800,11 +877,19 @@ Environment Variables (in .env):
                         help="Max tasks to show details for (default: 10)")
     parser.add_argument("--page-size", type=int, default=100,
                         help="Page size for API calls (default: 100)")
+    parser.add_argument("--workers", type=int, default=PAGE_WORKERS,
+                        help=f"Pages fetched concurrently (default: {PAGE_WORKERS})")
+    parser.add_argument("--store", action="store_true",
+                        help="With --days: sync only the delta into the local task store and read tasks from it")
     parser.add_argument("--scan-first", type=int, default=100,
                         help="Scan first N tasks without date filter (default: 100)")
     parser.add_argument("--output", "-o", help="Output file path (JSON)")
     parser.add_argument("--no-trace", action="store_true",
                         help="Skip Langfuse trace lookup")
+    parser.add_argument("--trace-workers", type=int, default=TRACE_WORKERS,
+                        help=f"Concurrent Langfuse trace lookups (default: {TRACE_WORKERS})")
+    parser.add_argument("--no-trace-cache", action="store_true",
+                        help="Bypass the on-disk trace cache (04-workspace/.trace-cache)")
     parser.add_argument("--save", action="store_true",
                         help="Save debug report to 04-workspace/agents/{agent_name}/debug/")
 
@@ -815,6 +900,7 @@ Environment Variables (in .env):
         beam = BeamClient(workspace=args.workspace)
         project_id = get_project_id(args.project)
         langfuse = LangfuseClient(project_id=project_id)
+        trace_cache = TraceCache(enabled=not args.no_trace_cache)
 
         # Calculate date range (only if --days specified)
         start_str = None
@@ -846,7 +932,11 @@ Environment Variables (in .env):
             # Get Langfuse traces
             if not args.no_trace:
                 print(f"\n--- Langfuse Trace Info ---")
-                trace_info = get_task_trace_info(langfuse, args.task_id, project_id)
+                trace_info = get_task_trace_info(
+                    langfuse, args.task_id, project_id,
+                    cache=trace_cache, task_status=task.get("status"),
+                    task_updated_at=task.get("updatedAt")
+                )
 
                 if trace_info.get("found"):
                     print(f"Traces found: {trace_info.get('trace_count')}")
@@ -940,7 +1030,19 @@ Environment Variables (in .env):
         if args.days:
             # Date-filtered mode
             print(f"Date range: {start_str} to {end_str}")
-            all_tasks = fetch_all_tasks(beam, args.agent_id, start_str, end_str, page_size=args.page_size)
+            if args.store:
+                from _shared.beam_task_store import TaskStore
+                with TaskStore() as store:
+                    sync = store.sync(beam, args.agent_id, days=args.days, max_workers=args.workers)
+                    print(f"Task store: fetched {sync['fetched']} new/changed tasks ({sync['seconds']}s)")
+                    if not sync["complete"]:
+                        print("[WARN] Task store sync hit the page cap; counts may be incomplete")
+                    all_tasks = store.query(args.agent_id, days=args.days, workspace=args.workspace)
+            else:
+                all_tasks = fetch_all_tasks(
+                    beam, args.agent_id, start_str, end_str,
+                    page_size=args.page_size, max_workers=args.workers
+                )
             print(f"Found {len(all_tasks)} total tasks in date range")
         else:
             # No date filter - scan first N tasks
@@ -963,14 +1065,24 @@ Environment Variables (in .env):
             print(f"\n--- Issue Tasks ({len(issue_tasks)} found) ---\n")
 
             tasks_to_show = issue_tasks[:args.limit]
-            for i, task in enumerate(tasks_to_show, 1):
-                task_id = task.get("id")
-                print(f"[{i}/{len(tasks_to_show)}] {'-'*50}")
-
-                trace_info = None
-                if not args.no_trace:
-                    trace_info = get_task_trace_info(langfuse, task_id, project_id)
 
+            # Fetch and analyze traces concurrently; print in task order
+            trace_infos = [None] * len(tasks_to_show)
+            if not args.no_trace and tasks_to_show:
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=max(1, args.trace_workers)) as pool:
+                    trace_infos = list(pool.map(
+                        lambda t: get_task_trace_info(
+                            langfuse, t.get("id"), project_id,
+                            cache=trace_cache, task_status=t.get("status"),
+                            task_updated_at=t.get("updatedAt")
+                        ),
+                        tasks_to_show
+                    ))
+                trace_seconds = time.perf_counter() - started
+
+            for i, (task, trace_info) in enumerate(zip(tasks_to_show, trace_infos), 1):
+                print(f"[{i}/{len(tasks_to_show)}] {'-'*50}")
                 print(f"  {format_task_summary(task, trace_info)}")
                 print()
 
@@ -978,6 +1090,11 @@ Environment Variables (in .env):
                 print(f"...and {len(issue_tasks) - args.limit} more issue tasks")
                 print(f"Use --limit to show more, or --task-id to debug specific task")
 
+            if not args.no_trace and tasks_to_show:
+                print(f"\n{trace_cache.summary()}")
+                print(f"Trace analysis: {len(tasks_to_show)} tasks in {trace_seconds:.1f}s "
+                      f"({args.trace_workers} workers)")
+
         else:
             if args.days:
                 print(f"\nNo issue tasks found in the last {args.days} day(s)")
@@ -1001,7 +1118,7 @@ Environment Variables (in .env):
         print(f"Configuration error: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        if hasattr(e, 'response'):
+        if getattr(e, 'response', None) is not None:
             print(f"API error: {e.response.status_code} - {e.response.text}", file=sys.stderr)
         else:
             print(f"Error: {e}", file=sys.stderr)
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Beam.ai Batch Agent Analytics
+
+Fetch /agent-tasks/analytics for many agents across several date windows
+concurrently, and report one consolidated table with window-over-window
+deltas computed locally.
+
+Results for closed windows (ending before today, UTC) never change, so they
+are cached permanently under 04-workspace/.analytics-cache/; re-running the
+weekly review only fetches the open window and anything new.
+
+Usage:
+    # Last 4 complete ISO weeks (Mon-Sun) for a list of agents
+    python batch_analytics.py --agent-ids AGENT1 AGENT2 AGENT3
+
+    # Agents from a file (one ID per line, or JSON from list_agents/other scripts)
+    python batch_analytics.py --from-file agents.txt --weeks 4 --include-current
+
+    # Explicit windows, JSON / CSV output
+    python batch_analytics.py --from-file agents.json --window 2024-01-01:2024-01-07 \\
+        --window 2024-01-08:2024-01-14 --json
+    python batch_analytics.py --from-file agents.txt --csv weekly.csv
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent directories to path for shared module import
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+try:
+    from _shared.beam_api import BeamClient, RateLimiter, RATE_LIMIT, find_project_root, run_concurrently
+    from _shared.beam_cache import JsonFileCache
+    from _shared.beam_ids import load_agent_ids
+except ImportError as e:
+    print(f"Error: Could not import shared modules: {e}")
+    print("Ensure 03-skills/_shared/beam_api.py exists")
+    sys.exit(1)
+
+from get_agent_analytics import get_agent_analytics, format_seconds
+
+
+BATCH_WORKERS = 8   # Concurrent analytics requests (still bounded by --rate)
+
+# currentPeriod fields kept per window
+METRICS = {
+    "total": "totalTasks",
+    "completed": "completedTasks",
+    "failed": "failedTasks",
+    "avg_eval": "averageEvaluationScore",
+    "avg_runtime": "averageRuntimeSeconds",
+    "negative_feedback": "negativeFeedbackCount",
+}
+
+
+class AnalyticsCache(JsonFileCache):
+    """
+    On-disk cache of analytics responses for closed windows.
+
+    One entry per workspace / agent / window. Open windows are never
+    cached because their numbers still change. Safe to share between
+    worker threads.
+    """
+
+    def __init__(self, cache_dir: Path = None, enabled: bool = True):
+        # Written even with --no-cache so the next run can use it
+        super().__init__(cache_dir or find_project_root() / "04-workspace" / ".analytics-cache", read=enabled)
+
+    def fetch(self, workspace: str, agent_id: str, window: tuple, fetch_fn, cacheable: bool):
+        """
+        Return the cached response for a closed window, or call fetch_fn().
+
+        Returns:
+            (data, from_cache)
+        """
+        start, end = window
+        key = (workspace, agent_id, f"{start:%Y%m%d}_{end:%Y%m%d}")
+        if cacheable:
+            entry = self.get(key)
+            if entry is not None:
+                return entry["data"], True
+        else:
+            with self._lock:
+                self.misses += 1
+
+        data = fetch_fn()
+        if cacheable:
+            self.put(key, data, agent_id=agent_id, window=[str(w) for w in window])
+        return data, False
+
+
+def weekly_windows(weeks: int, include_current: bool = False, today: date = None) -> list:
+    """
+    ISO weeks (Monday-Sunday, UTC), oldest first.
+
+    Args:
+        weeks: Number of complete weeks before the current one
+        include_current: Also include the current (open) week
+    """
+    today = today or datetime.now(timezone.utc).date()
+    this_monday = today - timedelta(days=today.weekday())
+    windows = [(this_monday - timedelta(weeks=n), this_monday - timedelta(weeks=n) + timedelta(days=6))
+               for n in range(weeks, 0, -1)]
+    if include_current:
+        windows.append((this_monday, this_monday + timedelta(days=6)))
+    return windows
+
+
+def parse_window(value: str) -> tuple:
+    """Parse 'YYYY-MM-DD:YYYY-MM-DD' (inclusive) into a (start, end) date tuple."""
+    try:
+        start, end = (date.fromisoformat(part.strip()) for part in value.split(":", 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid window {value!r}, expected YYYY-MM-DD:YYYY-MM-DD")
+    if end < start:
+        raise argparse.ArgumentTypeError(f"Window {value!r} ends before it starts")
+    return start, end
+
+
+def summarize(analytics: dict) -> dict:
+    """Pick the per-window metrics from an analytics response."""
+    current = (analytics or {}).get("currentPeriod", {}) or {}
+    row = {name: current.get(field) for name, field in METRICS.items()}
+    for name in ("total", "completed", "failed", "negative_feedback"):
+        row[name] = row[name] or 0
+    row["failure_rate"] = round(row["failed"] / row["total"] * 100, 2) if row["total"] else None
+    return row
+
+
+def combine(rows: list) -> dict:
+    """Sum counts and task-weight the averages across agents for one window."""
+    rows = [r for r in rows if r and not r.get("error")]
+    total = sum(r["total"] for r in rows)
+    combined = {name: sum(r[name] for r in rows) for name in ("total", "completed", "failed", "negative_feedback")}
+    for name in ("avg_eval", "avg_runtime"):
+        weighted = [(r[name], r["total"]) for r in rows if r[name] is not None and r["total"]]
+        weight = sum(w for _, w in weighted)
+        combined[name] = round(sum(v * w for v, w in weighted) / weight, 2) if weight else None
+    combined["failure_rate"] = round(combined["failed"] / total * 100, 2) if total else None
+    return combined
+
+
+def compute_delta(previous: dict, current: dict) -> dict:
+    """Change from the previous window (absolute, plus % for volumes; pp for failure rate)."""
+    if not previous or not current or previous.get("error") or current.get("error"):
+        return None
+
+    def diff(name):
+        if previous.get(name) is None or current.get(name) is None:
+            return None
+        return round(current[name] - previous[name], 2)
+
+    def pct(name):
+        if not previous.get(name) or current.get(name) is None:
+            return None
+        return round((current[name] - previous[name]) / previous[name] * 100, 1)
+
+    return {
+        "total": diff("total"),
+        "total_pct": pct("total"),
+        "completed": diff("completed"),
+        "failed": diff("failed"),
+        "failed_pct": pct("failed"),
+        "failure_rate_pp": diff("failure_rate"),
+        "avg_eval": diff("avg_eval"),
+        "avg_runtime_pct": pct("avg_runtime"),
+    }
+
+
+def run_batch(client, agent_ids: list, windows: list, workspace: str, cache: AnalyticsCache,
+              workers: int = BATCH_WORKERS, rate: float = RATE_LIMIT, names: bool = True) -> dict:
+    """
+    Fetch every (agent, window) pair concurrently and build the report.
+
+    Returns:
+        Report dict with windows, per-agent rows (with deltas), totals and stats
+    """
+    today = datetime.now(timezone.utc).date()
+    limiter = RateLimiter(rate)
+    jobs = [(agent_id, window) for agent_id in agent_ids for window in windows]
+
+    def fetch(job):
+        agent_id, window = job
+        start, end = window
+        try:
+            data, cached = cache.fetch(
+                workspace, agent_id, window,
+                lambda: get_agent_analytics(client, agent_id, f"{start}T00:00:00Z", f"{end}T23:59:59Z"),
+                cacheable=end < today
+            )
+            return {**summarize(data), "cached": cached}
+        except Exception as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            return {"error": f"HTTP {status}" if status else str(e)[:200], "cached": False}
+
+    def fetch_name(agent_id):
+        try:
+            return client.get(f"/agent/{agent_id}").get("name") or agent_id
+        except Exception:
+            return agent_id
+
+    started = time.perf_counter()
+    results = run_concurrently(fetch, jobs, max_workers=workers, limiter=limiter)
+    agent_names = dict(zip(agent_ids, run_concurrently(fetch_name, agent_ids, max_workers=workers,
+                                                       limiter=limiter))) if names else {}
+    elapsed = time.perf_counter() - started
+
+    by_agent = {}
+    for (agent_id, window), row in zip(jobs, results):
+        by_agent.setdefault(agent_id, []).append({"start": str(window[0]), "end": str(window[1]),
+                                                  "closed": window[1] < today, **row})
+
+    agents = []
+    for agent_id in agent_ids:
+        rows = by_agent[agent_id]
+        for previous, current in zip([None] + rows[:-1], rows):
+            current["delta"] = compute_delta(previous, current)
+        agents.append({"agent_id": agent_id, "name": agent_names.get(agent_id, agent_id), "windows": rows})
+
+    totals = []
+    for position, window in enumerate(windows):
+        combined = combine([agent["windows"][position] for agent in agents])
+        totals.append({"start": str(window[0]), "end": str(window[1]), **combined,
+                       "delta": compute_delta(totals[-1], combined) if totals else None})
+
+    return {
+        "workspace": workspace,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+        "windows": [{"start": str(s), "end": str(e), "closed": e < today} for s, e in windows],
+        "agents": agents,
+        "totals": totals,
+        "stats": {"requests": len(jobs), "fetched": cache.misses, "cached": cache.hits,
+                  "errors": sum(1 for r in results if r.get("error")), "seconds": round(elapsed, 2)},
+    }
+
+
+def format_change(value, suffix="") -> str:
+    if value is None:
+        return "-"
+    return f"{value:+.1f}{suffix}" if isinstance(value, float) else f"{value:+d}{suffix}"
+
+
+def print_report(report: dict):
+    """Consolidated table: tasks / failure rate per window, then last-window deltas."""
+    windows = report["windows"]
+    cell = 16
+    header = f"{'Agent':<32}" + "".join(f"{w['start'][5:]}..{w['end'][5:]:<{cell - 7}}" for w in windows)
+    print(f"\nBatch Agent Analytics ({report['workspace']}): {len(report['agents'])} agents x {len(windows)} windows")
+    print("Cells: tasks / failure rate.  Delta: last window vs previous (tasks %, failure rate pp, eval)")
+    print()
+    print(header + "  Delta")
+    print("-" * (len(header) + 30))
+
+    def cells(rows):
+        out = ""
+        for row in rows:
+            if row.get("error"):
+                text = row["error"][:cell - 2]
+            else:
+                rate = f"{row['failure_rate']:.1f}%" if row.get("failure_rate") is not None else "-"
+                text = f"{row['total']} / {rate}"
+            out += f"{text:<{cell}}"
+        return out
+
+    def delta_text(delta):
+        if not delta:
+            return "-"
+        return (f"{format_change(delta['total_pct'], '%')} tasks, "
+                f"{format_change(delta['failure_rate_pp'], 'pp')} fail, "
+                f"{format_change(delta['avg_eval'])} eval")
+
+    for agent in report["agents"]:
+        name = agent["name"] if agent["name"] != agent["agent_id"] else agent["agent_id"][:8]
+        print(f"{name[:31]:<32}" + cells(agent["windows"]) + "  " + delta_text(agent["windows"][-1]["delta"]))
+    print("-" * (len(header) + 30))
+    totals = report["totals"]
+    print(f"{'TOTAL':<32}" + cells(totals) + "  " + delta_text(totals[-1]["delta"] if totals else None))
+
+    if totals:
+        last = totals[-1]
+        if last.get("avg_runtime") is not None:
+            print(f"\nLast window avg runtime: {format_seconds(last['avg_runtime'])}"
+                  f" ({format_change((last['delta'] or {}).get('avg_runtime_pct'), '%')})")
+    stats = report["stats"]
+    print(f"\n[OK] {stats['requests']} windows: {stats['fetched']} fetched, {stats['cached']} from cache, "
+          f"{stats['errors']} errors in {stats['seconds']}s")
+
+
+def write_csv(report: dict, path: str):
+    """Long format: one row per agent and window."""
+    fields = ["agent_id", "name", "start", "end", "closed", "total", "completed", "failed", "failure_rate",
+              "avg_eval", "avg_runtime", "negative_feedback", "delta_total", "delta_total_pct",
+              "delta_failure_rate_pp", "delta_avg_eval", "delta_avg_runtime_pct", "cached", "error"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for agent in report["agents"]:
+            for row in agent["windows"]:
+                delta = row.get("delta") or {}
+                writer.writerow({
+                    "agent_id": agent["agent_id"], "name": agent["name"], **row,
+                    "delta_total": delta.get("total"), "delta_total_pct": delta.get("total_pct"),
+                    "delta_failure_rate_pp": delta.get("failure_rate_pp"),
+                    "delta_avg_eval": delta.get("avg_eval"), "delta_avg_runtime_pct": delta.get("avg_runtime_pct"),
+                })
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Analytics for many Beam.ai agents across date windows, with window-over-window deltas",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # Last 4 complete weeks for three agents
+    python batch_analytics.py --agent-ids abc123 def456 ghi789
+
+    # Weekly review: agents from file, include the current week, production
+    python batch_analytics.py --from-file agents.txt --include-current --workspace prod
+
+    # Explicit windows as JSON
+    python batch_analytics.py --agent-ids abc123 --window 2024-01-01:2024-01-07 --window 2024-01-08:2024-01-14 --json
+
+Closed windows are cached in 04-workspace/.analytics-cache/ (delete to reset).
+"""
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--agent-ids", nargs="+", help="Agent IDs")
+    source.add_argument("--from-file", help="File with agent IDs (one per line, or JSON list)")
+
+    parser.add_argument("--weeks", type=int, default=4, help="Complete ISO weeks to report (default: 4)")
+    parser.add_argument("--include-current", action="store_true", help="Also report the current (open) week")
+    parser.add_argument("--window", action="append", type=parse_window, default=[],
+                        help="Explicit window START:END (YYYY-MM-DD, inclusive); repeatable, replaces --weeks")
+    parser.add_argument("--workspace", "-w", default="bid", choices=["bid", "prod"],
+                        help="Beam workspace (default: bid)")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS,
+                        help=f"Concurrent requests (default: {BATCH_WORKERS})")
+    parser.add_argument("--rate", type=float, default=RATE_LIMIT,
+                        help=f"Max requests per second (default: {RATE_LIMIT:g})")
+    parser.add_argument("--no-cache", action="store_true", help="Re-fetch closed windows (cache is refreshed)")
+    parser.add_argument("--no-names", action="store_true", help="Skip agent name lookups")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--output", "-o", help="Save JSON report to file")
+    parser.add_argument("--csv", help="Save one row per agent and window to a CSV file")
+
+    args = parser.parse_args()
+
+    try:
+        agent_ids = list(dict.fromkeys(args.agent_ids or load_agent_ids(args.from_file)))
+        if not agent_ids:
+            print("[ERROR] No agent IDs given", file=sys.stderr)
+            sys.exit(1)
+        windows = sorted(args.window) if args.window else weekly_windows(args.weeks, args.include_current)
+        if not windows:
+            print("[ERROR] No windows to report (use --weeks N or --window)", file=sys.stderr)
+            sys.exit(1)
+
+        client = BeamClient(workspace=args.workspace)
+        cache = AnalyticsCache(enabled=not args.no_cache)
+        if not args.json:
+            print(f"[INFO] {len(agent_ids)} agents x {len(windows)} windows "
+                  f"({args.workers} workers, {args.rate:g} req/s)", file=sys.stderr)
+
+        report = run_batch(client, agent_ids, windows, args.workspace, cache,
+                           workers=args.workers, rate=args.rate, names=not args.no_names)
+
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_report(report)
+
+        if args.output:
+            Path(args.output).write_text(json.dumps(report, indent=2))
+            print(f"Results saved to: {args.output}", file=sys.stderr)
+        if args.csv:
+            write_csv(report, args.csv)
+            print(f"CSV saved to: {args.csv}", file=sys.stderr)
+
+    except ValueError as e:
+        print(f"Configuration error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        if hasattr(e, 'response') and e.response is not None:
+            print(f"API error: {e.response.status_code} - {e.response.text}", file=sys.stderr)
+        else:
+            print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,7 +25,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 try:
-    from _shared.beam_api import BeamClient
+    from _shared.beam_api import BeamClient, run_concurrently
 except ImportError as e:
     print(f"Error: Could not import shared modules: {e}")
     print("Ensure 03-skills/_shared/beam_api.py exists")
@@ -240,19 +240,27 @@ Environment Variables (in .env at project root):
             start_date = start.strftime("%Y-%m-%dT00:00:00Z")
             end_date = end.strftime("%Y-%m-%dT23:59:59Z")
 
-        # Get agent info for display
-        try:
-            agent_info = client.get(f"/agent/{args.agent_id}")
-            agent_name = agent_info.get("name", args.agent_id)
-        except Exception:
-            agent_name = args.agent_id
+        # Get agent info for display (fetched alongside the analytics)
+        def fetch_agent_name():
+            try:
+                agent_info = client.get(f"/agent/{args.agent_id}")
+                return agent_info.get("name", args.agent_id)
+            except Exception:
+                return args.agent_id
 
         # Get analytics
-        analytics = get_agent_analytics(
-            client,
-            args.agent_id,
-            start_date,
-            end_date
+        def fetch_analytics():
+            return get_agent_analytics(
+                client,
+                args.agent_id,
+                start_date,
+                end_date
+            )
+
+        agent_name, analytics = run_concurrently(
+            lambda fetch: fetch(),
+            [fetch_agent_name, fetch_analytics],
+            max_workers=2
         )
 
         # Output
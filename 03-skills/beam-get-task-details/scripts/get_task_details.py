@@ -8,9 +8,12 @@ Usage:
     # Get details for a single task
     python get_task_details.py <task_id>
 
-    # Get details for multiple tasks
+    # Get details for multiple tasks (fetched concurrently, printed in order)
     python get_task_details.py <task_id1> <task_id2>
 
+    # Hundreds of tasks from a file (IDs, JSON or NDJSON from other beam scripts)
+    python get_task_details.py --from-file issue_tasks.json --json --output details.json
+
     # Output as JSON
     python get_task_details.py <task_id> --json
 """
@@ -18,6 +21,7 @@ Usage:
 import argparse
 import json
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -25,13 +29,43 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 try:
-    from _shared.beam_api import BeamClient
+    from _shared.beam_api import BeamClient, RateLimiter, RATE_LIMIT, find_project_root, run_concurrently
+    from _shared.beam_cache import JsonFileCache
+    from _shared.beam_ids import load_task_ids
+    from _shared.beam_status import COMPLETED_STATUSES
 except ImportError as e:
     print(f"Error: Could not import shared modules: {e}")
     print("Ensure 03-skills/_shared/beam_api.py exists")
     sys.exit(1)
 
 
+DETAIL_WORKERS = 8   # Concurrent task fetches (still bounded by --rate)
+
+
+class TaskCache(JsonFileCache):
+    """
+    On-disk cache of task details for completed tasks, one entry per
+    workspace and task ID.
+
+    Only COMPLETED tasks are stored: running tasks still change, and failed
+    or stopped tasks can be re-run in place by beam-retry-tasks.
+    """
+
+    def __init__(self, workspace: str, cache_dir: Path = None, enabled: bool = True):
+        super().__init__(Path(cache_dir or find_project_root() / "04-workspace" / ".task-cache") / workspace,
+                         read=enabled)
+
+    def get_task(self, task_id: str):
+        """Cached task dict, or None."""
+        entry = self.get(task_id)
+        return entry["data"] if entry else None
+
+    def put_task(self, task_id: str, task: dict):
+        """Store a task if it has completed."""
+        if str(task.get("status", "")).upper() in COMPLETED_STATUSES:
+            self.put(task_id, task, updated_at=task.get("updatedAt"))
+
+
 def get_task_details(client: BeamClient, task_id: str) -> dict:
     """
     Get details for a specific task.
@@ -46,6 +80,54 @@ def get_task_details(client: BeamClient, task_id: str) -> dict:
     return client.get(f"/agent-tasks/{task_id}")
 
 
+def fetch_task_details(
+    client: BeamClient,
+    task_ids: list,
+    cache: TaskCache = None,
+    max_workers: int = DETAIL_WORKERS,
+    rate: float = RATE_LIMIT
+) -> list:
+    """
+    Fetch many tasks concurrently, serving completed tasks from the cache.
+
+    Args:
+        client: BeamClient instance
+        task_ids: Task IDs (order is preserved)
+        cache: TaskCache (optional)
+        max_workers: Concurrent requests
+        rate: Max requests per second across workers
+
+    Returns:
+        List of (task_id, task or None, error or None) in input order
+    """
+    limiter = RateLimiter(rate)
+    done = [0]
+    lock = threading.Lock()
+    show_progress = len(task_ids) >= 50
+
+    def fetch(task_id):
+        task, error = (cache.get_task(task_id) if cache else None), None
+        if task is None:
+            limiter.acquire()
+            try:
+                task = get_task_details(client, task_id)
+                if cache:
+                    cache.put_task(task_id, task)
+            except Exception as e:
+                if hasattr(e, 'response') and e.response is not None:
+                    error = f"{e.response.status_code} - {e.response.text[:100]}"
+                else:
+                    error = str(e)
+        if show_progress:
+            with lock:
+                done[0] += 1
+                if done[0] % 50 == 0 or done[0] == len(task_ids):
+                    print(f"[INFO] {done[0]}/{len(task_ids)} tasks fetched", file=sys.stderr)
+        return task_id, task, error
+
+    return run_concurrently(fetch, task_ids, max_workers=max_workers)
+
+
 def calculate_duration(created: str, completed: str) -> str:
     """Calculate duration between two timestamps."""
     if not created or not completed:
@@ -225,9 +307,30 @@ Environment Variables (in .env at project root):
 
     parser.add_argument(
         "task_ids",
-        nargs="+",
+        nargs="*",
         help="One or more task IDs to fetch"
     )
+    parser.add_argument(
+        "--from-file", "-f",
+        help="File with task IDs (one per line, JSON or NDJSON output of other beam scripts)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DETAIL_WORKERS,
+        help=f"Concurrent requests (default: {DETAIL_WORKERS})"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=RATE_LIMIT,
+        help=f"Max requests per second (default: {RATE_LIMIT:g})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch from the API (completed tasks are still written to the cache)"
+    )
     parser.add_argument(
         "--workspace", "-w",
         default="bid",
@@ -252,24 +355,31 @@ Environment Variables (in .env at project root):
     args = parser.parse_args()
 
     try:
+        task_ids = list(args.task_ids)
+        if args.from_file:
+            task_ids.extend(load_task_ids(args.from_file))
+        task_ids = list(dict.fromkeys(task_ids))
+        if not task_ids:
+            parser.error("provide task IDs or --from-file")
+
         # Initialize client
         client = BeamClient(workspace=args.workspace)
+        cache = TaskCache(args.workspace, enabled=not args.no_cache)
 
         all_tasks = []
 
-        for task_id in args.task_ids:
-            try:
-                task = get_task_details(client, task_id)
-                all_tasks.append(task)
+        for task_id, task, error in fetch_task_details(client, task_ids, cache, args.workers, args.rate):
+            if error:
+                print(f"Error fetching {task_id}: {error}", file=sys.stderr)
+                continue
+            all_tasks.append(task)
 
-                if not args.json:
-                    print_task_details(task, show_full=args.full)
+            if not args.json:
+                print_task_details(task, show_full=args.full)
 
-            except Exception as e:
-                if hasattr(e, 'response'):
-                    print(f"Error fetching {task_id}: {e.response.status_code} - {e.response.text[:100]}")
-                else:
-                    print(f"Error fetching {task_id}: {e}")
+        if len(task_ids) > 1:
+            print(f"[INFO] {len(all_tasks)}/{len(task_ids)} tasks ({cache.hits} from cache, "
+                  f"{cache.misses} fetched)", file=sys.stderr)
 
         # JSON output
         if args.json:
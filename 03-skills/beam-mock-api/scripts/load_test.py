@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Beam API Load Test
+
+Runs the Beam clients and engines against an in-process mock Beam API
+(mock_beam_server.py) and reports throughput and p50/p90/p99 latency.
+
+Scenarios:
+    client     03-skills BeamClient: GET /agent-tasks/{id} from a worker pool
+    master     beam-master BeamClient (auth, 401 replay, 429/5xx retries): same requests
+    fetch-all  debug_issue_tasks.fetch_all_tasks: every page of one agent's tasks
+    retry      retry_tasks.run_retries: POST /agent-tasks/retry for FAILED tasks
+
+Request latency is measured per HTTP round trip (session response hook);
+operation latency per client call (including client-side retries).
+
+Usage:
+    # All scenarios, 10ms latency, 500 requests on 8 workers
+    python load_test.py --latency-ms 10 --requests 500 --workers 8
+
+    # How do the clients behave under 5% 429s and 2% 5xx?
+    python load_test.py --scenario client master --rate-limit-rate 0.05 --error-rate 0.02 --retry-after 0.1
+
+    # Pagination with 20k tasks, tail latency, JSON report
+    python load_test.py --scenario fetch-all --tasks 20000 --agents 1 --latency-ms 30 --slow-rate 0.02 --json
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SKILLS_DIR = SCRIPT_DIR.parent.parent
+PROJECT_ROOT = SKILLS_DIR.parent
+BEAM_MASTER_DIR = PROJECT_ROOT / "00-system" / "skills" / "beam" / "beam-master" / "scripts"
+sys.path.insert(0, str(SKILLS_DIR))
+sys.path.insert(0, str(SCRIPT_DIR))
+
+try:
+    from _shared.beam_api import BeamClient, POOL_MAXSIZE, run_concurrently
+    from mock_beam_server import add_mock_arguments, api_from_args, start_server
+except ImportError as e:
+    print(f"Error: Could not import shared modules: {e}")
+    print("Ensure 03-skills/_shared/beam_api.py exists")
+    sys.exit(1)
+
+
+SCENARIOS = ["client", "master", "fetch-all", "retry"]
+
+
+def percentile(samples: list, pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0 if empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize_ms(samples: list) -> dict:
+    """Count and p50/p90/p99/max of second-valued samples, in milliseconds."""
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p90_ms": round(percentile(samples, 90) * 1000, 2),
+        "p99_ms": round(percentile(samples, 99) * 1000, 2),
+        "max_ms": round(max(samples, default=0) * 1000, 2),
+    }
+
+
+class LatencyRecorder:
+    """Collects per-request latency and status codes from a requests.Session response hook."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = []
+        self.statuses = {}
+
+    def attach(self, session):
+        session.hooks["response"].append(self._record)
+
+    def _record(self, response, *args, **kwargs):
+        with self._lock:
+            self.latencies.append(response.elapsed.total_seconds())
+            self.statuses[response.status_code] = self.statuses.get(response.status_code, 0) + 1
+
+
+def stub_module(name: str) -> types.ModuleType:
+    """Placeholder for a module a scenario never calls: every attribute raises when used."""
+    module = types.ModuleType(name)
+
+    def unavailable(*args, **kwargs):
+        raise RuntimeError(f"{name} is not available (load-test stub)")
+
+    module.__getattr__ = lambda attr: unavailable
+    return module
+
+
+def load_script(name: str, path: Path, optional_modules: tuple = ()):
+    """
+    Import a skill script as a module (its main() is not run).
+
+    Args:
+        name: Module name
+        path: Script path
+        optional_modules: Modules the script imports but the scenario never
+                          uses; missing ones are stubbed for the import only
+
+    Returns:
+        The module, or None if the script exits on a missing dependency
+    """
+    stubbed = [m for m in optional_modules if m not in sys.modules and importlib.util.find_spec(m) is None]
+    for module_name in stubbed:
+        sys.modules[module_name] = stub_module(module_name)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            spec.loader.exec_module(module)
+    except SystemExit:
+        return None
+    finally:
+        for module_name in stubbed:
+            sys.modules.pop(module_name, None)
+    return module
+
+
+def timed_calls(fn, items, workers: int) -> tuple:
+    """
+    Run fn(item) on a worker pool, timing each call.
+
+    Returns:
+        (op latencies in seconds, error count, first error message)
+    """
+    def call(item):
+        started = time.perf_counter()
+        try:
+            fn(item)
+            error = None
+        except Exception as e:
+            error = " ".join(str(e).split())[:120]
+        return time.perf_counter() - started, error
+
+    results = run_concurrently(call, items, max_workers=workers)
+    errors = [error for _, error in results if error]
+    return [seconds for seconds, _ in results], len(errors), errors[0] if errors else None
+
+
+def scenario_client(api, args, recorder) -> dict:
+    client = BeamClient(workspace="bid", pool_maxsize=max(POOL_MAXSIZE, args.workers))
+    recorder.attach(client.session)
+    task_ids = [api.tasks[i % len(api.tasks)]["id"] for i in range(args.requests)]
+    ops, errors, first_error = timed_calls(lambda task_id: client.get(f"/agent-tasks/{task_id}"),
+                                           task_ids, args.workers)
+    stats = client.connection_stats()
+    client.close()
+    return {"ops": ops, "errors": errors, "first_error": first_error, "connections": stats}
+
+
+def scenario_master(api, args, recorder) -> dict:
+    sys.path.insert(0, str(BEAM_MASTER_DIR))
+    import beam_client
+    beam_client.BASE_URL = os.environ["BEAM_API_BASE_URL"]
+    client = beam_client.BeamClient(pool_maxsize=max(POOL_MAXSIZE, args.workers), token_cache=False)
+    recorder.attach(client.session)
+    task_ids = [api.tasks[i % len(api.tasks)]["id"] for i in range(args.requests)]
+    ops, errors, first_error = timed_calls(lambda task_id: client.get(f"/agent-tasks/{task_id}"),
+                                           task_ids, args.workers)
+    stats = client.connection_stats()
+    result = {"ops": ops, "errors": errors, "first_error": first_error, "connections": stats,
+              "client_retries": client.retries}
+    client.close()
+    return result
+
+
+def scenario_fetch_all(api, args, recorder) -> dict:
+    # fetch_all_tasks only pages /agent-tasks; the Langfuse client is needed for traces alone
+    debug = load_script("debug_issue_tasks",
+                        SKILLS_DIR / "beam-debug-issue-tasks" / "scripts" / "debug_issue_tasks.py",
+                        optional_modules=("_shared.langfuse_api",))
+    if debug is None:
+        return {"skipped": "debug_issue_tasks.py could not import its dependencies"}
+    agent_id = args.agent_id or next(iter(api.agents))
+    client = BeamClient(workspace="bid", pool_maxsize=max(POOL_MAXSIZE, args.workers))
+    recorder.attach(client.session)
+    fetched = []
+
+    def fetch(_):
+        tasks = debug.fetch_all_tasks(client, agent_id, page_size=args.page_size,
+                                      max_pages=args.max_pages, max_workers=args.workers)
+        fetched.append(len(tasks))
+
+    ops, errors, first_error = timed_calls(fetch, range(args.repeat), 1)
+    stats = client.connection_stats()
+    client.close()
+    return {"ops": ops, "errors": errors, "first_error": first_error, "connections": stats,
+            "tasks_per_fetch": max(fetched, default=0)}
+
+
+def scenario_retry(api, args, recorder) -> dict:
+    retry = load_script("retry_tasks", SKILLS_DIR / "beam-retry-tasks" / "scripts" / "retry_tasks.py")
+    if retry is None:
+        return {"skipped": "retry_tasks.py could not import its dependencies"}
+    failed = [t for t in api.tasks if t["status"] in ("FAILED", "ERROR", "STOPPED", "TIMEOUT")]
+    tasks = [{"task_id": t["id"], "custom_id": t["customId"]} for t in failed[:args.requests]]
+    client = BeamClient(workspace="bid", pool_maxsize=max(POOL_MAXSIZE, args.workers))
+    recorder.attach(client.session)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = retry.RetryJournal(Path(tmp) / "load-test.jsonl")
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = retry.run_retries(client, tasks, journal, workers=args.workers, rate=args.retry_rate)
+        elapsed = time.perf_counter() - started
+        journal.close()
+
+    stats = client.connection_stats()
+    client.close()
+    first_error = results["failed"][0]["error"] if results["failed"] else None
+    # run_retries does not expose per-call timings: count each task as one op over the whole run
+    return {"ops_count": len(tasks), "elapsed": elapsed, "errors": len(results["failed"]),
+            "first_error": first_error, "connections": stats}
+
+
+RUNNERS = {
+    "client": scenario_client,
+    "master": scenario_master,
+    "fetch-all": scenario_fetch_all,
+    "retry": scenario_retry,
+}
+
+
+def run_scenario(name: str, api, args) -> dict:
+    api.reset_stats()
+    recorder = LatencyRecorder()
+    started = time.perf_counter()
+    outcome = RUNNERS[name](api, args, recorder)
+    elapsed = outcome.pop("elapsed", time.perf_counter() - started)
+    if "skipped" in outcome:
+        return {"scenario": name, **outcome}
+
+    ops = outcome.pop("ops", None)
+    ops_count = outcome.pop("ops_count", len(ops or []))
+    server = api.stats()["requests"]
+    result = {
+        "scenario": name,
+        "seconds": round(elapsed, 3),
+        "ops": ops_count,
+        "ops_per_sec": round(ops_count / elapsed, 1) if elapsed else 0.0,
+        "requests": len(recorder.latencies),
+        "requests_per_sec": round(len(recorder.latencies) / elapsed, 1) if elapsed else 0.0,
+        "request_latency": summarize_ms(recorder.latencies),
+        "status_codes": {str(code): count for code, count in sorted(recorder.statuses.items())},
+        "server_injected": {key: server[key] for key in ("429", "500", "502", "503") if key in server},
+        "server_max_inflight": api.max_inflight,
+        **outcome,
+    }
+    if ops:
+        result["op_latency"] = summarize_ms(ops)
+    return result
+
+
+def print_report(results: list, args):
+    print(f"Mock: {args.tasks} tasks / {args.agents} agents, latency {args.latency_ms:g}ms "
+          f"+-{args.jitter_ms:g}, errors {args.error_rate:.0%}, 429s {args.rate_limit_rate:.0%}"
+          f"{f', throttle {args.throttle_rps:g} rps' if args.throttle_rps else ''}, workers {args.workers}")
+    print("=" * 100)
+    print(f"{'Scenario':<10} {'Ops':>6} {'Ops/s':>8} {'Reqs':>6} {'Req/s':>8} "
+          f"{'p50':>8} {'p90':>8} {'p99':>8} {'Op p99':>9} {'Errors':>6}  Reuse")
+    print("-" * 100)
+    for r in results:
+        if "skipped" in r:
+            print(f"{r['scenario']:<10} skipped: {r['skipped']}")
+            continue
+        latency = r["request_latency"]
+        op_p99 = f"{r['op_latency']['p99_ms']:.1f}ms" if "op_latency" in r else "-"
+        conn = r.get("connections", {})
+        reuse = f"{conn.get('connections_reused', 0)}/{conn.get('requests', 0)}"
+        print(f"{r['scenario']:<10} {r['ops']:>6} {r['ops_per_sec']:>8.1f} {r['requests']:>6} "
+              f"{r['requests_per_sec']:>8.1f} {latency['p50_ms']:>6.1f}ms {latency['p90_ms']:>6.1f}ms "
+              f"{latency['p99_ms']:>6.1f}ms {op_p99:>9} {r['errors']:>6}  {reuse}")
+    print("-" * 100)
+    for r in results:
+        if "skipped" in r:
+            continue
+        extras = [f"status {r['status_codes']}"]
+        if r["server_injected"]:
+            extras.append(f"injected {r['server_injected']}")
+        if "client_retries" in r:
+            extras.append(f"client retries {r['client_retries']}")
+        if "tasks_per_fetch" in r:
+            extras.append(f"{r['tasks_per_fetch']} tasks/fetch")
+        extras.append(f"server max inflight {r['server_max_inflight']}")
+        print(f"{r['scenario']:<10} " + ", ".join(extras))
+        if r.get("first_error"):
+            print(f"{'':<10} first error: {r['first_error']}")
+    print("\nLatency columns are per HTTP request; 'Op p99' includes client-side retries.")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load-test the Beam clients against a local mock Beam API",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python load_test.py --latency-ms 10
+    python load_test.py --scenario master --rate-limit-rate 0.05 --retry-after 0.1
+    python load_test.py --scenario fetch-all --tasks 20000 --agents 1 --json
+"""
+    )
+    parser.add_argument("--scenario", nargs="+", choices=SCENARIOS, default=SCENARIOS,
+                        help="Scenarios to run (default: all)")
+    parser.add_argument("--requests", type=int, default=500,
+                        help="Requests for client/master, max tasks for retry (default: 500)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent workers (default: 8)")
+    parser.add_argument("--repeat", type=int, default=5, help="fetch_all_tasks runs (default: 5)")
+    parser.add_argument("--page-size", type=int, default=100, help="fetch-all page size (default: 100)")
+    parser.add_argument("--max-pages", type=int, default=50, help="fetch-all max pages (default: 50)")
+    parser.add_argument("--agent-id", help="fetch-all agent (default: first mock agent)")
+    parser.add_argument("--retry-rate", type=float, default=50.0,
+                        help="retry_tasks rate limit, requests/second (default: 50)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    api = api_from_args(args)
+    server = start_server(api)
+    url = f"http://127.0.0.1:{server.server_port}"
+    os.environ["BEAM_API_BASE_URL"] = url
+    os.environ.setdefault("BEAM_API_KEY", "mock-api-key")
+    os.environ.setdefault("BEAM_WORKSPACE_ID", "mock-workspace")
+    print(f"[INFO] Mock Beam API on {url}", file=sys.stderr)
+
+    results = []
+    try:
+        for name in args.scenario:
+            print(f"[INFO] Running {name}...", file=sys.stderr)
+            results.append(run_scenario(name, api, args))
+    finally:
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,622 @@
+#!/usr/bin/env python3
+"""
+Mock Beam API Server
+
+Local stand-in for the subset of api.beamstudio.ai the Beam scripts use, with
+configurable latency, error rate, 429s and dataset size. Stdlib only.
+
+Endpoints:
+    POST /auth/access-token            {"apiKey"} -> 201 {idToken, refreshToken}
+    POST /auth/refresh-token           {"refreshToken"} -> 201 (401 if unknown)
+    GET  /agent-tasks                  page/limit (or pageNum/pageSize), agentId,
+                                       status(es), startDate, endDate
+    GET  /agent-tasks/iterate          cursor pagination (nextCursor)
+    GET  /agent-tasks/analytics        agentId, startDate, endDate
+    GET  /agent-tasks/{id}             task details
+    GET  /agent-tasks/{id}/updates     SSE stream (honours Last-Event-ID)
+    POST /agent-tasks/retry            {"taskId"} -> 201 (empty body)
+    GET  /agent/{id}                   agent name
+    GET  /_mock/stats                  request counters (not fault-injected)
+
+Faults (latency, 5xx, 429) are injected on /agent-tasks* and /agent/* only, so
+authentication always succeeds. Any non-empty Bearer token is accepted (the
+03-skills client sends the API key directly).
+
+Usage:
+    # Serve on port 8765 with 2000 tasks across 3 agents
+    python mock_beam_server.py --port 8765 --tasks 2000 --agents 3
+
+    # 40ms +-20ms latency, 2% 5xx, 5% random 429s, 1% slow (1s) responses
+    python mock_beam_server.py --latency-ms 40 --jitter-ms 20 --error-rate 0.02 \\
+        --rate-limit-rate 0.05 --slow-rate 0.01 --slow-ms 1000
+
+    # Point the scripts at it
+    BEAM_API_BASE_URL=http://127.0.0.1:8765 BEAM_TOKEN_CACHE=0 \\
+        python 03-skills/beam-get-task-details/scripts/get_task_details.py <task_id>
+
+In-process (see load_test.py):
+    api = MockBeamAPI(tasks=500, latency_ms=10)
+    server = start_server(api)          # port 0 = any free port
+    url = f"http://127.0.0.1:{server.server_port}"
+    ...
+    server.shutdown()
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Add parent directories to path for shared module import
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from _shared.beam_status import TERMINAL_STATUSES  # noqa: E402
+
+
+# Generated task status mix (weights)
+STATUS_WEIGHTS = {
+    "COMPLETED": 70,
+    "FAILED": 8,
+    "ERROR": 3,
+    "STOPPED": 4,
+    "TIMEOUT": 2,
+    "IN_PROGRESS": 5,
+    "QUEUED": 3,
+    "USER_INPUT_REQUIRED": 5,
+}
+NODE_NAMES = ["ParameterExtraction", "DataLookup", "ProcessData", "GenerateOutput", "SendNotification"]
+
+
+def format_timestamp(dt: datetime) -> str:
+    """UTC ISO string with milliseconds, as returned by the API."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def parse_timestamp(value: str):
+    """Parse an ISO 8601 timestamp or date; None if invalid."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+class MockBeamAPI:
+    """
+    In-memory dataset, fault injection and request counters.
+
+    The dataset is generated once from ``seed``; tasks are spread over the
+    last ``days`` days, newest first. Retrying a task moves it to QUEUED.
+    """
+
+    def __init__(
+        self,
+        tasks: int = 2000,
+        agents: int = 3,
+        days: int = 30,
+        seed: int = 42,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_ms: float = 1000.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        throttle_rps: float = 0.0,
+        retry_after: float = 1.0,
+        sse_events: int = 5,
+        sse_interval_ms: float = 200.0,
+        sse_drop_rate: float = 0.0
+    ):
+        """
+        Args:
+            tasks: Number of generated tasks
+            agents: Number of agents the tasks are spread over
+            days: Tasks are created over the last N days
+            seed: Dataset seed (same seed = same task IDs)
+            latency_ms: Base response latency
+            jitter_ms: Uniform +- jitter on the latency
+            slow_rate: Fraction of responses delayed by slow_ms (tail latency)
+            slow_ms: Latency of slow responses
+            error_rate: Fraction of requests answered with a random 500/502/503
+            rate_limit_rate: Fraction of requests answered with 429
+            throttle_rps: Server-side token bucket; over-limit requests get 429 (0 = off)
+            retry_after: Retry-After seconds sent with 429s
+            sse_events: Progress events per task update stream (before the final one)
+            sse_interval_ms: Delay between SSE events
+            sse_drop_rate: Chance an SSE connection drops after each event
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.throttle_rps = throttle_rps
+        self.retry_after = retry_after
+        self.sse_events = sse_events
+        self.sse_interval_ms = sse_interval_ms
+        self.sse_drop_rate = sse_drop_rate
+
+        self._lock = threading.Lock()
+        self._fault_rng = random.Random(seed + 1)
+        self._tokens = throttle_rps
+        self._last_refill = time.monotonic()
+        self.refresh_tokens = set()
+        self.counts = Counter()
+        self.inflight = 0
+        self.max_inflight = 0
+
+        self._generate(tasks, agents, days, seed)
+
+    # -- dataset -------------------------------------------------------------
+
+    def _generate(self, count: int, agent_count: int, days: int, seed: int):
+        rng = random.Random(seed)
+        self.agents = {}
+        for i in range(max(1, agent_count)):
+            agent_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+            self.agents[agent_id] = {"id": agent_id, "name": f"Mock Agent {i + 1}"}
+        agent_ids = list(self.agents)
+
+        statuses = list(STATUS_WEIGHTS)
+        weights = list(STATUS_WEIGHTS.values())
+        now = datetime.now(timezone.utc)
+        span = days * 86400
+        self.tasks = []
+        for i in range(count):
+            created = now - timedelta(seconds=span * (i + rng.random()) / max(1, count))
+            runtime = round(rng.uniform(5, 180), 1)
+            status = rng.choices(statuses, weights)[0]
+            self.tasks.append({
+                "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                "customId": f"MOCK-{i + 1:06d}",
+                "agentId": agent_ids[i % len(agent_ids)],
+                "status": status,
+                "createdAt": format_timestamp(created),
+                "updatedAt": format_timestamp(created + timedelta(seconds=runtime)),
+                "completedAt": format_timestamp(created + timedelta(seconds=runtime))
+                if status in TERMINAL_STATUSES else None,
+                "runtimeSeconds": runtime,
+                "evaluationScore": rng.randint(40, 100) if status == "COMPLETED" else None,
+                "userFeedback": rng.choice([None, None, None, "POSITIVE", "NEGATIVE"]),
+                "originalTaskQuery": {"query": f"Mock request #{i + 1}"},
+                "agentTaskNodes": [
+                    {"id": f"node-{n}", "name": name, "status": "completed"}
+                    for n, name in enumerate(NODE_NAMES[:rng.randint(1, len(NODE_NAMES))])
+                ],
+            })
+        self.by_id = {task["id"]: task for task in self.tasks}
+
+    def filter_tasks(self, params: dict) -> list:
+        """Tasks matching agentId / status(es) / startDate / endDate, newest first."""
+        agent_id = params.get("agentId")
+        statuses = params.get("statuses") or params.get("status")
+        statuses = {s.strip().upper() for s in statuses.split(",")} if statuses else None
+        start = parse_timestamp(params.get("startDate"))
+        end = parse_timestamp(params.get("endDate"))
+        start_s = format_timestamp(start) if start else None
+        end_s = format_timestamp(end) if end else None
+
+        return [
+            task for task in self.tasks
+            if (not agent_id or task["agentId"] == agent_id)
+            and (not statuses or task["status"] in statuses)
+            and (not start_s or task["createdAt"] >= start_s)
+            and (not end_s or task["createdAt"] <= end_s)
+        ]
+
+    def analytics(self, params: dict) -> dict:
+        """Aggregates shaped like /agent-tasks/analytics for the requested window."""
+        start = parse_timestamp(params.get("startDate"))
+        end = parse_timestamp(params.get("endDate"))
+        current = self.filter_tasks(params)
+        previous = []
+        if start and end:
+            length = end - start
+            previous = self.filter_tasks({**params, "startDate": format_timestamp(start - length),
+                                          "endDate": format_timestamp(start)})
+
+        def period(tasks):
+            completed = [t for t in tasks if t["status"] == "COMPLETED"]
+            scores = [t["evaluationScore"] for t in completed if t["evaluationScore"] is not None]
+            runtime = sum(t["runtimeSeconds"] for t in tasks)
+            return {
+                "totalTasks": len(tasks),
+                "completedTasks": len(completed),
+                "failedTasks": sum(1 for t in tasks if t["status"] in ("FAILED", "ERROR")),
+                "averageEvaluationScore": round(sum(scores) / len(scores), 1) if scores else None,
+                "averageRuntimeSeconds": round(runtime / len(tasks), 1) if tasks else 0,
+                "totalRuntimeSeconds": round(runtime, 1),
+                "positiveFeedbackCount": sum(1 for t in tasks if t["userFeedback"] == "POSITIVE"),
+                "negativeFeedbackCount": sum(1 for t in tasks if t["userFeedback"] == "NEGATIVE"),
+                "consentRequiredCount": sum(1 for t in tasks if t["status"] == "USER_INPUT_REQUIRED"),
+            }
+
+        chart = {}
+        for task in current:
+            day = chart.setdefault(task["createdAt"][:10], {"date": task["createdAt"][:10],
+                                                            "completedCount": 0, "failedCount": 0})
+            if task["status"] == "COMPLETED":
+                day["completedCount"] += 1
+            elif task["status"] in ("FAILED", "ERROR"):
+                day["failedCount"] += 1
+
+        current_period, previous_period = period(current), period(previous)
+        delta = {key: round(value - (previous_period.get(key) or 0), 1)
+                 for key, value in current_period.items() if isinstance(value, (int, float))}
+        return {
+            "currentPeriod": current_period,
+            "previousPeriod": previous_period,
+            "metricsDelta": delta,
+            "taskAndEvaluationChart": sorted(chart.values(), key=lambda d: d["date"]),
+        }
+
+    def retry(self, task_id: str) -> bool:
+        task = self.by_id.get(task_id)
+        if task is None:
+            return False
+        with self._lock:
+            task["status"] = "QUEUED"
+            task["completedAt"] = None
+            task["updatedAt"] = format_timestamp(datetime.now(timezone.utc))
+            task["retryCount"] = task.get("retryCount", 0) + 1
+        return True
+
+    def issue_tokens(self) -> dict:
+        refresh_token = uuid.uuid4().hex
+        with self._lock:
+            self.refresh_tokens.add(refresh_token)
+        return {"idToken": f"mock-{uuid.uuid4().hex}", "refreshToken": refresh_token, "expiresIn": 3600}
+
+    # -- faults --------------------------------------------------------------
+
+    def _throttled(self) -> bool:
+        """Server-side token bucket (throttle_rps per second, burst = 1 second)."""
+        now = time.monotonic()
+        self._tokens = min(self.throttle_rps, self._tokens + (now - self._last_refill) * self.throttle_rps)
+        self._last_refill = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return False
+        return True
+
+    def fault(self):
+        """
+        Sleep for the configured latency and pick an injected failure.
+
+        Returns:
+            None, or an HTTP status code (429/500/502/503) to answer with
+        """
+        with self._lock:
+            rng = self._fault_rng
+            delay = max(0.0, self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms))
+            if self.slow_rate and rng.random() < self.slow_rate:
+                delay = self.slow_ms
+            throttled = bool(self.throttle_rps) and self._throttled()
+            roll = rng.random()
+            status = rng.choice((500, 502, 503))
+        if delay:
+            time.sleep(delay / 1000)
+        if throttled or roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return status
+        return None
+
+    # -- counters ------------------------------------------------------------
+
+    def count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.counts[key] += amount
+
+    def enter(self):
+        with self._lock:
+            self.inflight += 1
+            self.max_inflight = max(self.max_inflight, self.inflight)
+
+    def leave(self):
+        with self._lock:
+            self.inflight -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": dict(sorted(self.counts.items())),
+                "max_inflight": self.max_inflight,
+                "tasks": len(self.tasks),
+                "agents": [dict(agent, tasks=sum(1 for t in self.tasks if t["agentId"] == agent["id"]))
+                           for agent in self.agents.values()],
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.counts.clear()
+            self.max_inflight = self.inflight
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Routes requests to the server's MockBeamAPI (``self.server.api``)."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "MockBeamAPI/1.0"
+    disable_nagle_algorithm = True  # Headers and body are separate writes; avoid delayed-ACK stalls
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    @property
+    def api(self) -> MockBeamAPI:
+        return self.server.api
+
+    def _send(self, code: int, body=None, headers: dict = None):
+        payload = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _authorized(self) -> bool:
+        auth = self.headers.get("Authorization", "")
+        return auth.startswith("Bearer ") and len(auth) > 7 and bool(self.headers.get("current-workspace-id"))
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+        body = self._read_json() if method == "POST" else {}
+
+        if parts[:1] == ["_mock"]:
+            return self._send(200, self.api.stats())
+
+        if parts[:1] == ["auth"]:
+            self.api.count(f"{method} /{url.path.strip('/')}")
+            return self._auth(parts, body)
+
+        route = self._route(method, parts)
+        self.api.count(route)
+        if route.endswith(" unknown"):
+            return self._send(404, {"message": f"Cannot {method} {url.path}"})
+        if not self._authorized():
+            self.api.count("401")
+            return self._send(401, {"message": "Unauthorized"})
+
+        self.api.enter()
+        try:
+            status = self.api.fault()
+            if status == 429:
+                self.api.count("429")
+                return self._send(429, {"message": "Too Many Requests"},
+                                  {"Retry-After": f"{self.api.retry_after:g}"})
+            if status:
+                self.api.count(str(status))
+                return self._send(status, {"message": "Injected failure"})
+            return self._handle(route, parts, params, body)
+        finally:
+            self.api.leave()
+
+    @staticmethod
+    def _route(method: str, parts: list) -> str:
+        """Route label, e.g. 'GET /agent-tasks/{id}' (ends in ' unknown' if unsupported)."""
+        if parts[:1] == ["agent"] and len(parts) == 2 and method == "GET":
+            return "GET /agent/{id}"
+        if parts[:1] != ["agent-tasks"]:
+            return f"{method} unknown"
+        if len(parts) == 1 and method == "GET":
+            return "GET /agent-tasks"
+        if len(parts) == 2 and parts[1] in ("iterate", "analytics") and method == "GET":
+            return f"GET /agent-tasks/{parts[1]}"
+        if len(parts) == 2 and parts[1] == "retry" and method == "POST":
+            return "POST /agent-tasks/retry"
+        if len(parts) == 2 and method == "GET":
+            return "GET /agent-tasks/{id}"
+        if len(parts) == 3 and parts[2] == "updates" and method == "GET":
+            return "GET /agent-tasks/{id}/updates"
+        return f"{method} unknown"
+
+    def _auth(self, parts: list, body: dict):
+        if parts == ["auth", "access-token"]:
+            if not body.get("apiKey"):
+                return self._send(401, {"message": "Invalid API key"})
+            return self._send(201, self.api.issue_tokens())
+        if parts == ["auth", "refresh-token"]:
+            if body.get("refreshToken") not in self.api.refresh_tokens:
+                return self._send(401, {"message": "Invalid refresh token"})
+            return self._send(201, self.api.issue_tokens())
+        return self._send(404, {"message": "Not found"})
+
+    def _handle(self, route: str, parts: list, params: dict, body: dict):
+        api = self.api
+        if route == "GET /agent-tasks":
+            tasks = api.filter_tasks(params)
+            page = max(1, int(params.get("page") or params.get("pageNum") or 1))
+            size = max(1, int(params.get("limit") or params.get("pageSize") or 20))
+            chunk = tasks[(page - 1) * size:page * size]
+            return self._send(200, {"data": [{"tasks": chunk}], "totalCount": len(tasks)})
+
+        if route == "GET /agent-tasks/iterate":
+            tasks = api.filter_tasks(params)
+            cursor = params.get("cursor") or ""
+            offset = int(cursor[1:]) if cursor[:1] == "c" and cursor[1:].isdigit() else 0
+            size = max(1, int(params.get("limit") or 50))
+            chunk = tasks[offset:offset + size]
+            next_offset = offset + len(chunk)
+            return self._send(200, {"tasks": chunk,
+                                    "nextCursor": f"c{next_offset}" if next_offset < len(tasks) else None})
+
+        if route == "GET /agent-tasks/analytics":
+            return self._send(200, api.analytics(params))
+
+        if route == "GET /agent/{id}":
+            agent = api.agents.get(parts[1])
+            return self._send(200, agent) if agent else self._send(404, {"message": "Agent not found"})
+
+        if route == "POST /agent-tasks/retry":
+            if api.retry(body.get("taskId")):
+                return self._send(201)
+            return self._send(404, {"message": "Task not found"})
+
+        task = api.by_id.get(parts[1])
+        if task is None:
+            return self._send(404, {"message": "Task not found"})
+        if route == "GET /agent-tasks/{id}":
+            return self._send(200, task)
+        return self._stream_updates(task)
+
+    def _stream_updates(self, task: dict):
+        """
+        SSE progress events then a final status event.
+
+        Event IDs are '<n>'; a Last-Event-ID header resumes after event n.
+        Non-terminal tasks finish as COMPLETED at the end of the stream.
+        """
+        api = self.api
+        final_status = task["status"] if task["status"] in TERMINAL_STATUSES else "COMPLETED"
+        try:
+            start = int(self.headers.get("Last-Event-ID") or 0) + 1
+        except ValueError:
+            start = 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        retry = "retry: 1000\n"
+        for n in range(start, api.sse_events + 2):
+            if n <= api.sse_events:
+                data = {"taskId": task["id"], "status": "IN_PROGRESS",
+                        "node": NODE_NAMES[(n - 1) % len(NODE_NAMES)], "progress": n / (api.sse_events + 1)}
+                event = "update"
+            else:
+                data = {"taskId": task["id"], "status": final_status}
+                event = "status"
+            self.wfile.write(f"{retry}id: {n}\nevent: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+            retry = ""
+            self.wfile.flush()
+            api.count("sse events")
+            if n <= api.sse_events:
+                with api._lock:
+                    drop = api.sse_drop_rate and api._fault_rng.random() < api.sse_drop_rate
+                if drop:
+                    api.count("sse drops")
+                    return
+                time.sleep(api.sse_interval_ms / 1000)
+
+
+def start_server(api: MockBeamAPI, host: str = "127.0.0.1", port: int = 0, verbose: bool = False):
+    """
+    Serve ``api`` on a background daemon thread.
+
+    Returns:
+        The ThreadingHTTPServer (``server_port`` holds the bound port; call
+        ``shutdown()`` to stop)
+    """
+    server = ThreadingHTTPServer((host, port), MockHandler)
+    server.daemon_threads = True
+    server.api = api
+    server.verbose = verbose
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser):
+    """Dataset and fault-injection flags shared with load_test.py."""
+    group = parser.add_argument_group("mock dataset and faults")
+    group.add_argument("--tasks", type=int, default=2000, help="Generated tasks (default: 2000)")
+    group.add_argument("--agents", type=int, default=3, help="Agents the tasks are spread over (default: 3)")
+    group.add_argument("--days", type=int, default=30, help="Tasks span the last N days (default: 30)")
+    group.add_argument("--seed", type=int, default=42, help="Dataset seed (default: 42)")
+    group.add_argument("--latency-ms", type=float, default=0.0, help="Base latency per request")
+    group.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +- jitter on the latency")
+    group.add_argument("--slow-rate", type=float, default=0.0, help="Fraction of slow responses")
+    group.add_argument("--slow-ms", type=float, default=1000.0, help="Latency of slow responses (default: 1000)")
+    group.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 500/502/503 responses")
+    group.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of random 429 responses")
+    group.add_argument("--throttle-rps", type=float, default=0.0,
+                       help="Answer 429 above this many requests/second (0 = off)")
+    group.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds on 429 (default: 1)")
+    group.add_argument("--sse-events", type=int, default=5, help="Progress events per update stream (default: 5)")
+    group.add_argument("--sse-interval-ms", type=float, default=200.0, help="Delay between SSE events")
+    group.add_argument("--sse-drop-rate", type=float, default=0.0, help="Chance an SSE stream drops per event")
+
+
+def api_from_args(args) -> MockBeamAPI:
+    return MockBeamAPI(
+        tasks=args.tasks, agents=args.agents, days=args.days, seed=args.seed,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        slow_rate=args.slow_rate, slow_ms=args.slow_ms,
+        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+        throttle_rps=args.throttle_rps, retry_after=args.retry_after,
+        sse_events=args.sse_events, sse_interval_ms=args.sse_interval_ms, sse_drop_rate=args.sse_drop_rate
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local mock of the Beam.ai API for testing and load tests",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python mock_beam_server.py --port 8765
+    python mock_beam_server.py --port 8765 --latency-ms 50 --error-rate 0.02 --throttle-rps 20
+
+Then run any Beam script with:
+    BEAM_API_BASE_URL=http://127.0.0.1:8765 BEAM_TOKEN_CACHE=0 BEAM_API_KEY=x BEAM_WORKSPACE_ID=x ...
+"""
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765, 0 = any free port)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    api = api_from_args(args)
+    server = start_server(api, args.host, args.port, verbose=args.verbose)
+    print(f"[OK] Mock Beam API on http://{args.host}:{server.server_port} "
+          f"({len(api.tasks)} tasks, {len(api.agents)} agents)")
+    for agent in api.stats()["agents"]:
+        print(f"     agent {agent['id']}  {agent['tasks']:>5} tasks  {agent['name']}")
+    print(f"     sample task {api.tasks[0]['id']}")
+    print("[INFO] Ctrl+C to stop; counters at /_mock/stats")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(f"\n[INFO] Requests: {json.dumps(api.stats()['requests'])}", file=sys.stderr)
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -19,20 +19,29 @@ Usage:
 
     # Dry run (show what would be retried)
     python retry_tasks.py --agent <agent_id> --dry-run
+
+    # Resume an interrupted run (skips tasks already retried successfully)
+    python retry_tasks.py --resume 04-workspace/.retry-journals/retry-20250101-120000.jsonl
 """
 
 import argparse
 import json
+import os
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
 
 # Add parent directories to path for shared module import
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 try:
-    from _shared.beam_api import BeamClient
+    from _shared.beam_api import (
+        BeamClient, PAGE_WORKERS, PaginationError, RateLimiter, find_project_root, paginate
+    )
 except ImportError as e:
     print(f"Error: Could not import shared modules: {e}")
     print("Ensure 03-skills/_shared/beam_api.py exists")
@@ -42,6 +51,11 @@ except ImportError as e:
 # Default statuses to retry
 DEFAULT_RETRY_STATUSES = ["FAILED", "ERROR", "STOPPED", "TIMEOUT"]
 
+RETRY_WORKERS = 4  # Concurrent retry requests
+ISSUE_PAGE_SIZE = 50   # Tasks per page when scanning an agent
+ISSUE_MAX_PAGES = 50   # Page cap when scanning an agent
+JOURNAL_DIR = find_project_root() / "04-workspace" / ".retry-journals"
+
 
 def retry_task(client: BeamClient, task_id: str, max_retries: int = 3) -> dict:
     """
@@ -58,13 +72,9 @@ def retry_task(client: BeamClient, task_id: str, max_retries: int = 3) -> dict:
     for attempt in range(max_retries):
         try:
             # POST /agent-tasks/retry with taskId in body
-            # Note: BeamClient.request() calls response.json() which fails on empty body
-            # So we need to handle the 201 response with empty body specially
-            import requests
-
-            url = f"{client.base_url}/agent-tasks/retry"
-            headers = client._get_headers()
-            response = requests.post(url, json={"taskId": task_id}, headers=headers)
+            # Note: BeamClient.post() calls response.json() which fails on empty body
+            # So we use the raw request() (pooled session) and check the status ourselves
+            response = client.request("POST", "/agent-tasks/retry", json={"taskId": task_id})
 
             if response.status_code in [200, 201]:
                 return {"success": True, "status_code": response.status_code}
@@ -88,22 +98,203 @@ def retry_task(client: BeamClient, task_id: str, max_retries: int = 3) -> dict:
     return {"success": False, "error": "Max retries exceeded"}
 
 
+class RetryJournal:
+    """
+    Append-only JSONL journal of retry attempts.
+
+    The first line of a new journal records the workspace and the full
+    task list, so ``--resume`` can rebuild the run without the original
+    source. Every retry request that was sent appends one line (task_id,
+    status, attempt, timestamp) from the worker that sent it, flushed and
+    fsynced before the result is reported.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, record: dict):
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+    @staticmethod
+    def load(path: Path) -> tuple:
+        """
+        Read a journal.
+
+        Returns:
+            (tasks, attempts, succeeded, workspace): task list from the
+            header (or from the entries if no header), attempts per task_id,
+            the set of task_ids already retried successfully, and the
+            header's workspace (None if no header)
+        """
+        tasks, attempts, succeeded, workspace = [], {}, set(), None
+        seen = set()
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line from a crash
+                if record.get("event") == "start":
+                    workspace = workspace or record.get("workspace")
+                    for task in record.get("tasks", []):
+                        if task["task_id"] not in seen:
+                            seen.add(task["task_id"])
+                            tasks.append(task)
+                    continue
+                task_id = record.get("task_id")
+                if not task_id:
+                    continue
+                attempts[task_id] = max(attempts.get(task_id, 0), record.get("attempt", 1))
+                if record.get("status") == "success":
+                    succeeded.add(task_id)
+                if task_id not in seen:
+                    seen.add(task_id)
+                    tasks.append({"task_id": task_id, "custom_id": record.get("custom_id")})
+        return tasks, attempts, succeeded, workspace
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. '45s' or '3m12s'."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{(seconds % 3600) // 60:02d}m"
+
+
+def run_retries(
+    client: BeamClient,
+    tasks: list,
+    journal: RetryJournal,
+    workers: int = RETRY_WORKERS,
+    rate: float = 5.0,
+    attempts: dict = None
+) -> dict:
+    """
+    Retry tasks concurrently under a token-bucket rate limit.
+
+    At most ``2 * workers`` tasks are queued on the pool at a time, and a
+    worker checks the stop flag before sending, so Ctrl+C stops the run
+    after the requests already in flight: those finish and are journaled
+    before KeyboardInterrupt propagates.
+
+    Args:
+        client: BeamClient instance (its session pool is shared by workers)
+        tasks: List of dicts with 'task_id' and optional 'custom_id'
+        journal: RetryJournal receiving one line per retry request sent
+        workers: Concurrent retry requests
+        rate: Max retry requests started per second
+        attempts: Previous attempts per task_id (from a resumed journal)
+
+    Returns:
+        Dict with 'success' and 'failed' lists
+    """
+    attempts = attempts or {}
+    limiter = RateLimiter(rate, burst=max(1, workers))
+    stop = threading.Event()
+    results = {"success": [], "failed": []}
+    total = len(tasks)
+    started = time.perf_counter()
+
+    def retry_one(task: dict) -> tuple:
+        limiter.acquire()
+        if stop.is_set():
+            return task, None
+        result = retry_task(client, task["task_id"])
+        journal.write({
+            "task_id": task["task_id"],
+            "custom_id": task.get("custom_id"),
+            "status": "success" if result["success"] else "failed",
+            "status_code": result.get("status_code"),
+            "attempt": attempts.get(task["task_id"], 0) + 1,
+            "error": result.get("error"),
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        })
+        return task, result
+
+    queue = iter(tasks)
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        pending = {pool.submit(retry_one, task) for task in islice(queue, 2 * max(1, workers))}
+        done = 0
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                task, result = future.result()
+                next_task = next(queue, None)
+                if next_task is not None:
+                    pending.add(pool.submit(retry_one, next_task))
+
+                done += 1
+                task_id = task["task_id"]
+                custom_id = task.get("custom_id") or "-"
+                elapsed = time.perf_counter() - started
+                throughput = done / elapsed if elapsed else 0.0
+                eta = (total - done) / throughput if throughput else 0.0
+                progress = f"{throughput:.1f}/s, ETA {format_duration(eta)}"
+
+                if result["success"]:
+                    results["success"].append({
+                        "task_id": task_id,
+                        "custom_id": custom_id,
+                        "status_code": result.get("status_code")
+                    })
+                    print(f"[{done:3d}/{total}] OK {custom_id} ({task_id[:8]}...)  {progress}")
+                else:
+                    results["failed"].append({
+                        "task_id": task_id,
+                        "custom_id": custom_id,
+                        "error": result.get("error") or f"HTTP {result.get('status_code')}"
+                    })
+                    error_msg = (result.get("error") or "")[:50]
+                    print(f"[{done:3d}/{total}] FAIL {custom_id} ({task_id[:8]}...) - {error_msg}  {progress}")
+    except BaseException:
+        # Ctrl+C: send nothing more; requests in flight finish and journal themselves
+        stop.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    pool.shutdown(wait=True)
+
+    results["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+    return results
+
+
 def get_issue_tasks(
     client: BeamClient,
     agent_id: str,
     statuses: list,
     days: int = 1,
-    limit: int = 100
+    limit: int = 100,
+    max_workers: int = PAGE_WORKERS
 ) -> list:
     """
     Get tasks with specified statuses from an agent.
 
+    Pages in the time range are fetched concurrently (after page 1
+    reports totalCount) until ``limit`` matching tasks are found or the
+    pages run out. A failed page keeps the tasks fetched before it.
+
     Args:
         client: BeamClient instance
         agent_id: Agent ID to query
         statuses: List of statuses to include
         days: Look back period in days
         limit: Max tasks to return
+        max_workers: Concurrent page requests
 
     Returns:
         List of task dicts with id, customId, status, etc.
@@ -116,43 +307,30 @@ def get_issue_tasks(
     from_ts = start_time.strftime("%Y-%m-%dT%H:%M:%S.000Z")
     to_ts = end_time.strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
-    all_tasks = []
-    page = 1
-
-    while len(all_tasks) < limit:
-        params = {
-            "agentId": agent_id,
-            "from": from_ts,
-            "to": to_ts,
-            "page": page,
-            "limit": min(50, limit - len(all_tasks))
-        }
-
-        try:
-            result = client.get("/agent-tasks", params=params)
-            tasks = result.get("data", [])
-
-            if not tasks:
-                break
-
-            # Filter by status
-            for task in tasks:
-                if task.get("status") in statuses:
-                    all_tasks.append(task)
-                    if len(all_tasks) >= limit:
-                        break
-
-            page += 1
+    params = {
+        "agentId": agent_id,
+        "from": from_ts,
+        "to": to_ts
+    }
 
-            # Break if we got fewer than requested (no more pages)
-            if len(tasks) < params["limit"]:
-                break
+    def matching(tasks: list) -> list:
+        return [task for task in tasks if task.get("status") in statuses]
 
-        except Exception as e:
-            print(f"Error fetching tasks: {e}")
-            break
+    try:
+        tasks = paginate(
+            client, "/agent-tasks", params, page_size=ISSUE_PAGE_SIZE, max_pages=ISSUE_MAX_PAGES,
+            max_workers=max_workers, stop=lambda fetched: len(matching(fetched)) >= limit
+        )
+    except PaginationError as e:
+        print(f"Error fetching tasks: {e}")
+        print(f"Continuing with the {len(e.items)} tasks fetched before the error")
+        tasks = e.items
 
-    return all_tasks
+    issue_tasks = matching(tasks)
+    if len(issue_tasks) < limit and len(tasks) >= ISSUE_MAX_PAGES * ISSUE_PAGE_SIZE:
+        print(f"Warning: stopped after {ISSUE_MAX_PAGES} pages ({len(tasks)} tasks); "
+              f"older tasks in the {days}-day window were not checked")
+    return issue_tasks[:limit]
 
 
 def load_tasks_from_file(filepath: str) -> list:
@@ -214,7 +392,7 @@ Environment Variables (in .env at project root):
     )
 
     # Input sources (mutually exclusive)
-    source = parser.add_mutually_exclusive_group(required=True)
+    source = parser.add_mutually_exclusive_group()
     source.add_argument(
         "--task-id", "-t",
         help="Single task ID to retry"
@@ -227,6 +405,11 @@ Environment Variables (in .env at project root):
         "--file", "-f",
         help="JSON file with task IDs to retry"
     )
+    source.add_argument(
+        "--resume",
+        metavar="JOURNAL",
+        help="Resume from a retry journal, skipping tasks already retried successfully"
+    )
 
     # Filters
     parser.add_argument(
@@ -252,9 +435,8 @@ Environment Variables (in .env at project root):
     # Options
     parser.add_argument(
         "--workspace", "-w",
-        default="bid",
         choices=["bid", "prod"],
-        help="Beam workspace (default: bid)"
+        help="Beam workspace (default: bid, or the journal's workspace with --resume)"
     )
     parser.add_argument(
         "--dry-run",
@@ -265,7 +447,22 @@ Environment Variables (in .env at project root):
         "--delay",
         type=float,
         default=0.2,
-        help="Delay between retries in seconds (default: 0.2)"
+        help="Minimum spacing between retry requests in seconds, i.e. rate = 1/delay (default: 0.2)"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="Max retry requests per second (overrides --delay)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=RETRY_WORKERS,
+        help=f"Concurrent retry requests (default: {RETRY_WORKERS})"
+    )
+    parser.add_argument(
+        "--journal",
+        help="Append-only journal file (default: 04-workspace/.retry-journals/retry-<timestamp>.jsonl)"
     )
     parser.add_argument(
         "--output", "-o",
@@ -274,19 +471,41 @@ Environment Variables (in .env at project root):
 
     args = parser.parse_args()
 
+    if not (args.task_id or args.agent or args.file or args.resume):
+        parser.error("one of --task-id, --agent, --file or --resume is required")
+
     # Use default statuses if none specified
     statuses = args.status if args.status else DEFAULT_RETRY_STATUSES
 
+    # Get tasks to retry
+    tasks = []
+    attempts = {}
+
+    if args.resume:
+        if not Path(args.resume).exists():
+            print(f"Journal not found: {args.resume}")
+            sys.exit(1)
+        all_tasks, attempts, succeeded, journal_workspace = RetryJournal.load(args.resume)
+        if args.workspace and journal_workspace and args.workspace != journal_workspace:
+            print(f"Journal {args.resume} was written for workspace '{journal_workspace}', "
+                  f"not '{args.workspace}'")
+            sys.exit(1)
+        args.workspace = args.workspace or journal_workspace
+        tasks = [t for t in all_tasks if t["task_id"] not in succeeded]
+
+    args.workspace = args.workspace or "bid"
+
     # Initialize client
     client = BeamClient(workspace=args.workspace)
     print(f"Workspace: {args.workspace}")
     print(f"API Base: {client.base_url}")
     print()
 
-    # Get tasks to retry
-    tasks = []
+    if args.resume:
+        print(f"Resuming journal: {args.resume}")
+        print(f"Already retried: {len(succeeded)} of {len(all_tasks)} tasks")
 
-    if args.task_id:
+    elif args.task_id:
         tasks = [{"task_id": args.task_id}]
         print(f"Retrying single task: {args.task_id}")
 
@@ -336,42 +555,37 @@ Environment Variables (in .env at project root):
         return
 
     # Execute retries
-    print(f"Retrying {len(tasks)} tasks...")
+    rate = args.rate if args.rate else (1.0 / args.delay if args.delay > 0 else 0)
+    journal_path = Path(args.resume or args.journal or
+                        JOURNAL_DIR / f"retry-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl")
+    journal = RetryJournal(journal_path)
+    if not args.resume:
+        journal.write({
+            "event": "start",
+            "workspace": args.workspace,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "tasks": [{"task_id": t["task_id"], "custom_id": t.get("custom_id")} for t in tasks]
+        })
+
+    print(f"Retrying {len(tasks)} tasks ({args.workers} workers, {rate:g} req/s)...")
+    print(f"Journal: {journal_path}")
     print(f"Started: {datetime.now().isoformat()}")
     print()
 
-    results = {
-        "success": [],
-        "failed": [],
-        "started_at": datetime.now().isoformat(),
-        "workspace": args.workspace
-    }
-
-    for i, task in enumerate(tasks, 1):
-        task_id = task["task_id"]
-        custom_id = task.get("custom_id") or "-"
-
-        result = retry_task(client, task_id)
-
-        if result["success"]:
-            results["success"].append({
-                "task_id": task_id,
-                "custom_id": custom_id,
-                "status_code": result.get("status_code")
-            })
-            print(f"[{i:3d}/{len(tasks)}] OK {custom_id} ({task_id[:8]}...)")
-        else:
-            results["failed"].append({
-                "task_id": task_id,
-                "custom_id": custom_id,
-                "error": result.get("error") or f"HTTP {result.get('status_code')}"
-            })
-            error_msg = result.get("error", "")[:50]
-            print(f"[{i:3d}/{len(tasks)}] FAIL {custom_id} ({task_id[:8]}...) - {error_msg}")
+    started_at = datetime.now().isoformat()
+    try:
+        results = run_retries(client, tasks, journal, workers=args.workers, rate=rate, attempts=attempts)
+    except KeyboardInterrupt:
+        print()
+        print("Interrupted. Every retry sent is recorded in the journal; continue with:")
+        print(f"  python retry_tasks.py --resume {journal_path}")
+        sys.exit(130)
+    finally:
+        journal.close()
 
-        # Delay between requests
-        if i < len(tasks):
-            time.sleep(args.delay)
+    results["started_at"] = started_at
+    results["workspace"] = args.workspace
+    results["journal"] = str(journal_path)
 
     results["completed_at"] = datetime.now().isoformat()
 
@@ -382,6 +596,11 @@ Environment Variables (in .env at project root):
     print(f"Total tasks: {len(tasks)}")
     print(f"Successfully retried: {len(results['success'])}")
     print(f"Failed to retry: {len(results['failed'])}")
+    elapsed = results["elapsed_seconds"]
+    if elapsed:
+        print(f"Elapsed: {format_duration(elapsed)} ({len(tasks) / elapsed:.1f} tasks/s)")
+    if results["failed"]:
+        print(f"Retry failures again with: --resume {journal_path}")
 
     # Save results if requested
     if args.output:
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Beam Task Store
+
+Mirror Beam.ai agent tasks into a local SQLite DB and query them offline.
+
+Usage:
+    # Sync the last 30 days for an agent (later runs only fetch the delta)
+    python task_store.py sync <agent_id> --days 30
+
+    # Issue tasks per day for the last 30 days (local, no API calls)
+    python task_store.py daily <agent_id> --status FAILED --status ERROR --days 30
+
+    # Status breakdown / task list
+    python task_store.py stats <agent_id> --days 7
+    python task_store.py query <agent_id> --status FAILED --days 7 --json
+
+    # Show synced agents
+    python task_store.py agents
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directories to path for shared module import
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+try:
+    from _shared.beam_api import BeamClient, PAGE_WORKERS
+    from _shared.beam_task_store import TaskStore, DEFAULT_DB_PATH
+except ImportError as e:
+    print(f"Error: Could not import shared modules: {e}")
+    print("Ensure 03-skills/_shared/beam_api.py and beam_task_store.py exist")
+    sys.exit(1)
+
+
+# Task statuses that indicate issues (matches beam-debug-issue-tasks)
+ISSUE_STATUSES = ["FAILED", "ERROR", "ISSUE", "CANCELLED", "TIMEOUT", "STOPPED", "USER_INPUT_REQUIRED"]
+
+
+def cmd_sync(store: TaskStore, args) -> dict:
+    client = BeamClient(workspace=args.workspace)
+    result = store.sync(client, args.agent_id, days=args.days, full=args.full, max_workers=args.workers)
+    if not args.json:
+        print(f"[OK] Synced {args.agent_id} ({args.workspace})")
+        print(f"     Window:  {result['start']} -> {result['end']}")
+        if result["backfill"]:
+            print(f"     Backfill: {result['backfill'][0]} -> {result['backfill'][1]}")
+        print(f"     Fetched: {result['fetched']} tasks in {result['seconds']}s")
+        print(f"     Stored:  {result['stored']} tasks")
+    if not result["complete"]:
+        print("[WARN] A window hit the page cap and was not fully fetched; the sync point was not "
+              "advanced past it (rerun, or sync fewer --days at a time)", file=sys.stderr)
+    return result
+
+
+def cmd_query(store: TaskStore, args) -> list:
+    tasks = store.query(args.agent_id, args.status or None, args.days, args.workspace, args.limit)
+    if not args.json:
+        print(f"{len(tasks)} tasks")
+        print("-" * 70)
+        for task in tasks:
+            created = (task.get("createdAt") or "")[:19]
+            custom_id = task.get("customId") or "-"
+            print(f"{created}  {task.get('status', 'N/A'):<20} {task['id'][:8]}  {custom_id}")
+    return tasks
+
+
+def cmd_stats(store: TaskStore, args) -> dict:
+    counts = store.status_counts(args.agent_id, args.days, args.workspace)
+    if not args.json:
+        total = sum(counts.values())
+        print(f"{total} tasks" + (f" (last {args.days} days)" if args.days else ""))
+        print("-" * 40)
+        for status, count in counts.items():
+            pct = count / total * 100 if total else 0
+            print(f"{status:<22} {count:>6}  {pct:5.1f}%")
+    return counts
+
+
+def cmd_daily(store: TaskStore, args) -> list:
+    statuses = args.status or ISSUE_STATUSES
+    rows = store.daily_counts(args.agent_id, statuses, args.days, args.workspace)
+    if not args.json:
+        by_day = {}
+        for row in rows:
+            by_day.setdefault(row["day"], []).append(row)
+        print(f"{', '.join(statuses)} tasks per day (last {args.days} days)")
+        print("-" * 60)
+        for day, day_rows in by_day.items():
+            total = sum(r["count"] for r in day_rows)
+            detail = ", ".join(f"{r['status']}: {r['count']}" for r in day_rows)
+            print(f"{day}  {total:>5}  {detail}")
+        if not rows:
+            print("No matching tasks (run 'sync' first?)")
+    return rows
+
+
+def cmd_agents(store: TaskStore, args) -> list:
+    agents = store.agents()
+    if not args.json:
+        print(f"Store: {store.db_path}")
+        print("-" * 70)
+        for agent in agents:
+            print(f"{agent['workspace']:<5} {agent['agent_id']}  {agent['tasks']:>6} tasks  "
+                  f"synced {agent['synced_from'] or '?'} -> {agent['synced_until']}")
+        if not agents:
+            print("No agents synced yet")
+    return agents
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local SQLite mirror of Beam.ai agent tasks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python task_store.py sync abc123 --days 30 --workspace prod
+    python task_store.py daily abc123 --days 30
+    python task_store.py stats abc123 --days 7
+    python task_store.py query abc123 --status FAILED --json
+
+Environment Variables (in .env at project root):
+    BEAM_API_KEY           Beam.ai API key (BID)
+    BEAM_WORKSPACE_ID      Beam.ai workspace ID (BID)
+    BEAM_API_KEY_PROD      Beam.ai API key (Production)
+    BEAM_WORKSPACE_ID_PROD Beam.ai workspace ID (Production)
+"""
+    )
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH),
+                        help="SQLite file (default: 04-workspace/.beam-task-store.db)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(sub, agent_required=True):
+        if agent_required:
+            sub.add_argument("agent_id", help="Agent ID (UUID)")
+        sub.add_argument("--json", action="store_true", help="Output as JSON")
+
+    sync = subparsers.add_parser("sync", help="Fetch new/changed tasks from the API")
+    add_common(sync)
+    sync.add_argument("--days", "-d", type=int, default=30, help="Mirror tasks created in the last N days (default: 30)")
+    sync.add_argument("--full", action="store_true", help="Ignore sync state and re-fetch the whole window")
+    sync.add_argument("--workspace", "-w", default="bid", choices=["bid", "prod"], help="Beam workspace (default: bid)")
+    sync.add_argument("--workers", type=int, default=PAGE_WORKERS,
+                      help=f"Pages fetched concurrently (default: {PAGE_WORKERS})")
+
+    for name, help_text in [("query", "List stored tasks"),
+                            ("stats", "Status breakdown"),
+                            ("daily", "Tasks per day and status (default: issue statuses)")]:
+        sub = subparsers.add_parser(name, help=help_text)
+        add_common(sub)
+        sub.add_argument("--days", "-d", type=int, default=30 if name == "daily" else None,
+                         help="Only tasks created in the last N days")
+        sub.add_argument("--workspace", "-w", choices=["bid", "prod"], help="Filter by workspace")
+        if name != "stats":
+            sub.add_argument("--status", "-s", action="append", default=[],
+                             help="Status filter (can specify multiple)")
+        if name == "query":
+            sub.add_argument("--limit", "-l", type=int, help="Max tasks to return")
+
+    agents = subparsers.add_parser("agents", help="List synced agents")
+    add_common(agents, agent_required=False)
+
+    args = parser.parse_args()
+    commands = {
+        "sync": cmd_sync,
+        "query": cmd_query,
+        "stats": cmd_stats,
+        "daily": cmd_daily,
+        "agents": cmd_agents,
+    }
+
+    try:
+        with TaskStore(args.db) as store:
+            result = commands[args.command](store, args)
+        if args.json:
+            print(json.dumps(result, indent=2))
+    except ValueError as e:
+        print(f"Configuration error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        if hasattr(e, 'response') and e.response is not None:
+            print(f"API error: {e.response.status_code} - {e.response.text}", file=sys.stderr)
+        else:
+            print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,14 @@ Converts a Beam.ai task into an auto-trigger webhook script for scheduled execut
 
 import argparse
 import base64
+import inspect
 import json
 import os
+import pprint
 import re
 import sys
+import typing
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Add parent directories to path for shared module import
@@ -18,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 try:
     from _shared.beam_api import BeamClient
+    from _shared.beam_http import RateLimiter
 except ImportError as e:
     print(f"Error: Could not import shared modules: {e}")
     print("Ensure 03-skills/_shared/beam_api.py exists")
@@ -77,23 +82,31 @@ def extract_payload(task):
         sys.exit(1)
 
 
-def encode_file_to_base64(file_path):
+# Read size for streaming base64; a multiple of 3 so encoded chunks concatenate without padding
+BASE64_CHUNK = 3 * 256 * 1024
+
+BASE64_PLACEHOLDER = "__BASE64_PLACEHOLDER__"
+
+RUNNER_TEMPLATE = Path(__file__).resolve().parent / "webhook_runner_template.py"
+
+
+def iter_base64(file_path, chunk_size=BASE64_CHUNK):
     """
-    Read a file and encode it to base64.
+    Encode a file to base64 chunk by chunk.
 
     Args:
         file_path: Path to the file to encode
+        chunk_size: Bytes read per chunk (multiple of 3)
 
-    Returns:
-        str: Base64-encoded file content
+    Yields:
+        str: Base64 text; the chunks joined equal the whole file's encoding
     """
-    try:
-        with open(file_path, 'rb') as f:
-            file_content = f.read()
-            return base64.b64encode(file_content).decode('utf-8')
-    except Exception as e:
-        print(f"Error encoding file: {e}")
-        sys.exit(1)
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield base64.b64encode(chunk).decode('ascii')
 
 
 def is_simple_query_payload(payload):
@@ -172,9 +185,6 @@ def create_webhook_script(webhook_url, payload, script_name, output_dir, attachm
         if not attachment_path.exists():
             raise ValueError(f"Attachment file not found: {attachment_file}")
 
-        # Encode file to base64
-        file_content_base64 = encode_file_to_base64(attachment_file)
-
         # Determine mime type and extension
         mime_type = "application/pdf" if attachment_path.suffix.lower() == '.pdf' else "application/octet-stream"
         file_extension = attachment_path.suffix.lstrip('.')
@@ -191,7 +201,7 @@ def create_webhook_script(webhook_url, payload, script_name, output_dir, attachm
             "mimeType": mime_type,
             "fileType": "document",
             "fileExtension": file_extension,
-            "data": file_content_base64,
+            "data": BASE64_PLACEHOLDER,
             "fileName": attachment_path.name,
             "fileSize": file_size
         }
@@ -205,6 +215,7 @@ def create_webhook_script(webhook_url, payload, script_name, output_dir, attachm
         pass
 
     # Generate script based on payload type
+    script_content = None
     if is_simple:
         # Simple query-based agent: Use --data with JSON (cleaner format)
         # Remove timestamp field for now, will be added dynamically
@@ -231,16 +242,18 @@ curl --location '{webhook_url}' \\
         if encoded_context_files:
             # Include encodedContextFiles field only if there are files
             context_json_escaped = json.dumps(encoded_context_files, ensure_ascii=False, separators=(',', ':')).replace('"', '\\"')
+            context_head, context_tail = context_json_escaped.split(BASE64_PLACEHOLDER)
 
-            script_content = f'''#!/bin/bash
+            # Base64 needs no shell or JSON escaping, so it is streamed between the two halves
+            script_parts = [f'''#!/bin/bash
 TIMESTAMP=$(date -u +%Y-%m-%dT%H:%M:%SZ)
 TASK_PAYLOAD='{task_json_escaped}'
 TASK_WITH_TIMESTAMP=$(echo "$TASK_PAYLOAD" | sed "s/__TIMESTAMP_PLACEHOLDER__/$TIMESTAMP/g")
 
 curl --location '{webhook_url}' \\
 --form 'task="'"$TASK_WITH_TIMESTAMP"'"' \\
---form 'encodedContextFiles="{context_json_escaped}"'
-'''
+--form 'encodedContextFiles="{context_head}''', iter_base64(attachment_file), f'''{context_tail}"'
+''']
         else:
             # No attachments - only send task field with --form
             script_content = f'''#!/bin/bash
@@ -253,7 +266,16 @@ curl --location '{webhook_url}' \\
 '''
 
     # Write script file
-    script_path.write_text(script_content)
+    if script_content is not None:
+        script_path.write_text(script_content)
+    else:
+        with open(script_path, 'w', encoding='utf-8') as f:
+            for part in script_parts:
+                if isinstance(part, str):
+                    f.write(part)
+                else:
+                    for chunk in part:
+                        f.write(chunk)
 
     # Make script executable
     os.chmod(script_path, 0o755)
@@ -261,6 +283,62 @@ curl --location '{webhook_url}' \\
     return script_path
 
 
+def create_runner_script(webhook_url, payload, script_path, attachment_file=None, task_id=None):
+    """
+    Create the Python high-volume runner next to a webhook script.
+
+    The runner is webhook_runner_template.py with the webhook URL, request
+    mode and captured payload filled into its CONFIG block, and the shared
+    token bucket (_shared/beam_http.RateLimiter) copied in so the runner
+    stays a standalone script.
+
+    Args:
+        webhook_url: Agent webhook URL
+        payload: Task payload (dict)
+        script_path: Path of the generated .sh script (the runner gets the same stem)
+        attachment_file: Optional default attachment (stored as an absolute path)
+        task_id: Source task ID, recorded in CONFIG for reference
+
+    Returns:
+        Path: Path to the runner script
+    """
+    script_path = Path(script_path)
+    runner_path = script_path.with_suffix('.py')
+
+    config = {
+        "webhook_url": webhook_url,
+        "mode": "json" if is_simple_query_payload(payload) and not attachment_file else "form",
+        "payload": {k: v for k, v in payload.items() if k != "timestamp"},
+        "attachment": str(Path(attachment_file).resolve()) if attachment_file else None,
+        "source_task_id": task_id,
+        "generated_at": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    }
+
+    limiter_source = inspect.getsource(RateLimiter).rstrip()
+    # The copied class keeps its annotations, so the runner needs the typing names they use
+    typing_names = sorted(set(re.findall(r"\b(\w+)\[", limiter_source)) & set(typing.__all__))
+    typing_import = f"from typing import {', '.join(typing_names)}" if typing_names else ""
+
+    runner = RUNNER_TEMPLATE.read_text(encoding='utf-8')
+    fills = {
+        "CONFIG = {}  # Filled in by create_auto_trigger.py":
+            "CONFIG = " + pprint.pformat(config, width=100, sort_dicts=False),
+        "# typing imports of RateLimiter: filled in by create_auto_trigger.py\n":
+            typing_import + "\n" if typing_import else "",
+        "class RateLimiter: ...  # Filled in by create_auto_trigger.py (_shared/beam_http.RateLimiter)":
+            limiter_source
+    }
+    for marker, source in fills.items():
+        if marker not in runner:
+            raise ValueError(f"Placeholder not found in {RUNNER_TEMPLATE.name}: {marker.split('  #')[0]}")
+        runner = runner.replace(marker, source, 1)
+
+    runner_path.write_text(runner, encoding='utf-8')
+    os.chmod(runner_path, 0o755)
+
+    return runner_path
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Create auto-trigger webhook script from a Beam.ai task",
@@ -283,6 +361,10 @@ Examples:
     python create_auto_trigger.py \\
         --task-url "..." \\
         --output-dir "/custom/path"
+
+    # Also generate a Python runner for bulk / load sends
+    python create_auto_trigger.py --task-url "..." --webhook-url "..." \\
+        --script-name "my-task.sh" --runner
 """
     )
 
@@ -313,6 +395,11 @@ Examples:
         '--attachment-file',
         help='Path to file to attach (e.g., resume.pdf). Will be base64 encoded and included in payload.'
     )
+    parser.add_argument(
+        '--runner',
+        action='store_true',
+        help='Also create a Python runner (<script-name>.py) for sending many payloads concurrently'
+    )
 
     args = parser.parse_args()
 
@@ -361,12 +448,28 @@ Examples:
             attachment_file=args.attachment_file
         )
 
+        runner_path = None
+        if args.runner:
+            runner_path = create_runner_script(
+                webhook_url=webhook_url,
+                payload=payload,
+                script_path=script_path,
+                attachment_file=args.attachment_file,
+                task_id=task_id
+            )
+
         print(f"\n✅ SUCCESS! Webhook script created:")
         print(f"   📄 {script_path}")
+        if runner_path:
+            print(f"   🐍 {runner_path}")
         if args.attachment_file:
             print(f"   📎 Attachment: {Path(args.attachment_file).name} (base64 encoded)")
         print(f"\n💡 Test it:")
         print(f"   bash {script_path}")
+        if runner_path:
+            print(f"\n🚀 Bulk sends:")
+            print(f"   python {runner_path} --payloads rows.csv --workers 4 --rate 2")
+            print(f"   python {runner_path} --count 50 --dry-run")
         print(f"\n🔄 Webhook Rotation:")
         print(f"   This script will run every ~47 minutes as part of the rotation")
 
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Beam Webhook Runner
+
+Generated by create_auto_trigger.py --runner. Sends the captured task payload,
+or one payload per input row, to the agent webhook from a pooled keep-alive
+session on a rate-limited worker pool.
+
+Usage:
+    # One request (same as the .sh script)
+    python runner.py
+
+    # 100 copies of the captured payload, 8 workers, max 5 requests/second
+    python runner.py --count 100 --workers 8 --rate 5
+
+    # One request per CSV row / JSON list item / JSONL line (merged over the captured payload)
+    python runner.py --payloads rows.csv --workers 8 --rate 5
+    python runner.py --payloads payloads.jsonl --attachment-column resume_file
+
+    # Show the first payload without sending
+    python runner.py --payloads rows.csv --dry-run
+
+Every request is appended to a JSONL results log (row, HTTP status, latency,
+bytes sent, error) by the worker that sent it. Only a few rows are queued
+ahead of the workers, so Ctrl+C stops a bulk send after the requests in flight. Attachments are base64-encoded by streaming, once per
+file, and streamed from disk into each multipart request.
+"""
+
+import argparse
+import base64
+import csv
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+# typing imports of RateLimiter: filled in by create_auto_trigger.py
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+CONFIG = {}  # Filled in by create_auto_trigger.py
+
+WORKERS = 4            # Concurrent requests
+RATE_LIMIT = 2.0       # Requests per second across all workers
+TIMEOUT = 120          # Seconds per request
+MAX_429_RETRIES = 3    # 429 means "not accepted", so it is safe to resend
+READ_CHUNK = 3 * 64 * 1024  # Multiple of 3: base64 chunks concatenate without padding
+MIME_TYPES = {".pdf": "application/pdf"}
+
+
+class RateLimiter: ...  # Filled in by create_auto_trigger.py (_shared/beam_http.RateLimiter)
+
+
+def format_size(size):
+    return f"{size} B" if size < 1024 else f"{size // 1024} KB"
+
+
+class EncodedAttachment:
+    """
+    A file base64-encoded once, in chunks, into a temp file.
+
+    ``meta`` holds the encodedContextFiles entry without ``data``; requests
+    stream the encoded bytes from ``path``.
+    """
+
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, source):
+        source = Path(source)
+        fd, self.path = tempfile.mkstemp(prefix="beam-b64-", suffix=".txt")
+        with open(source, "rb") as src, os.fdopen(fd, "wb") as dst:
+            while True:
+                chunk = src.read(READ_CHUNK)
+                if not chunk:
+                    break
+                dst.write(base64.b64encode(chunk))
+        self.length = os.path.getsize(self.path)
+        size = source.stat().st_size
+        self.meta = {
+            "mimeType": MIME_TYPES.get(source.suffix.lower(), "application/octet-stream"),
+            "fileType": "document",
+            "fileExtension": source.suffix.lstrip("."),
+            "fileName": source.name,
+            "fileSize": format_size(size),
+        }
+
+    @classmethod
+    def get(cls, source):
+        """Encoded attachment for a path (encoded on first use, then reused)."""
+        key = str(Path(source).resolve())
+        with cls._cache_lock:
+            if key not in cls._cache:
+                cls._cache[key] = cls(source)
+            return cls._cache[key]
+
+    @classmethod
+    def cleanup(cls):
+        for attachment in cls._cache.values():
+            try:
+                os.unlink(attachment.path)
+            except OSError:
+                pass
+
+
+class MultipartBody:
+    """
+    multipart/form-data body read lazily from bytes and file segments.
+
+    Has a length, so requests sends Content-Length instead of chunked
+    encoding, and never holds an attachment in memory.
+    """
+
+    def __init__(self, fields, boundary):
+        """
+        Args:
+            fields: list of (name, segments); a segment is bytes or (file path, length)
+            boundary: multipart boundary string
+        """
+        self.boundary = boundary
+        self.segments = []
+        for name, parts in fields:
+            self.segments.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode())
+            self.segments.extend(parts)
+            self.segments.append(b"\r\n")
+        self.segments.append(f"--{boundary}--\r\n".encode())
+        self.length = sum(len(s) if isinstance(s, bytes) else s[1] for s in self.segments)
+        self._index = 0
+        self._file = None
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+        size = READ_CHUNK if size is None or size < 0 else size
+        out = bytearray()
+        while len(out) < size and self._index < len(self.segments):
+            segment = self.segments[self._index]
+            if isinstance(segment, bytes):
+                out += segment
+                self._index += 1
+                continue
+            if self._file is None:
+                self._file = open(segment[0], "rb")
+            data = self._file.read(size - len(out))
+            if data:
+                out += data
+            else:
+                self._file.close()
+                self._file = None
+                self._index += 1
+        return bytes(out)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+
+
+def build_request(payload, attachment=None):
+    """
+    Request kwargs for one webhook call.
+
+    JSON mode posts the payload as JSON. Form mode sends a 'task' field (JSON
+    with a fresh timestamp) and, with an attachment, an 'encodedContextFiles'
+    field whose base64 data is streamed from the encoded temp file.
+    """
+    if CONFIG["mode"] == "json" and not attachment:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        return {"data": body, "headers": {"Content-Type": "application/json"}}
+
+    payload = dict(payload)
+    payload["timestamp"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    fields = [("task", [json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")])]
+    if attachment:
+        encoded = EncodedAttachment.get(attachment)
+        head = json.dumps([dict(encoded.meta, data="")], ensure_ascii=False, separators=(",", ":"))
+        prefix, suffix = head.split('"data":""', 1)
+        fields.append(("encodedContextFiles", [
+            (prefix + '"data":"').encode("utf-8"),
+            (encoded.path, encoded.length),
+            ('"' + suffix).encode("utf-8"),
+        ]))
+    boundary = f"----beamwebhook{os.urandom(8).hex()}"
+    return {
+        "data": MultipartBody(fields, boundary),
+        "headers": {"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    }
+
+
+def parse_cell(value):
+    """CSV cell: JSON objects/arrays are decoded, everything else stays a string."""
+    text = value.strip()
+    if text[:1] in "[{":
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    return value
+
+
+def load_rows(path, attachment_column):
+    """
+    Rows from CSV, a JSON list (or {"payloads": [...]}) or JSONL.
+
+    Returns:
+        List of (payload overrides, attachment path or None)
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            items = [{k: parse_cell(v) for k, v in row.items() if k and v != ""} for row in csv.DictReader(f)]
+    else:
+        text = path.read_text(encoding="utf-8").strip()
+        try:
+            items = json.loads(text)
+        except ValueError:
+            items = [json.loads(line) for line in text.splitlines() if line.strip()]
+        if isinstance(items, dict):
+            items = items.get("payloads", [items])
+
+    rows = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError(f"Each payload must be an object, got: {str(item)[:80]}")
+        item = dict(item)
+        rows.append((item, item.pop(attachment_column, None) or None))
+    return rows
+
+
+def send_one(session, limiter, index, payload, attachment, stop=None):
+    """
+    POST one payload; 429s are resent after Retry-After.
+
+    Returns:
+        Results-log record, or None if ``stop`` was set before anything was sent
+    """
+    record = {"row": index, "status": None, "ok": False, "attempts": 0, "bytes": 0}
+    started = time.perf_counter()
+    try:
+        for attempt in range(MAX_429_RETRIES + 1):
+            limiter.acquire()
+            if stop is not None and stop.is_set():
+                if not attempt:
+                    return None
+                record["error"] = "interrupted before resending a 429"
+                break
+            kwargs = build_request(payload, attachment)
+            record["attempts"] = attempt + 1
+            record["bytes"] = len(kwargs["data"])
+            attempt_started = time.perf_counter()
+            try:
+                response = session.post(CONFIG["webhook_url"], timeout=TIMEOUT, **kwargs)
+            finally:
+                if isinstance(kwargs["data"], MultipartBody):
+                    kwargs["data"].close()
+            record["latency_ms"] = round((time.perf_counter() - attempt_started) * 1000, 1)
+            record["status"] = response.status_code
+            if response.status_code == 429 and attempt < MAX_429_RETRIES:
+                time.sleep(retry_after_seconds(response, attempt))
+                continue
+            record["ok"] = 200 <= response.status_code < 300
+            if not record["ok"]:
+                record["error"] = " ".join(response.text.split())[:300]
+            break
+    except Exception as e:
+        record["error"] = " ".join(str(e).split())[:300]
+    record["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    record["ts"] = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+    if attachment:
+        record["attachment"] = str(attachment)
+    return record
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def retry_after_seconds(response, attempt):
+    """Retry-After in seconds (delta form), else exponential backoff."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "")))
+    except ValueError:
+        return float(2 ** attempt)
+
+
+def main():
+    script = Path(__file__).resolve()
+    parser = argparse.ArgumentParser(description=f"Send Beam webhook requests ({script.name})")
+    parser.add_argument("--payloads", help="CSV, JSON list or JSONL of payloads (merged over the captured payload)")
+    parser.add_argument("--replace", action="store_true", help="Rows replace the captured payload instead of merging")
+    parser.add_argument("--count", type=int, default=1, help="Copies of the captured payload when no --payloads")
+    parser.add_argument("--attachment", default=CONFIG.get("attachment"),
+                        help="File attached to every request (default: the one given at generation)")
+    parser.add_argument("--attachment-column", default="attachment_file",
+                        help="Row field holding a per-row attachment path (default: attachment_file)")
+    parser.add_argument("--workers", type=int, default=WORKERS, help=f"Concurrent requests (default: {WORKERS})")
+    parser.add_argument("--rate", type=float, default=RATE_LIMIT,
+                        help=f"Max requests per second, 0 = unlimited (default: {RATE_LIMIT:g})")
+    parser.add_argument("--log", help="Results JSONL (default: results/<script>-<timestamp>.jsonl next to this script)")
+    parser.add_argument("--dry-run", action="store_true", help="Print the first payload and exit")
+    args = parser.parse_args()
+
+    base = CONFIG["payload"]
+    if args.payloads:
+        rows = [(overrides if args.replace else {**base, **overrides}, attachment or args.attachment)
+                for overrides, attachment in load_rows(args.payloads, args.attachment_column)]
+    else:
+        rows = [(dict(base), args.attachment)] * max(1, args.count)
+    if not rows:
+        print("[ERROR] No payloads to send", file=sys.stderr)
+        sys.exit(1)
+    missing = sorted({str(a) for _, a in rows if a and not Path(a).is_file()})
+    if missing:
+        print(f"[ERROR] Attachment not found: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.dry_run:
+        payload, attachment = rows[0]
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        print(f"[INFO] {len(rows)} requests, mode {CONFIG['mode']}"
+              f"{', attachment ' + str(attachment) if attachment else ''}", file=sys.stderr)
+        return
+
+    log_path = Path(args.log) if args.log else \
+        script.parent / "results" / f"{script.stem}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, args.workers))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    limiter = RateLimiter(args.rate, burst=args.workers)
+
+    print(f"[INFO] Sending {len(rows)} requests to {CONFIG['webhook_url']} "
+          f"({args.workers} workers, {args.rate:g}/s)")
+    started = time.perf_counter()
+    records = []
+    stop = threading.Event()
+    log_lock = threading.Lock()
+
+    def send_and_log(index, payload, attachment):
+        record = send_one(session, limiter, index, payload, attachment, stop)
+        if record is not None:
+            with log_lock:
+                log.write(json.dumps(record, ensure_ascii=False) + "\n")
+                log.flush()
+        return record
+
+    try:
+        with open(log_path, "a", encoding="utf-8") as log:
+            pool = ThreadPoolExecutor(max_workers=max(1, args.workers))
+            queue = ((i, payload, attachment) for i, (payload, attachment) in enumerate(rows))
+            try:
+                pending = {pool.submit(send_and_log, *row) for row in islice(queue, 2 * max(1, args.workers))}
+                while pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record = future.result()
+                        row = next(queue, None)
+                        if row is not None:
+                            pending.add(pool.submit(send_and_log, *row))
+                        records.append(record)
+                        done = len(records)
+                        if not record["ok"]:
+                            print(f"[ERROR] row {record['row']}: HTTP {record['status']} "
+                                  f"{record.get('error', '')[:120]}", file=sys.stderr)
+                        elif done % 50 == 0 or done == len(rows):
+                            print(f"[INFO] {done}/{len(rows)} sent")
+            except BaseException:
+                # Ctrl+C: send nothing more; requests in flight finish and log themselves
+                stop.set()
+                raise
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+    except KeyboardInterrupt:
+        print(f"\n[INFO] Interrupted; every request sent is logged in {log_path}",
+              file=sys.stderr)
+        sys.exit(130)
+    finally:
+        session.close()
+        EncodedAttachment.cleanup()
+
+    elapsed = time.perf_counter() - started
+    latencies = [r["latency_ms"] for r in records if "latency_ms" in r]
+    failed = [r for r in records if not r["ok"]]
+    print(f"\n[{'OK' if not failed else 'ERROR'}] {len(records) - len(failed)}/{len(records)} accepted "
+          f"in {elapsed:.1f}s ({len(records) / elapsed:.1f} req/s)")
+    print(f"     Latency p50 {percentile(latencies, 50):.0f}ms, p95 {percentile(latencies, 95):.0f}ms, "
+          f"p99 {percentile(latencies, 99):.0f}ms")
+    print(f"     Results: {log_path}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark Agent Graph Analysis
+
+Times the shared AgentGraph index plus the two analyzers built on it
+(document_agent.analyze_graph + markdown generation, and
+fetch_and_analyze.analyze_agent) on saved graphs, and on a synthetic graph
+scaled up from the largest one.
+
+Usage:
+    python benchmark_graph_analysis.py
+    python benchmark_graph_analysis.py --graphs 04-workspace/beam-graphs --scale 300 --repeat 50
+    python benchmark_graph_analysis.py --json
+"""
+
+import argparse
+import copy
+import importlib.util
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(SKILLS_DIR))
+
+try:
+    from _shared.beam_graph import AgentGraph
+except ImportError as e:
+    print(f"[ERROR] Could not import shared modules: {e}", file=sys.stderr)
+    sys.exit(1)
+
+
+def load_script(name, path):
+    """Import a skill script as a module (its main() is not run)."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def scale_graph(data, target_nodes):
+    """
+    Build a larger graph by chaining copies of ``data``.
+
+    Each copy gets fresh node/edge IDs; the exit nodes of copy k feed the
+    (former) entry node of copy k+1, and only the first copy keeps its flags.
+    """
+    base = data.get("graph", data)
+    base_nodes = base.get("nodes", [])
+    if not base_nodes:
+        return data
+    copies = -(-target_nodes // len(base_nodes))
+    nodes = []
+    previous_exits = []
+    for k in range(copies):
+        suffix = f"-x{k}"
+        ids = {n["id"]: n["id"] + suffix for n in base_nodes}
+        chunk = []
+        for node in base_nodes:
+            clone = copy.deepcopy(node)
+            clone["id"] = ids[node["id"]]
+            if k:
+                clone["isEntryNode"] = False
+            for key in ("childEdges", "parentEdges"):
+                clone[key] = [
+                    {**edge,
+                     "id": f"{edge.get('id')}{suffix}",
+                     "sourceAgentGraphNodeId": ids.get(edge.get("sourceAgentGraphNodeId"), edge.get("sourceAgentGraphNodeId")),
+                     "targetAgentGraphNodeId": ids.get(edge.get("targetAgentGraphNodeId"), edge.get("targetAgentGraphNodeId"))}
+                    for edge in node.get(key, []) or []
+                ]
+            chunk.append(clone)
+        first_step = next((c for c, n in zip(chunk, base_nodes) if n.get("isEntryNode")), chunk[0])
+        for exit_node in previous_exits:
+            exit_node["childEdges"].append({"id": f"link-{exit_node['id']}", "condition": "",
+                                            "sourceAgentGraphNodeId": exit_node["id"],
+                                            "targetAgentGraphNodeId": first_step["id"]})
+            exit_node["isExitNode"] = False
+        previous_exits = [n for n in chunk if n.get("isExitNode")]
+        nodes.extend(chunk)
+    return {"graph": {**base, "id": f"{base.get('id')}-scaled", "nodes": nodes}}
+
+
+def time_ms(fn, arg, repeat):
+    """Median wall time of fn(arg) in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def benchmark(name, data, document_agent, fetch_and_analyze, repeat):
+    graph = AgentGraph(data)
+    return {
+        "graph": name,
+        "nodes": len(graph.nodes),
+        "edges": len(graph.edges),
+        "index_ms": time_ms(AgentGraph, data, repeat),
+        "document_ms": time_ms(
+            lambda d: document_agent.generate_markdown_documentation(document_agent.analyze_graph(d)), data, repeat),
+        "analyze_ms": time_ms(fetch_and_analyze.analyze_agent, data, repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark agent graph indexing and analysis")
+    parser.add_argument("--graphs", default=str(SKILLS_DIR.parent / "04-workspace" / "beam-graphs"),
+                        help="Directory of graph JSON files (default: 04-workspace/beam-graphs)")
+    parser.add_argument("--scale", type=int, default=300,
+                        help="Node count of the synthetic graph built from the largest file (0 = skip)")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement (median reported)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    document_agent = load_script(
+        "document_agent", SKILLS_DIR / "demo-documentation-generation-agent" / "scripts" / "document_agent.py")
+    fetch_and_analyze = load_script(
+        "fetch_and_analyze", SKILLS_DIR / "generate-demo-agent-sample-input-data" / "scripts" / "fetch_and_analyze.py")
+
+    graphs = []
+    for path in sorted(Path(args.graphs).glob("*.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[ERROR] {path}: {e}", file=sys.stderr)
+            continue
+        if isinstance(data, dict) and isinstance(data.get("graph"), dict) and data["graph"].get("nodes"):
+            graphs.append((path.name, data))
+    if not graphs:
+        print(f"[ERROR] No graph files in {args.graphs}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.scale:
+        name, largest = max(graphs, key=lambda item: len(item[1]["graph"]["nodes"]))
+        graphs.append((f"{name} x{args.scale} (synthetic)", scale_graph(largest, args.scale)))
+
+    results = [benchmark(name, data, document_agent, fetch_and_analyze, args.repeat) for name, data in graphs]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'Graph':<48} {'Nodes':>5} {'Edges':>5} {'Index':>9} {'Document':>9} {'Analyze':>9}")
+    print("-" * 90)
+    for r in results:
+        print(f"{r['graph'][:48]:<48} {r['nodes']:>5} {r['edges']:>5} {r['index_ms']:>7.2f}ms "
+              f"{r['document_ms']:>7.2f}ms {r['analyze_ms']:>7.2f}ms")
+    print(f"\nMedian of {args.repeat} runs. Document = analyze_graph + markdown; Analyze = analyze_agent.")
+
+
+if __name__ == "__main__":
+    main()
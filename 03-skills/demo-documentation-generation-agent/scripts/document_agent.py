@@ -22,22 +22,24 @@ from pathlib import Path
 
 # Add shared modules to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent / "00-system" / "skills" / "beam" / "beam-master" / "scripts"))
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent / "03-skills" / "_shared"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent / "03-skills"))
 
 try:
     from beam_client import get_client
-except ImportError:
-    print("[ERROR] Could not import beam_client", file=sys.stderr)
-    print("Ensure 00-system/skills/beam/beam-master/scripts/beam_client.py exists", file=sys.stderr)
+    from _shared.beam_graph import AgentGraph
+    from _shared.beam_graph_cache import GraphCache
+except ImportError as e:
+    print(f"[ERROR] Could not import shared modules: {e}", file=sys.stderr)
+    print("Ensure 00-system/skills/beam/beam-master/scripts/beam_client.py and "
+          "03-skills/_shared/beam_graph.py / beam_graph_cache.py exist", file=sys.stderr)
     sys.exit(1)
 
 
-def fetch_agent_graph(workspace_id, agent_id):
-    """Fetch agent graph from Beam AI API"""
+def fetch_agent_graph(workspace_id, agent_id, refresh=False):
+    """Fetch agent graph from Beam AI API (served from the local graph cache if fetched recently)"""
     try:
-        client = get_client()
-        result = client.get(f'/agent-graphs/{agent_id}')
-        return result
+        return GraphCache().fetch(agent_id, lambda: get_client().get(f'/agent-graphs/{agent_id}'),
+                                  refresh=refresh)
     except Exception as e:
         print(f"[ERROR] Failed to fetch agent graph: {e}", file=sys.stderr)
         return None
@@ -54,35 +56,55 @@ def load_graph_from_file(file_path):
         return None
 
 
+# Integrations detected from tool/function names (matched case-insensitively)
+INTEGRATION_MAP = {
+    'Airtable': 'Database storage and query',
+    'Gmail': 'Email operations',
+    'Slack': 'Team communication',
+    'Greenhouse': 'ATS integration',
+    'LinkedIn': 'Professional network',
+    'HubSpot': 'CRM operations',
+    'Workable': 'Applicant tracking',
+    'Calendly': 'Availability scheduling',
+    'GoogleCalendar': 'Calendar management',
+    'Google': 'Google Workspace services'
+}
+
+
 def analyze_graph(graph_data):
-    """Analyze agent graph and extract metadata with detailed descriptions"""
-    graph = graph_data.get('graph', {})
-    nodes = graph.get('nodes', [])
-    edges = graph.get('edges', [])
+    """
+    Analyze agent graph and extract metadata with detailed descriptions.
+
+    Steps are numbered in topological order (entry node first); edges come
+    from the nodes' childEdges via the shared AgentGraph index.
+    """
+    graph = AgentGraph(graph_data)
+    info = graph.graph
 
     analysis = {
         'info': {
-            'agent_id': graph.get('agentId'),
-            'graph_id': graph.get('id'),
-            'is_active': graph.get('isActive'),
-            'is_published': graph.get('isPublished'),
-            'is_draft': graph.get('isDraft'),
-            'total_nodes': len(nodes),
-            'total_edges': len(edges)
+            'agent_id': info.get('agentId'),
+            'graph_id': info.get('id'),
+            'is_active': info.get('isActive'),
+            'is_published': info.get('isPublished'),
+            'is_draft': info.get('isDraft'),
+            'total_nodes': len(graph.nodes),
+            'total_edges': len(graph.edges)
         },
         'nodes': [],
         'connections': [],
         'integrations': {},  # Changed to dict to store integration details
         'inputs': {},  # Changed to dict to store input descriptions
         'outputs': {},  # Changed to dict to store output descriptions
-        'tools': set()  # Track unique tools used
+        'tools': sorted(graph.by_tool)  # Unique tools used
     }
 
     # Analyze each node with detailed extraction
-    for idx, node in enumerate(nodes, 1):
+    for idx, node_id in enumerate(graph.order, 1):
+        node = graph.by_id[node_id]
         node_info = {
             'step': idx,
-            'id': node.get('id'),
+            'id': node_id,
             'objective': node.get('objective'),
             'is_entry': node.get('isEntryNode', False),
             'is_exit': node.get('isExitNode', False),
@@ -95,60 +117,28 @@ def analyze_graph(graph_data):
         }
 
         # Extract tool configuration with descriptions
-        tool_config = node.get('toolConfiguration', {})
+        tool_config = graph.tool_config(node_id)
         if tool_config:
             tool_name = tool_config.get('toolName', '')
-            tool_function = tool_config.get('toolFunctionName', '')
-            tool_description = tool_config.get('description', '')
 
-            node_info['tool'] = tool_function
+            node_info['tool'] = tool_config.get('toolFunctionName', '')
             node_info['tool_name'] = tool_name
-            node_info['tool_description'] = tool_description
-
-            if tool_name:
-                analysis['tools'].add(tool_name)
-
-            # Detect integrations with details
-            integration_map = {
-                'Airtable': 'Database storage and query',
-                'Gmail': 'Email operations',
-                'Slack': 'Team communication',
-                'Greenhouse': 'ATS integration',
-                'LinkedIn': 'Professional network',
-                'HubSpot': 'CRM operations',
-                'Workable': 'Applicant tracking',
-                'Calendly': 'Availability scheduling',
-                'GoogleCalendar': 'Calendar management',
-                'Google': 'Google Workspace services'
-            }
-
-            for integration, purpose in integration_map.items():
-                if integration.lower() in tool_name.lower() or integration.lower() in tool_function.lower():
-                    if integration not in analysis['integrations']:
-                        analysis['integrations'][integration] = {
-                            'purpose': purpose,
-                            'tools': [],
-                            'functions': []
-                        }
-                    analysis['integrations'][integration]['tools'].append(tool_name)
-                    analysis['integrations'][integration]['functions'].append(tool_function)
+            node_info['tool_description'] = tool_config.get('description', '')
 
             # Extract inputs with descriptions
             for param in tool_config.get('inputParams', []):
                 param_name = param.get('paramName', '')
                 param_desc = param.get('paramDescription', '')
                 fill_type = param.get('fillType', '')
-                static_value = param.get('staticValue')
                 required = param.get('required', False)
 
-                param_info = {
+                node_info['inputs'].append({
                     'name': param_name,
                     'description': param_desc,
                     'fill_type': fill_type,
                     'required': required,
-                    'static_value': static_value
-                }
-                node_info['inputs'].append(param_info)
+                    'static_value': param.get('staticValue')
+                })
 
                 # Store input descriptions
                 if fill_type == 'ai_fill' and required:
@@ -170,23 +160,21 @@ def analyze_graph(graph_data):
 
         analysis['nodes'].append(node_info)
 
-    # Analyze edges
-    for edge in edges:
-        source = edge.get('source')
-        target = edge.get('target')
-
-        source_node = next((n for n in analysis['nodes'] if n['id'] == source), None)
-        target_node = next((n for n in analysis['nodes'] if n['id'] == target), None)
-
-        if source_node and target_node:
-            analysis['connections'].append({
-                'from': source_node['objective'],
-                'to': target_node['objective'],
-                'condition': edge.get('condition', {})
-            })
+    # Detect integrations with details (one pass over pre-lowered tool names)
+    for integration, node_ids in graph.match_keywords(INTEGRATION_MAP).items():
+        analysis['integrations'][integration] = {
+            'purpose': INTEGRATION_MAP[integration],
+            'tools': [graph.tool_name(node_id) for node_id in node_ids],
+            'functions': [graph.tool_config(node_id).get('toolFunctionName', '') for node_id in node_ids]
+        }
 
-    # Convert tools set to sorted list
-    analysis['tools'] = sorted(list(analysis['tools']))
+    # Analyze edges
+    for edge in graph.edges:
+        analysis['connections'].append({
+            'from': graph.by_id[edge['source']].get('objective'),
+            'to': graph.by_id[edge['target']].get('objective'),
+            'condition': edge['condition']
+        })
 
     return analysis
 
@@ -395,6 +383,7 @@ Examples:
     parser.add_argument('--output-dir', default='04-workspace/beam-agents', help='Output directory')
     parser.add_argument('--agent-name', help='Override agent name')
     parser.add_argument('--format', default='both', choices=['markdown', 'json', 'both'], help='Output format')
+    parser.add_argument('--refresh', action='store_true', help='Bypass the local graph cache and re-download')
 
     args = parser.parse_args()
 
@@ -418,7 +407,7 @@ Examples:
         print(f"🌐 Fetching agent graph from Beam AI...")
         print(f"   Workspace: {args.workspace_id}")
         print(f"   Agent: {args.agent_id}")
-        graph_data = fetch_agent_graph(args.workspace_id, args.agent_id)
+        graph_data = fetch_agent_graph(args.workspace_id, args.agent_id, refresh=args.refresh)
 
     if not graph_data:
         print("❌ Failed to fetch/load agent graph", file=sys.stderr)
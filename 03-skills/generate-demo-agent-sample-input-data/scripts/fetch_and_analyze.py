@@ -8,6 +8,7 @@ for generating sample input data.
 Usage:
     python fetch_and_analyze.py <workspace_id> <agent_id>
     python fetch_and_analyze.py --url "https://app.beam.ai/workspace/agent"
+    python fetch_and_analyze.py <workspace_id> <agent_id> --refresh   # bypass graph cache
 
 Output:
     JSON with agent analysis including:
@@ -33,6 +34,17 @@ except ImportError:
     print("Install with: pip install requests", file=sys.stderr)
     sys.exit(1)
 
+# Add parent directories to path for shared module import
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+try:
+    from _shared.beam_graph import AgentGraph
+    from _shared.beam_graph_cache import GraphCache
+except ImportError as e:
+    print(f"[ERROR] Could not import shared modules: {e}", file=sys.stderr)
+    print("Ensure 03-skills/_shared/beam_graph.py and beam_graph_cache.py exist", file=sys.stderr)
+    sys.exit(1)
+
 
 def find_nexus_root():
     """Find Nexus root directory by looking for CLAUDE.md"""
@@ -103,10 +115,23 @@ def fetch_agent_graph(token, workspace_id, agent_id):
     return None
 
 
+# Tool-name keywords that identify external data sources, checked in order
+DATA_SOURCE_KEYWORDS = [
+    ("retrieve all rows", "google_sheets"),
+    ("google sheets", "google_sheets"),
+    ("airtable", "airtable"),
+    ("database", "database"),
+    ("sql", "database"),
+]
+
+
 def analyze_agent(data):
     """
     Analyze agent graph and extract key information.
 
+    Nodes are visited in topological order (entry first) using the shared
+    AgentGraph index, so "first processing node" means first in the flow.
+
     Returns dict with:
     - metadata: Basic agent info
     - trigger_type: How agent is triggered
@@ -115,8 +140,8 @@ def analyze_agent(data):
     - decision_paths: Branching logic
     - tools_used: List of tools in workflow
     """
-    graph = data.get("graph", data)
-    nodes = graph.get("nodes", [])
+    agent_graph = AgentGraph(data)
+    graph = agent_graph.graph
 
     analysis = {
         "metadata": {
@@ -125,7 +150,7 @@ def analyze_agent(data):
             "is_published": graph.get("isPublished", False),
             "is_active": graph.get("isActive", False),
             "published_at": graph.get("publishedAt"),
-            "node_count": len(nodes)
+            "node_count": len(agent_graph.nodes)
         },
         "trigger_type": "unknown",
         "input_params": [],
@@ -136,10 +161,12 @@ def analyze_agent(data):
     }
 
     # Analyze each node
-    for node in nodes:
-        tool_config = node.get("toolConfiguration", {})
+    for node_id in agent_graph.order:
+        node = agent_graph.by_id[node_id]
+        tool_config = agent_graph.tool_config(node_id)
         tool_name = tool_config.get("toolName", "")
-        objective = node.get("objective", "")
+        tool_lower = tool_name.lower()
+        objective = node.get("objective") or ""
 
         # Detect trigger type from first node after entry
         if node.get("isEntryNode"):
@@ -153,12 +180,11 @@ def analyze_agent(data):
 
         # Collect tool info
         if tool_name:
-            tool_info = {
+            analysis["tools_used"].append({
                 "name": tool_name,
                 "objective": objective[:100],
-                "node_id": node.get("id", "")[:8]
-            }
-            analysis["tools_used"].append(tool_info)
+                "node_id": node_id[:8]
+            })
             analysis["workflow_summary"].append({
                 "step": len(analysis["workflow_summary"]),
                 "type": "tool",
@@ -167,14 +193,12 @@ def analyze_agent(data):
             })
 
         # Detect trigger type
-        if "email" in tool_name.lower() or "gmail" in tool_name.lower():
-            if analysis["trigger_type"] == "unknown":
-                analysis["trigger_type"] = "email"
+        if analysis["trigger_type"] == "unknown" and ("email" in tool_lower or "gmail" in tool_lower):
+            analysis["trigger_type"] = "email"
 
         # Extract input parameters from first processing node
         if not analysis["input_params"]:
-            inputs = tool_config.get("inputParams", [])
-            for param in inputs:
+            for param in tool_config.get("inputParams", []):
                 analysis["input_params"].append({
                     "name": param.get("paramName", ""),
                     "description": param.get("paramDescription", ""),
@@ -184,48 +208,32 @@ def analyze_agent(data):
                 })
 
         # Detect data sources
-        tool_lower = tool_name.lower()
-        if "retrieve all rows" in tool_lower or "google sheets" in tool_lower:
-            analysis["data_sources"].append({
-                "type": "google_sheets",
-                "tool": tool_name,
-                "node_id": node.get("id", "")[:8]
-            })
-        elif "airtable" in tool_lower:
-            analysis["data_sources"].append({
-                "type": "airtable",
-                "tool": tool_name,
-                "node_id": node.get("id", "")[:8]
-            })
-        elif "database" in tool_lower or "sql" in tool_lower:
+        source_type = next((kind for keyword, kind in DATA_SOURCE_KEYWORDS if keyword in tool_lower), None)
+        if source_type:
             analysis["data_sources"].append({
-                "type": "database",
+                "type": source_type,
                 "tool": tool_name,
-                "node_id": node.get("id", "")[:8]
+                "node_id": node_id[:8]
             })
 
         # Detect decision paths (nodes with multiple child edges)
-        child_edges = node.get("childEdges", [])
-        if len(child_edges) > 1:
-            conditions = []
-            for edge in child_edges:
-                condition = edge.get("condition", "")
-                if condition:
-                    conditions.append(condition)
+        out_edges = agent_graph.out_edges[node_id]
+        if len(out_edges) > 1:
             analysis["decision_paths"].append({
-                "node_id": node.get("id", "")[:8],
+                "node_id": node_id[:8],
                 "tool": tool_name,
-                "branches": len(child_edges),
-                "conditions": conditions
+                "branches": len(out_edges),
+                "conditions": [edge["condition"] for edge in out_edges if edge["condition"]]
             })
 
     # Detect trigger type from tools if still unknown
     if analysis["trigger_type"] == "unknown":
         for tool in analysis["tools_used"]:
-            if "email" in tool["name"].lower():
+            tool_lower = tool["name"].lower()
+            if "email" in tool_lower:
                 analysis["trigger_type"] = "email"
                 break
-            elif "webhook" in tool["name"].lower():
+            elif "webhook" in tool_lower:
                 analysis["trigger_type"] = "webhook"
                 break
         else:
@@ -243,6 +251,7 @@ def main():
     parser.add_argument("--url", help="Full Beam agent URL (alternative to IDs)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--save", help="Save analysis to file")
+    parser.add_argument("--refresh", action="store_true", help="Bypass the local graph cache and re-download")
 
     args = parser.parse_args()
 
@@ -259,29 +268,33 @@ def main():
         print("[ERROR] Provide workspace_id and agent_id, or --url", file=sys.stderr)
         sys.exit(1)
 
-    # Load API key
-    root = find_nexus_root()
-    env_vars = load_env_file(root / '.env')
-    api_key = env_vars.get('BEAM_API_KEY') or os.getenv('BEAM_API_KEY')
-
-    if not api_key:
-        print("[ERROR] BEAM_API_KEY not found in .env", file=sys.stderr)
-        sys.exit(1)
-
     print(f"[INFO] Fetching agent: {agent_id}", file=sys.stderr)
     print(f"[INFO] Workspace: {workspace_id}", file=sys.stderr)
 
-    # Get token
-    token = get_access_token(api_key)
-    if not token:
-        sys.exit(1)
-    print("[OK] Authenticated", file=sys.stderr)
+    def download():
+        # Load API key
+        root = find_nexus_root()
+        env_vars = load_env_file(root / '.env')
+        api_key = env_vars.get('BEAM_API_KEY') or os.getenv('BEAM_API_KEY')
+
+        if not api_key:
+            print("[ERROR] BEAM_API_KEY not found in .env", file=sys.stderr)
+            return None
+
+        # Get token
+        token = get_access_token(api_key)
+        if not token:
+            return None
+        print("[OK] Authenticated", file=sys.stderr)
+
+        return fetch_agent_graph(token, workspace_id, agent_id)
 
-    # Fetch graph
-    data = fetch_agent_graph(token, workspace_id, agent_id)
+    # Fetch graph (served from the local graph cache if fetched recently)
+    cache = GraphCache()
+    data = cache.fetch(agent_id, download, refresh=args.refresh)
     if not data:
         sys.exit(1)
-    print("[OK] Graph fetched", file=sys.stderr)
+    print("[OK] Graph " + ("loaded from cache" if cache.hits else "fetched"), file=sys.stderr)
 
     # Analyze
     analysis = analyze_agent(data)
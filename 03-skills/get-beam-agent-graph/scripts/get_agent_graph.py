@@ -3,7 +3,11 @@
 Fetch Beam.ai agent graph via API
 
 Usage:
-    python get_agent_graph.py <workspace_id> <agent_id> [--output <path>]
+    python get_agent_graph.py <workspace_id> <agent_id> [--output <path>] [--refresh]
+
+Graphs go through the shared graph cache (04-workspace/.beam-graph-cache):
+a repeat fetch within BEAM_GRAPH_CACHE_TTL seconds (default 900) is served
+locally, and an unchanged graph is not written out again.
 
 Example:
     python get_agent_graph.py 505d2090-2b5d-4e45-b0f4-cc3a0b299aa8 162e7c30-0d95-49ab-af99-7eef872a2d0d
@@ -15,7 +19,6 @@ import os
 import json
 import argparse
 from pathlib import Path
-from datetime import datetime
 
 try:
     import requests
@@ -24,6 +27,16 @@ except ImportError:
     print("Install with: pip install requests")
     sys.exit(1)
 
+# Add parent directories to path for shared module import
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+try:
+    from _shared.beam_graph_cache import GraphCache, content_hash, graph_version
+except ImportError as e:
+    print(f"[ERROR] Could not import shared modules: {e}")
+    print("Ensure 03-skills/_shared/beam_graph_cache.py exists")
+    sys.exit(1)
+
 
 def load_env_file(env_path):
     """Load .env file and return dict of environment variables"""
@@ -120,46 +133,45 @@ def save_graph(graph_data, agent_id, output_dir):
     """
     Save agent graph to JSON file
 
+    The filename ends with the graph's content hash, so saving an unchanged
+    graph again reuses the existing file instead of adding another copy.
+
     Args:
         graph_data: Agent graph JSON data
         agent_id: Agent ID for filename
         output_dir: Directory to save the file
 
     Returns:
-        Path to saved file or None on error
+        (path to saved file or None on error, True if the file already existed)
     """
     # Create output directory if it doesn't exist
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Try to extract agent name from graph data
-    agent_name = None
-    if isinstance(graph_data, dict):
-        agent_name = (
-            graph_data.get("name") or
-            graph_data.get("agentName") or
-            graph_data.get("agent_name")
-        )
+    # Agent name lives under graph.agent.name in the API response
+    agent_name = graph_version(graph_data).get("name") if isinstance(graph_data, dict) else None
 
     # Create meaningful filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    digest = content_hash(graph_data)[:8]
     if agent_name:
         # Sanitize agent name for filename
         safe_name = "".join(c for c in agent_name if c.isalnum() or c in (' ', '-', '_')).strip()
         safe_name = safe_name.replace(' ', '_')
-        filename = f"{safe_name}_{agent_id[:8]}_graph_{timestamp}.json"
+        filename = f"{safe_name}_{agent_id[:8]}_graph_{digest}.json"
     else:
-        filename = f"{agent_id}_graph_{timestamp}.json"
+        filename = f"{agent_id}_graph_{digest}.json"
 
     file_path = output_path / filename
+    if file_path.exists():
+        return file_path, True
 
     try:
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(graph_data, f, indent=2, ensure_ascii=False)
-        return file_path
+        return file_path, False
     except Exception as e:
         print(f"[ERROR] Failed to save file: {e}", file=sys.stderr)
-        return None
+        return None, False
 
 
 def main():
@@ -172,6 +184,8 @@ def main():
     parser.add_argument("agent_id", help="Agent ID to fetch")
     parser.add_argument("--output", default="04-workspace/beam-graphs",
                        help="Output directory (default: 04-workspace/beam-graphs)")
+    parser.add_argument("--refresh", action="store_true",
+                       help="Bypass the graph cache and download the graph again")
 
     args = parser.parse_args()
 
@@ -192,38 +206,48 @@ def main():
     print(f"  Workspace: {args.workspace_id}", file=sys.stderr)
     print(f"  Agent ID: {args.agent_id}", file=sys.stderr)
 
-    # Step 1: Get access token
-    print("[1/3] Getting access token...", file=sys.stderr)
-    access_token = get_access_token(api_key)
-
-    if not access_token:
-        sys.exit(1)
+    def download():
+        # Step 1: Get access token
+        print("[1/3] Getting access token...", file=sys.stderr)
+        access_token = get_access_token(api_key)
+        if not access_token:
+            return None
+        print("[OK] Access token obtained", file=sys.stderr)
 
-    print("[OK] Access token obtained", file=sys.stderr)
+        # Step 2: Get agent graph
+        print("[2/3] Fetching agent graph...", file=sys.stderr)
+        return get_agent_graph(access_token, args.workspace_id, args.agent_id)
 
-    # Step 2: Get agent graph
-    print("[2/3] Fetching agent graph...", file=sys.stderr)
-    graph_data = get_agent_graph(access_token, args.workspace_id, args.agent_id)
+    cache = GraphCache()
+    graph_data = cache.fetch(args.agent_id, download, refresh=args.refresh)
 
     if not graph_data:
         sys.exit(1)
 
-    print("[OK] Agent graph fetched", file=sys.stderr)
+    if cache.hits:
+        print("[OK] Agent graph served from cache (use --refresh to re-download)", file=sys.stderr)
+    else:
+        print("[OK] Agent graph fetched", file=sys.stderr)
 
     # Step 3: Save to file
     print("[3/3] Saving to file...", file=sys.stderr)
-    file_path = save_graph(graph_data, args.agent_id, args.output)
+    file_path, unchanged = save_graph(graph_data, args.agent_id, args.output)
 
     if not file_path:
         sys.exit(1)
 
-    print(f"\n[SUCCESS] Agent graph saved to: {file_path}", file=sys.stderr)
+    if unchanged:
+        print(f"\n[SUCCESS] Graph unchanged, already saved at: {file_path}", file=sys.stderr)
+    else:
+        print(f"\n[SUCCESS] Agent graph saved to: {file_path}", file=sys.stderr)
 
     # Output JSON for programmatic use
     print(json.dumps({
         "file_path": str(file_path),
         "agent_id": args.agent_id,
-        "workspace_id": args.workspace_id
+        "workspace_id": args.workspace_id,
+        "content_hash": content_hash(graph_data),
+        "from_cache": bool(cache.hits)
     }, indent=2))
 
     sys.exit(0)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Beam Agent Graph Cache
+
+Inspect the local versioned graph cache and diff cached versions offline.
+
+Usage:
+    # Cached agents / versions of one agent
+    python graph_cache.py list
+    python graph_cache.py list <agent_id>
+
+    # What changed between the previous and latest cached version
+    python graph_cache.py graph-diff <agent_id>
+    python graph_cache.py graph-diff <agent_id> --from 1 --to latest --json
+
+    # Add existing graph dumps to the cache (de-duplicated by content)
+    python graph_cache.py import 04-workspace/beam-graphs/*.json
+
+    # Write a cached version back out as JSON
+    python graph_cache.py show <agent_id> --ref 2 --output graph.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directories to path for shared module import
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+try:
+    from _shared.beam_graph_cache import GraphCache, DEFAULT_CACHE_DIR, diff_graphs, diff_is_empty
+except ImportError as e:
+    print(f"Error: Could not import shared modules: {e}")
+    print("Ensure 03-skills/_shared/beam_graph_cache.py exists")
+    sys.exit(1)
+
+
+def _short(value, width=70) -> str:
+    text = " ".join(json.dumps(value, ensure_ascii=False).split()) if not isinstance(value, str) else \
+        " ".join(value.split())
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def _print_fields(fields: dict, indent="      "):
+    for path, (old, new) in fields.items():
+        if isinstance(old, str) and isinstance(new, str):
+            # Long texts (prompts, objectives) often share a prefix: show from where they differ
+            old, new = " ".join(old.split()), " ".join(new.split())
+            same = next((i for i, (a, b) in enumerate(zip(old, new)) if a != b), min(len(old), len(new)))
+            start = max(0, same - 20)
+            if start:
+                old, new = "..." + old[start:], "..." + new[start:]
+        print(f"{indent}{path}: {_short(old)} -> {_short(new)}")
+
+
+def cmd_list(cache: GraphCache, args):
+    index = cache.agents()
+    if args.agent_id:
+        versions = cache.versions(args.agent_id)
+        if not args.json:
+            print(f"{len(versions)} cached versions of {args.agent_id}")
+            print("-" * 90)
+            for number, v in enumerate(versions, 1):
+                print(f"{number:>3}  {v['hash'][:12]}  graph {(v.get('graph_id') or '-')[:8]}  "
+                      f"updated {v.get('updated_at') or '-'}  {v.get('node_count', 0):>3} nodes  "
+                      f"seen {v.get('last_seen')}")
+            refs = index.get(args.agent_id, {}).get("refs", {})
+            for ref, info in refs.items():
+                print(f"     ref {ref} -> {info['hash'][:12]}")
+        return versions
+
+    agents = [{"agent_id": agent_id,
+               "name": entry["versions"][-1].get("name") if entry["versions"] else None,
+               "versions": len(entry["versions"]),
+               "latest": entry["versions"][-1]["hash"] if entry["versions"] else None}
+              for agent_id, entry in index.items()]
+    if not args.json:
+        objects = list(cache.objects_dir.glob("*/*.json.gz"))
+        size = sum(p.stat().st_size for p in objects)
+        print(f"Cache: {cache.cache_dir} ({len(objects)} objects, {size / 1024:.0f} KB)")
+        print("-" * 90)
+        for agent in agents:
+            print(f"{agent['agent_id']}  {agent['versions']:>3} versions  {agent['name'] or ''}")
+        if not agents:
+            print("No graphs cached yet")
+    return agents
+
+
+def cmd_import(cache: GraphCache, args):
+    imported = []
+    for file_path in args.files:
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[ERROR] {file_path}: {e}", file=sys.stderr)
+            continue
+        if "raw_graph" in data:  # fetch_and_analyze.py --save output
+            data = data["raw_graph"]
+        known = {v["hash"] for entry in cache.agents().values() for v in entry["versions"]}
+        record = cache.put(data, source=str(file_path))
+        duplicate = record["hash"] in known
+        imported.append({"file": str(file_path), "hash": record["hash"], "duplicate": duplicate})
+        if not args.json:
+            state = "already cached" if duplicate else "added"
+            print(f"[OK] {file_path} -> {record['hash'][:12]} ({state})")
+    return imported
+
+
+def cmd_show(cache: GraphCache, args):
+    record = cache.resolve(args.agent_id, args.ref)
+    data = cache.load(record["hash"])
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        print(f"[OK] {record['hash'][:12]} written to {args.output}", file=sys.stderr)
+        return None
+    return data
+
+
+def print_diff(changes: dict, old: dict, new: dict):
+    print(f"Graph diff {old['hash'][:12]} ({old.get('updated_at') or '-'}) -> "
+          f"{new['hash'][:12]} ({new.get('updated_at') or '-'})")
+    print("=" * 70)
+    if diff_is_empty(changes):
+        print("No changes (timestamps ignored)")
+        return
+
+    if changes["graph"]:
+        print("\nGraph:")
+        _print_fields(changes["graph"], indent="  ")
+
+    nodes = changes["nodes"]
+    print(f"\nNodes: +{len(nodes['added'])} -{len(nodes['removed'])} ~{len(nodes['changed'])}")
+    for node in nodes["added"]:
+        print(f"  + {node['label']} [{node['id'][:8]}]")
+    for node in nodes["removed"]:
+        print(f"  - {node['label']} [{node['id'][:8]}]")
+    for node in nodes["changed"]:
+        print(f"  ~ {node['label']} [{node['id'][:8]}]")
+        _print_fields(node["fields"])
+
+    edges = changes["edges"]
+    print(f"\nEdges: +{len(edges['added'])} -{len(edges['removed'])} ~{len(edges['changed'])}")
+    for sign, group in (("+", "added"), ("-", "removed"), ("~", "changed")):
+        for edge in edges[group]:
+            condition = f"  if {_short(edge['condition'], 50)}" if edge["condition"] else ""
+            print(f"  {sign} {edge['source_label'][:30]} -> {edge['target_label'][:30]}{condition}")
+            if group == "changed":
+                _print_fields(edge["fields"])
+
+    print(f"\nTool configs changed: {len(changes['tools'])}")
+    for tool in changes["tools"]:
+        swap = f" ({tool['old_tool']} -> {tool['new_tool']})" if tool["old_tool"] != tool["new_tool"] else \
+            f" ({tool['new_tool']})"
+        print(f"  ~ {tool['label']}{swap}")
+        _print_fields(tool["fields"])
+
+
+def cmd_diff(cache: GraphCache, args):
+    old = cache.resolve(args.agent_id, args.old)
+    new = cache.resolve(args.agent_id, args.new)
+    changes = diff_graphs(cache.load(old["hash"]), cache.load(new["hash"]))
+    if args.json:
+        return {"from": old, "to": new, "changes": changes}
+    print_diff(changes, old, new)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Versioned local cache of Beam.ai agent graphs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Version refs (--from/--to/--ref):
+    latest, previous, a version number from 'list <agent_id>', a graph ID, or a hash prefix
+
+Examples:
+    python graph_cache.py list
+    python graph_cache.py graph-diff abc123
+    python graph_cache.py graph-diff abc123 --from 1 --to 3 --json
+    python graph_cache.py import 04-workspace/beam-graphs/*.json
+"""
+    )
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help="Cache directory (default: 04-workspace/.beam-graph-cache)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = subparsers.add_parser("list", help="Cached agents, or versions of one agent")
+    list_cmd.add_argument("agent_id", nargs="?", help="Agent ID")
+
+    import_cmd = subparsers.add_parser("import", help="Add graph JSON files to the cache")
+    import_cmd.add_argument("files", nargs="+", help="Graph JSON files")
+
+    show = subparsers.add_parser("show", help="Print or write a cached version")
+    show.add_argument("agent_id", help="Agent ID")
+    show.add_argument("--ref", default="latest", help="Version ref (default: latest)")
+    show.add_argument("--output", "-o", help="Write to file instead of stdout")
+
+    diff = subparsers.add_parser("graph-diff", aliases=["diff"],
+                                 help="Node/edge/tool-config changes between two cached versions")
+    diff.add_argument("agent_id", help="Agent ID")
+    diff.add_argument("--from", dest="old", default="previous", help="Old version ref (default: previous)")
+    diff.add_argument("--to", dest="new", default="latest", help="New version ref (default: latest)")
+
+    for sub in (list_cmd, import_cmd, diff):
+        sub.add_argument("--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+    commands = {
+        "list": cmd_list,
+        "import": cmd_import,
+        "show": cmd_show,
+        "graph-diff": cmd_diff,
+        "diff": cmd_diff,
+    }
+
+    try:
+        cache = GraphCache(args.cache_dir)
+        result = commands[args.command](cache, args)
+        if result is not None and (getattr(args, "json", False) or args.command == "show"):
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+    except KeyError as e:
+        print(f"[ERROR] {e.args[0] if e.args else e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
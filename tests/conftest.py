@@ -0,0 +1,23 @@
+"""
+Shared pytest setup for the Beam scripts.
+
+Puts 03-skills (for ``_shared``) and the beam-master scripts directory (for
+``beam_client`` and its scripts) on sys.path; tests for a 03-skills script
+add that skill's ``scripts`` directory themselves via ``add_script_dir``.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = ROOT / "03-skills"
+BEAM_MASTER_SCRIPTS = ROOT / "00-system" / "skills" / "beam" / "beam-master" / "scripts"
+
+
+def add_script_dir(path: Path):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+add_script_dir(SKILLS_DIR)
+add_script_dir(BEAM_MASTER_SCRIPTS)
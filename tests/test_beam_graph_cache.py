@@ -0,0 +1,62 @@
+"""Version history of the agent graph cache (03-skills/_shared/beam_graph_cache.py)."""
+
+import json
+import threading
+
+import pytest
+
+from _shared.beam_graph_cache import GraphCache, diff_graphs, diff_is_empty
+
+
+def graph(objective):
+    return {"graph": {"id": "g1", "agentId": "agent-1",
+                      "nodes": [{"id": "n1", "objective": objective, "updatedAt": "2026-01-01T00:00:00Z"}]}}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return GraphCache(tmp_path / "graphs", ttl=0)
+
+
+def test_revert_becomes_latest_again(cache):
+    a, b = graph("A"), graph("B")
+    for data in (a, b, a):
+        cache.fetch("agent-1", lambda data=data: data)
+
+    latest = cache.resolve("agent-1", "latest")
+    previous = cache.resolve("agent-1", "previous")
+    assert cache.load(latest["hash"]) == a
+    assert cache.load(previous["hash"]) == b
+    assert latest["hash"] == cache.agents()["agent-1"]["refs"]["latest"]["hash"]
+    assert [v["hash"] for v in cache.versions("agent-1")] == [latest["hash"], previous["hash"], latest["hash"]]
+    assert not diff_is_empty(diff_graphs(cache.load(previous["hash"]), cache.load(latest["hash"])))
+
+
+def test_unchanged_refetch_does_not_add_versions(cache):
+    for _ in range(3):
+        cache.fetch("agent-1", lambda: graph("A"))
+    assert len(cache.versions("agent-1")) == 1
+    with pytest.raises(KeyError):
+        cache.resolve("agent-1", "previous")
+
+
+def test_explicit_graph_id_fetch_does_not_move_latest(cache):
+    a, b = graph("A"), graph("B")
+    cache.fetch("agent-1", lambda: a)
+    cache.fetch("agent-1", lambda: b)
+    cache.fetch("agent-1", lambda: a, graph_id="g1")
+
+    assert len(cache.versions("agent-1")) == 2
+    assert cache.load(cache.resolve("agent-1", "latest")["hash"]) == b
+
+
+def test_concurrent_puts_keep_every_version(cache):
+    threads = [threading.Thread(target=cache.put, args=(graph(f"v{i}"),), kwargs={"agent_id": f"agent-{i}"})
+               for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    index = json.loads(cache.index_path.read_text())
+    assert sorted(index) == sorted(f"agent-{i}" for i in range(16))
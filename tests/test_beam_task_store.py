@@ -0,0 +1,115 @@
+"""Sync windows of the SQLite task mirror (03-skills/_shared/beam_task_store.py)."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from _shared import beam_task_store
+from _shared.beam_task_store import TaskStore, format_timestamp, parse_timestamp
+
+
+class FakeClient:
+    """Serves /agent-tasks pages filtered by startDate/endDate, like the API."""
+
+    workspace = "bid"
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.windows = []
+
+    def get(self, endpoint, params=None):
+        start, end = parse_timestamp(params["startDate"]), parse_timestamp(params["endDate"])
+        if params["page"] == 1:
+            self.windows.append((start, end))
+        matching = [t for t in self.tasks if start <= parse_timestamp(t["createdAt"]) <= end]
+        offset = (params["page"] - 1) * params["limit"]
+        return {"data": matching[offset:offset + params["limit"]], "totalCount": len(matching)}
+
+
+def daily_tasks(days):
+    now = datetime.now(timezone.utc)
+    return [
+        {"id": f"task-{i}", "status": "COMPLETED", "createdAt": format_timestamp(now - timedelta(days=i, hours=1))}
+        for i in range(days)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with TaskStore(tmp_path / "store.db") as task_store:
+        yield task_store
+
+
+def test_larger_days_backfills_older_range(store):
+    client = FakeClient(daily_tasks(40))
+
+    store.sync(client, "agent", days=7)
+    assert store.count("agent", days=30) == 7
+    synced_from = store.get_sync_state("bid", "agent")["synced_from"]
+
+    result = store.sync(client, "agent", days=30)
+
+    assert result["backfill"][1] == synced_from
+    assert store.count("agent", days=30) == 30
+    assert len(store.query("agent", days=30)) == 30
+    state = store.get_sync_state("bid", "agent")
+    assert parse_timestamp(state["synced_from"]) < parse_timestamp(synced_from) - timedelta(days=22)
+
+
+def test_repeat_sync_only_fetches_since_last_sync(store):
+    client = FakeClient(daily_tasks(10))
+    store.sync(client, "agent", days=7)
+
+    result = store.sync(client, "agent", days=7)
+
+    assert result["backfill"] is None
+    start, end = client.windows[-1]
+    assert end - start < timedelta(hours=2)
+
+
+def test_truncated_window_does_not_advance_sync_point(store, monkeypatch):
+    monkeypatch.setattr(beam_task_store, "SYNC_PAGE_SIZE", 2)
+    client = FakeClient(daily_tasks(7))
+
+    result = store.sync(client, "agent", days=7, max_pages=1)
+
+    assert result["complete"] is False
+    assert store.get_sync_state("bid", "agent") is None
+
+    result = store.sync(client, "agent", days=7, max_pages=10)
+
+    assert result["complete"] is True
+    assert store.count("agent") == 7
+    assert store.get_sync_state("bid", "agent") is not None
+
+
+def test_store_without_synced_from_refetches_whole_window(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE sync_state (workspace TEXT NOT NULL, agent_id TEXT NOT NULL, "
+                 "synced_until TEXT NOT NULL, last_sync_at REAL NOT NULL, PRIMARY KEY (workspace, agent_id))")
+    conn.execute("INSERT INTO sync_state VALUES (?, ?, ?, ?)",
+                 ("bid", "agent", format_timestamp(datetime.now(timezone.utc)), 0))
+    conn.commit()
+    conn.close()
+
+    with TaskStore(db_path) as store:
+        (start, end), backfill = store.sync_window("bid", "agent", days=7)
+
+    assert backfill is None
+    assert end - start == timedelta(days=7)
+
+
+def test_failed_task_retried_in_place_is_refreshed(store):
+    tasks = daily_tasks(5)
+    tasks[1]["status"] = "FAILED"
+    client = FakeClient(tasks)
+    store.sync(client, "agent", days=7)
+    assert [t["id"] for t in store.query("agent", statuses=["FAILED"], days=7)] == ["task-1"]
+
+    tasks[1]["status"] = "COMPLETED"  # beam-retry-tasks re-ran it; createdAt is unchanged
+    store.sync(client, "agent", days=7)
+
+    assert store.query("agent", statuses=["FAILED"], days=7) == []
+    assert store.count("agent", statuses=["COMPLETED"], days=7) == 5
@@ -0,0 +1,54 @@
+"""Checkpointed --all export of beam-master iterate_tasks.py."""
+
+import json
+import sys
+
+import pytest
+
+import iterate_tasks
+from iterate_tasks import load_checkpoint
+
+
+class CursorClient:
+    """Serves /agent-tasks/iterate pages by cursor; raises on page ``fail_page``."""
+
+    def __init__(self, count, page_size=10, fail_page=None):
+        self.tasks = [{"id": f"task-{i}"} for i in range(count)]
+        self.page_size = page_size
+        self.fail_page = fail_page
+        self.pages = []
+
+    def get(self, endpoint, params=None):
+        page = int(params.get("cursor", "p0")[1:])
+        self.pages.append(page)
+        if page == self.fail_page:
+            raise RuntimeError("503 Service Unavailable")
+        tasks = self.tasks[page * self.page_size:(page + 1) * self.page_size]
+        more = (page + 1) * self.page_size < len(self.tasks)
+        return {"tasks": tasks, "nextCursor": f"p{page + 1}" if more else None}
+
+
+def run(monkeypatch, client, tmp_path):
+    monkeypatch.setattr(iterate_tasks, "get_client", lambda: client)
+    monkeypatch.setattr(sys, "argv", ["iterate_tasks.py", "--all", "--output", str(tmp_path / "tasks.ndjson"),
+                                      "--checkpoint", str(tmp_path / "tasks.cursor")])
+    iterate_tasks.main()
+
+
+def test_resume_drops_rows_written_after_the_checkpoint(tmp_path, monkeypatch):
+    with pytest.raises(SystemExit):
+        run(monkeypatch, CursorClient(45, fail_page=3), tmp_path)
+    start = load_checkpoint(tmp_path / "tasks.cursor")
+    assert start["cursor"] == "p3" and start["exported"] == 30
+
+    # A kill between writing rows and saving the next checkpoint leaves them in the file
+    with open(tmp_path / "tasks.ndjson", "a", encoding="utf-8") as f:
+        f.write('{"id":"task-30"}\n{"id":"task-31"}\n')
+
+    client = CursorClient(45)
+    run(monkeypatch, client, tmp_path)
+
+    lines = (tmp_path / "tasks.ndjson").read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [f"task-{i}" for i in range(45)]
+    assert client.pages == [3, 4]
+    assert load_checkpoint(tmp_path / "tasks.cursor")["done"]
@@ -0,0 +1,57 @@
+"""Idempotent bulk ratings of beam-master rate_task_output.py."""
+
+import pytest
+
+from rate_task_output import RatingJournal, plan_rows, submit_ratings
+
+
+class FakeClient:
+    workspace_id = "ws-1"
+
+    def __init__(self):
+        self.patched = []
+
+    def patch(self, endpoint, data=None):
+        self.patched.append((endpoint, data["rating"]))
+        return {}
+
+
+def row(rating, feedback=None):
+    return {"task_id": "task-1", "node_id": "node-1", "rating": rating,
+            "feedback": feedback, "expected_output": None}
+
+
+def run(journal_path, rows):
+    client = FakeClient()
+    journal = RatingJournal(journal_path)
+    results = plan_rows(rows, client.workspace_id, journal.applied())
+    submit_ratings(client, rows, results, journal, workers=1, rate=0, quiet=True)
+    journal.close()
+    return [result["status"] for result in results], client.patched
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / "ratings.jsonl"
+
+
+def test_same_rating_is_skipped(journal_path):
+    assert run(journal_path, [row("positive")])[0] == ["applied"]
+    assert run(journal_path, [row("positive")]) == (["skipped"], [])
+
+
+def test_rating_changed_back_is_sent_again(journal_path):
+    run(journal_path, [row("positive")])
+    run(journal_path, [row("negative")])
+    statuses, patched = run(journal_path, [row("positive")])
+    assert statuses == ["applied"]
+    assert patched == [("/agent-tasks/execution/task-1/output-rating", "positive")]
+
+
+def test_journal_keeps_last_applied_rating_per_node(journal_path):
+    run(journal_path, [row("positive"), row("negative", feedback="wrong total")])
+    applied = RatingJournal(journal_path).applied()
+    assert list(applied) == [("ws-1", "task-1", "node-1")]
+    assert plan_rows([row("negative", feedback="wrong total")], "ws-1", applied)[0]["status"] == "skipped"
+    assert plan_rows([row("negative")], "ws-1", applied)[0]["status"] == "pending"
+    assert plan_rows([row("negative", feedback="wrong total")], "ws-2", applied)[0]["status"] == "pending"
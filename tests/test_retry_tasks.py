@@ -0,0 +1,145 @@
+"""Retry journal and resume of beam-retry-tasks (scripts/retry_tasks.py)."""
+
+import json
+import os
+import signal
+import sys
+import threading
+
+import pytest
+
+from conftest import SKILLS_DIR, add_script_dir
+
+add_script_dir(SKILLS_DIR / "beam-retry-tasks" / "scripts")
+
+import retry_tasks  # noqa: E402
+from retry_tasks import PaginationError, RetryJournal, paginate, run_retries  # noqa: E402
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.text = ""
+
+
+class FakeClient:
+    """Accepts every retry; optionally sends SIGINT (Ctrl+C) on the Nth request."""
+
+    base_url = "http://mock"
+
+    def __init__(self, workspace="bid", interrupt_at=None):
+        self.workspace = workspace
+        self.interrupt_at = interrupt_at
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def request(self, method, endpoint, json=None, **kwargs):
+        with self._lock:
+            self.sent.append(json["taskId"])
+            count = len(self.sent)
+        if count == self.interrupt_at:
+            os.kill(os.getpid(), signal.SIGINT)
+        return Response(201)
+
+
+def journal_entries(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def tasks(count):
+    return [{"task_id": f"task-{i}", "custom_id": f"C-{i}"} for i in range(count)]
+
+
+def test_interrupt_stops_queued_retries_and_journals_sent_ones(tmp_path):
+    client = FakeClient(interrupt_at=3)
+    journal = RetryJournal(tmp_path / "retry.jsonl")
+    with pytest.raises(KeyboardInterrupt):
+        run_retries(client, tasks(200), journal, workers=2, rate=0)
+    journal.close()
+
+    journaled = [entry["task_id"] for entry in journal_entries(tmp_path / "retry.jsonl")]
+    assert sorted(journaled) == sorted(client.sent)
+    assert len(client.sent) < 20
+
+
+def test_resume_uses_journal_workspace_and_skips_successes(tmp_path, monkeypatch):
+    path = tmp_path / "retry.jsonl"
+    journal = RetryJournal(path)
+    journal.write({"event": "start", "workspace": "prod", "tasks": tasks(3)})
+    journal.write({"task_id": "task-0", "status": "success", "attempt": 1})
+    journal.write({"task_id": "task-1", "status": "failed", "attempt": 1})
+    journal.close()
+
+    clients = []
+
+    def make_client(workspace):
+        clients.append(FakeClient(workspace))
+        return clients[-1]
+
+    monkeypatch.setattr(retry_tasks, "BeamClient", make_client)
+    monkeypatch.setattr(sys, "argv", ["retry_tasks.py", "--resume", str(path), "--delay", "0"])
+    retry_tasks.main()
+
+    assert clients[0].workspace == "prod"
+    assert sorted(clients[0].sent) == ["task-1", "task-2"]
+    _, attempts, succeeded, workspace = RetryJournal.load(path)
+    assert workspace == "prod"
+    assert succeeded == {"task-0", "task-1", "task-2"}
+    assert attempts["task-1"] == 2
+
+
+def test_resume_rejects_other_workspace(tmp_path, monkeypatch):
+    path = tmp_path / "retry.jsonl"
+    journal = RetryJournal(path)
+    journal.write({"event": "start", "workspace": "prod", "tasks": tasks(1)})
+    journal.close()
+
+    monkeypatch.setattr(retry_tasks, "BeamClient", FakeClient)
+    monkeypatch.setattr(sys, "argv", ["retry_tasks.py", "--resume", str(path), "--workspace", "bid"])
+    with pytest.raises(SystemExit):
+        retry_tasks.main()
+
+
+class PagedClient:
+    """Serves /agent-tasks pages with totalCount; fails on page ``fail_page``."""
+
+    def __init__(self, statuses, fail_page=None):
+        self.tasks = [{"id": f"task-{i}", "status": status} for i, status in enumerate(statuses)]
+        self.fail_page = fail_page
+        self.pages = []
+
+    def get(self, endpoint, params=None):
+        self.pages.append(params["page"])
+        if params["page"] == self.fail_page:
+            raise RuntimeError("502 Bad Gateway")
+        offset = (params["page"] - 1) * params["limit"]
+        return {"data": self.tasks[offset:offset + params["limit"]], "totalCount": len(self.tasks)}
+
+
+def test_get_issue_tasks_stops_once_limit_is_reached():
+    client = PagedClient(["FAILED"] * 5000)
+    tasks = retry_tasks.get_issue_tasks(client, "agent", ["FAILED"], limit=10, max_workers=4)
+    assert len(tasks) == 10
+    assert client.pages == [1]
+
+
+def test_get_issue_tasks_keeps_pages_before_an_error():
+    client = PagedClient(["COMPLETED", "FAILED"] * 100, fail_page=3)
+    tasks = retry_tasks.get_issue_tasks(client, "agent", ["FAILED"], limit=100, max_workers=1)
+    assert len(tasks) == 50
+    assert {t["status"] for t in tasks} == {"FAILED"}
+
+
+def test_paginate_keeps_pages_before_an_error_in_a_concurrent_batch():
+    client = PagedClient(["FAILED"] * 100, fail_page=4)
+    with pytest.raises(PaginationError) as e:
+        paginate(client, "/agent-tasks", page_size=10, max_workers=4, rate_limit=0)
+    assert [t["id"] for t in e.value.items] == [f"task-{i}" for i in range(30)]
+
+
+def test_get_issue_tasks_warns_when_page_cap_truncates(capsys, monkeypatch):
+    monkeypatch.setattr(retry_tasks, "ISSUE_MAX_PAGES", 3)
+    client = PagedClient(["COMPLETED"] * (retry_tasks.ISSUE_MAX_PAGES * retry_tasks.ISSUE_PAGE_SIZE + 10))
+    assert retry_tasks.get_issue_tasks(client, "agent", ["FAILED"], limit=10) == []
+    assert "stopped after" in capsys.readouterr().out
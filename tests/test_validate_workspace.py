@@ -0,0 +1,53 @@
+"""Minimal workspace-map.md tree patches of update-workspace-map validate-workspace.py."""
+
+import importlib.util
+
+from conftest import ROOT
+
+SCRIPT = ROOT / "00-system" / "skills" / "system" / "update-workspace-map" / "scripts" / "validate-workspace.py"
+spec = importlib.util.spec_from_file_location("validate_workspace", SCRIPT)
+validate_workspace = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validate_workspace)
+
+TREE = """04-workspace/
+├── a/
+│   └── b/
+├── c/
+│   ├── x/
+│   └── c/
+└── stale/
+    └── y/
+"""
+
+
+def test_remove_last_entry_moves_corner_and_guides():
+    assert validate_workspace._remove_tree_entries(TREE, {"stale/"}) == """04-workspace/
+├── a/
+│   └── b/
+└── c/
+    ├── x/
+    └── c/
+"""
+
+
+def test_add_after_nested_last_entry_restores_guides():
+    assert validate_workspace._add_tree_entries(TREE, ["d/"]) == """04-workspace/
+├── a/
+│   └── b/
+├── c/
+│   ├── x/
+│   └── c/
+├── stale/
+│   └── y/
+└── d/
+"""
+
+
+def test_remove_then_add_keeps_tree_well_formed():
+    block = validate_workspace._remove_tree_entries(TREE, {"c/", "stale/"})
+    assert validate_workspace._add_tree_entries(block, ["d/", "e/"]) == """04-workspace/
+├── a/
+│   └── b/
+├── d/
+└── e/
+"""